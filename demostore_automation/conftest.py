@@ -1,11 +1,9 @@
 
 import pytest
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChOptions
-from selenium.webdriver.firefox.options import Options as FFOptions
-from selenium.webdriver.firefox.service import Service as FFService
+import glob
 import tempfile
+import time
 import logging as logger
 from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
 from demostore_automation.src.api_helpers.ProductsAPIHelper import ProductsAPIHelper
@@ -14,87 +12,34 @@ from demostore_automation.src.generic_helpers.generic_orders_helper import Gener
 from demostore_automation.src.pages.MyAccountSignedOutPage import MyAccountSignedOutPage
 from demostore_automation.src.pages.MyAccountSignedInPage import MyAccountSignedInPage
 from demostore_automation.src.utilities.genericUtilities import generate_random_email_and_password
+from demostore_automation.src.utilities.apiMetricsUtility import api_metrics
+from demostore_automation.src.utilities.dbMetricsUtility import db_metrics
+from demostore_automation.src.utilities.pagePerfUtility import page_perf_store
+from demostore_automation.src.utilities.webdriverUtility import create_driver
+from demostore_automation.src.utilities.impactUtility import ImpactMap, PACKAGE_DIR, impact_recorder, recorded_impact
+from demostore_automation.src.utilities.preflightUtility import (run_preflight, required_probes,
+                                                                 format_preflight_failure)
+from demostore_automation.src.utilities.responseCacheUtility import response_cache, validator_store
+from demostore_automation.src.utilities.retryUtility import resilience_events
+from demostore_automation.src.utilities.seedUtility import configure_seed, get_global_seed, seed_for_test
+from demostore_automation.src.utilities.soakUtility import ResourceSampler, load_soak_thresholds, webdriver_sessions
+from demostore_automation.src.utilities.perfBudgetUtility import (PerfBudgetWarning, load_perf_budgets, load_baseline,
+                                                                  write_baseline, build_baseline, evaluate_page_records)
+import warnings
+from demostore_automation.src.configs.MainConfigs import MainConfigs
 
 
 @pytest.fixture(scope="class")
 def init_driver(request):
 
-    supported_browsers = ['chrome',
-                          'ch',
-                          'headlesschrome',
-                          'remote_chrome',
-                          'firefox',
-                          'ff',
-                          'headlessfirefox',
-                          'remote_firefox']
-
-    browser = os.environ.get('BROWSER', None)
-    if not browser:
-        raise Exception("The environment variable 'BROWSER' must be set.")
-
-    browser = browser.lower()
-
-    if browser not in supported_browsers:
-        raise Exception(f"Provided browser '{browser}' is not one of the supported."
-                        f"Supported are: {supported_browsers}")
-
-    if browser in ('chrome', 'ch'):
-        driver = webdriver.Chrome()
-    elif browser in ('firefox', 'ff'):
-        driver = webdriver.Firefox()
-    elif browser in ('headlesschrome'):
-        logger.info("Opening Chrome headless")
-        chrome_options = ChOptions()
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        driver = webdriver.Chrome(options=chrome_options)
-
-    elif browser == 'remote_chrome':
-        logger.info("Starting remote Chrome")
-        chrome_remote_url = os.environ.get("REMOTE_WEBDRIVER")
-        if not chrome_remote_url:
-            raise Exception(f"If 'browser=remote_chrome' then 'REMOTE_WEBDRIVER' variable must be set.")
-
-        chrome_options = ChOptions()
-        chrome_options.add_argument('--ignore-ssl-errors=yes')
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        driver = webdriver.Remote(command_executor=chrome_remote_url, options=chrome_options)
-
-    elif browser == 'remote_firefox':
-        remote_url = os.environ.get("REMOTE_WEBDRIVER")
-        if not remote_url:
-            raise Exception("REMOTE_WEBDRIVER must be set for remote_firefox")
-
-        ff_options = FFOptions()
-        ff_options.accept_insecure_certs = True
-        driver = webdriver.Remote(
-        command_executor=remote_url,
-        options=ff_options
-        )
-    elif browser == 'headlessfirefox':
-        ff_options = FFOptions()
-        ff_options.add_argument("--disable-gpu")
-        ff_options.add_argument("--no-sandbox")
-        ff_options.add_argument("--headless")
-        service = FFService(executable_path="/usr/local/bin/geckodriver")
-        driver = webdriver.Firefox(service=service, options=ff_options)
-
-    logger.debug("############### BROWSER INFORMATION #####################")
-    for k, v in driver.capabilities.items():
-        logger.debug(f"{k}: {v}")
-    logger.debug("#########################################################")
-
+    driver = create_driver()
     request.cls.driver = driver
+    webdriver_sessions.increment()
 
     yield
 
     driver.quit()
+    webdriver_sessions.decrement()
 
 
 @pytest.fixture(scope="module")
@@ -117,7 +62,7 @@ def my_orders_smoke_setup():
     random_product = products_dao.get_random_product_from_db(qty=1)[0]
     product_id = random_product['ID']
     logger.info(f"Fetched random product from DB: {random_product}")
-    product_details = product_api_helper.call_get_product_by_id(product_id)
+    product_details = product_api_helper.call_get_product_by_id(product_id, fields=["id", "price"])
     product_price = product_details['price']
     info = {
             "product_id": random_product['ID'],
@@ -129,10 +74,36 @@ def my_orders_smoke_setup():
     yield info
 
     for ord_id in info["order_ids"]:
-        info["orders_api_helper"].call_delete_order(ord_id)
+        info["orders_api_helper"].call_delete_order(ord_id, parse_response=False)
         logger.info(f"Successfully deleted order id: {ord_id}")
     logger.info(f"Successfully deleted {len(info['order_ids'])} orders")
 
+@pytest.fixture(scope="session")
+def soak_sampler(request):
+    """Samples client resources and API latency for the whole soak run.
+
+    Writes the time-series report at the end of the session and fails the run when a
+    resource or latency slope exceeds its threshold.
+
+    Yields:
+        dict: {
+                "sampler" (ResourceSampler): Call `record_iteration` after each scenario iteration,
+                "deadline" (float): time.monotonic() value at which the soak loops should stop
+            }
+    """
+    config = request.config
+    sampler = ResourceSampler(interval=config.getoption("--soak-interval"))
+    sampler.start()
+    yield {"sampler": sampler, "deadline": time.monotonic() + config.getoption("--soak-duration") * 60}
+    sampler.stop()
+
+    slopes, violations = sampler.evaluate(load_soak_thresholds(config.getoption("--soak-thresholds")))
+    report_file = config.getoption("--soak-report") or MainConfigs.get_results_file_path('soak_report.json')
+    sampler.write_report(report_file, slopes, violations)
+    logger.info(f"Soak report written to: {report_file}. Slopes per hour: {slopes}")
+    assert not violations, "Soak run shows degradation:\n  " + "\n  ".join(violations)
+
+
 @pytest.fixture(scope='class')
 def create_registered_user(request):
     driver = request.cls.driver
@@ -150,4 +121,291 @@ def create_registered_user(request):
     my_acct_si = MyAccountSignedInPage(driver)
     my_acct_si.verify_user_is_signed_in()
 
-    return {'email': email, 'password': password}
\ No newline at end of file
+    return {'email': email, 'password': password}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--seed", action="store", type=int, default=None,
+                     help="Seed for all random test data. Defaults to the TEST_SEED environment variable, "
+                          "or a new seed printed in the report header.")
+    parser.addoption("--api-metrics-json", action="store", default=None,
+                     help="Path of the JSON file for the API latency summary. "
+                          "Defaults to 'api_metrics.json' in the results directory.")
+    parser.addoption("--db-metrics-json", action="store", default=None,
+                     help="Path of the JSON file for the DB query summary. "
+                          "Defaults to 'db_metrics.json' in the results directory.")
+    parser.addoption("--db-n-plus-one-threshold", action="store", type=int, default=5,
+                     help="Flag a query fingerprint executed at least this many times within one test.")
+    parser.addoption("--collect-page-perf", action="store_true", default=False,
+                     help="Collect navigation timing and Web Vitals on every page object navigation.")
+    parser.addoption("--page-perf-file", action="store", default=None,
+                     help="Path of the JSON Lines file for page performance records. "
+                          "Defaults to 'page_perf.jsonl' in the results directory.")
+    parser.addoption("--perf-budgets", action="store", default=None,
+                     help="Path of the performance budget file. Defaults to 'src/data/perf_budgets.json'.")
+    parser.addoption("--perf-baseline", action="store", default=None,
+                     help="Path of the performance baseline file. Defaults to 'src/data/perf_baseline.json'.")
+    parser.addoption("--perf-baseline-update", action="store_true", default=False,
+                     help="Store the median page metrics of this run as the new performance baseline.")
+    parser.addoption("--skip-preflight", action="store_true", default=False,
+                     help="Do not probe the store, REST API, database and grid before running the tests.")
+    parser.addoption("--preflight-timeout", action="store", type=float, default=5,
+                     help="Timeout in seconds for each preflight probe.")
+    parser.addoption("--impact-record", action="store_true", default=False,
+                     help="Record which framework files every test depends on into the impact map.")
+    parser.addoption("--impact-select", action="store_true", default=False,
+                     help="Only run tests whose dependencies changed since the impact map was recorded.")
+    parser.addoption("--impact-map", action="store", default=None,
+                     help="Path of the impact map. Defaults to '.impact_map.json' in the demostore_automation dir.")
+    parser.addoption("--soak-duration", action="store", type=float, default=0,
+                     help="Run the soak tests for this many minutes. Soak tests are skipped when 0 (default).")
+    parser.addoption("--soak-interval", action="store", type=float, default=30,
+                     help="Seconds between resource samples during a soak run.")
+    parser.addoption("--soak-thresholds", action="store", default=None,
+                     help="Path of the soak slope thresholds file. Defaults to 'src/data/soak_thresholds.json'.")
+    parser.addoption("--soak-report", action="store", default=None,
+                     help="Path of the soak time-series report. Defaults to 'soak_report.json' in the results directory.")
+    parser.addoption("--coupon-contention", action="store_true",
+                     default=os.environ.get("COUPON_CONTENTION", "").lower() in ("1", "true", "yes"),
+                     help="Run the coupon usage-limit race tests (or COUPON_CONTENTION=1). They create coupons and "
+                          "dozens of orders and fire concurrent bursts at the store, so they are skipped by default.")
+
+
+def pytest_configure(config):
+    seed = configure_seed(config.getoption("--seed"))
+    if not hasattr(config, "workerinput"):
+        # xdist workers inherit the environment, so they all use the controller's seed
+        os.environ['TEST_SEED'] = str(seed)
+    config.addinivalue_line("markers", "perf_budget(*pages, mode='fail'): check the page loads of the test "
+                                       "against the performance budget and baseline. mode='warn' only warns.")
+    config.addinivalue_line("markers", "soak: long running scenario repeated until --soak-duration minutes have passed.")
+    config.addinivalue_line("markers", "coupon_contention: concurrent coupon usage-limit race, "
+                                       "only runs with --coupon-contention.")
+    if config.getoption("--collect-page-perf"):
+        page_perf_store.collect_all = page_perf_store.enabled = True
+
+
+def preflight_or_exit(config, paths):
+    if config.getoption("--skip-preflight") or config.getoption("--collect-only"):
+        return
+    results = run_preflight(required_probes(paths), timeout=config.getoption("--preflight-timeout"))
+    if not all(r['ok'] for r in results):
+        pytest.exit(format_preflight_failure(results), returncode=pytest.ExitCode.INTERRUPTED)
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    if not hasattr(config, "workerinput") and config.getoption("dist", default="no") != "no":
+        # the xdist controller does not collect, so probe for the requested paths once for all workers
+        preflight_or_exit(config, config.args)
+
+
+def pytest_collection_finish(session):
+    config = session.config
+    if not hasattr(config, "workerinput") and config.getoption("dist", default="no") == "no":
+        preflight_or_exit(config, [item.path for item in session.items])
+
+
+def get_impact_map_path(config):
+    return config.getoption("--impact-map") or os.path.join(PACKAGE_DIR, '.impact_map.json')
+
+
+def pytest_collection_modifyitems(session, config, items):
+    if not config.getoption("--impact-select"):
+        return
+
+    impact_map = ImpactMap.load(get_impact_map_path(config))
+    if impact_map is None:
+        logger.warning("No impact map found, running all tests. Record one with --impact-record.")
+        return
+    unmapped = impact_map.changed_unmapped_files()
+    if unmapped:
+        logger.warning(f"Files no test is mapped to changed, running all tests: {unmapped}")
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        (selected if impact_map.is_impacted(item.nodeid) else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    logger.info(f"Impact selection: running {len(selected)} tests, deselected {len(deselected)} unaffected tests")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    recording = item.config.getoption("--impact-record")
+    if recording:
+        impact_recorder.start()
+    yield
+    if recording:
+        recorded_impact.record_test(item.nodeid, str(item.path), impact_recorder.stop())
+
+
+def pytest_report_header(config):
+    seed = get_global_seed()
+    return f"test data seed: {seed} (replay with --seed {seed})"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.user_properties.append(("seed", seed_for_test(item.nodeid)))
+    if item.get_closest_marker("perf_budget"):
+        page_perf_store.enabled = True
+    if item.get_closest_marker("soak") and not item.config.getoption("--soak-duration"):
+        pytest.skip("Soak tests only run with --soak-duration > 0")
+    if item.get_closest_marker("coupon_contention") and not item.config.getoption("--coupon-contention"):
+        pytest.skip("Coupon contention tests only run with --coupon-contention or COUPON_CONTENTION=1")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("perf_budget")
+    if not marker:
+        return
+
+    budgets = load_perf_budgets(item.config.getoption("--perf-budgets"))
+    baseline = load_baseline(item.config.getoption("--perf-baseline"))
+    records = page_perf_store.get_test_records(item.nodeid)
+    violations, regressions = evaluate_page_records(records, marker.args, budgets, baseline)
+    problems = violations + regressions
+    if not problems:
+        return
+
+    message = "Performance budget check failed:\n  " + "\n  ".join(problems)
+    if marker.kwargs.get('mode', 'fail') == 'warn':
+        warnings.warn(PerfBudgetWarning(message))
+    else:
+        raise AssertionError(message)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    api_metrics.current_test = nodeid
+    db_metrics.current_test = nodeid
+    page_perf_store.current_test = nodeid
+    resilience_events.current_test = nodeid
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    yield
+    calls, total_ms = api_metrics.get_test_totals(item.nodeid)
+    if calls:
+        item.user_properties.append(("api_calls", calls))
+        item.user_properties.append(("api_time_ms", total_ms))
+    for kind, count in sorted(resilience_events.get_test_counts(item.nodeid).items()):
+        item.user_properties.append((f"api_{kind}", count))
+
+    threshold = item.config.getoption("--db-n-plus-one-threshold")
+    for flagged in db_metrics.check_n_plus_one(item.nodeid, threshold):
+        logger.warning(f"Possible N+1 query pattern: executed {flagged['count']} times "
+                       f"in {item.nodeid}: {flagged['fingerprint']}")
+        item.user_properties.append(("db_n_plus_one", f"{flagged['count']}x {flagged['fingerprint']}"))
+
+    perf_file = item.config.getoption("--page-perf-file") or MainConfigs.get_results_file_path('page_perf.jsonl')
+    page_perf_store.flush_test(item.nodeid, perf_file)
+    page_perf_store.enabled = page_perf_store.collect_all
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed_suite_property(record_testsuite_property):
+    """Adds the global test data seed to the JUnit report."""
+    record_testsuite_property("test_seed", get_global_seed())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_metrics_suite_properties(record_testsuite_property):
+    """Adds the per-endpoint API latency summary and the response cache hit rate to the JUnit report as testsuite properties."""
+    yield
+    for endpoint in api_metrics.summary()['endpoints']:
+        name = f"api {endpoint['method']} {endpoint['endpoint']}"
+        record_testsuite_property(name, f"calls={endpoint['calls']} p50={endpoint['p50_ms']:.0f}ms "
+                                        f"p95={endpoint['p95_ms']:.0f}ms p99={endpoint['p99_ms']:.0f}ms")
+    cache_stats = response_cache.stats()
+    if cache_stats['hits'] + cache_stats['misses']:
+        record_testsuite_property("api_cache", f"hits={cache_stats['hits']} misses={cache_stats['misses']} "
+                                               f"hit_rate={cache_stats['hit_rate']}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if session.config.getoption("--impact-select") and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+        # nothing was affected by the change, which is not a failure
+        session.exitstatus = pytest.ExitCode.OK
+
+    summary = api_metrics.summary()
+    if summary['total_calls']:
+        json_file = session.config.getoption("--api-metrics-json") or MainConfigs.get_results_file_path('api_metrics.json')
+        api_metrics.write_json(json_file, summary)
+        logger.info(f"API latency summary written to: {json_file}")
+
+    db_summary = db_metrics.summary()
+    if db_summary['total_queries']:
+        json_file = session.config.getoption("--db-metrics-json") or MainConfigs.get_results_file_path('db_metrics.json')
+        db_metrics.write_json(json_file, db_summary)
+        logger.info(f"DB query summary written to: {json_file}")
+
+    if session.config.getoption("--impact-record"):
+        map_file = get_impact_map_path(session.config)
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            # the controller merges the partial maps of its workers
+            recorded_impact.save(f"{map_file}.{worker}")
+        else:
+            impact_map = ImpactMap.load(map_file) or ImpactMap()
+            for partial_file in glob.glob(f"{map_file}.gw*"):
+                impact_map.merge(ImpactMap.load(partial_file))
+                os.remove(partial_file)
+            impact_map.merge(recorded_impact)
+            impact_map.update_files()
+            impact_map.save(map_file)
+            logger.info(f"Impact map with {len(impact_map.tests)} tests written to: {map_file}")
+
+    if session.config.getoption("--perf-baseline-update") and page_perf_store.all_records():
+        write_baseline(build_baseline(page_perf_store.all_records()), session.config.getoption("--perf-baseline"))
+        logger.info("Updated the page performance baseline")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = api_metrics.summary()
+    if summary['total_calls']:
+        terminalreporter.write_sep("=", f"API latency summary ({summary['total_calls']} calls)")
+        for line in api_metrics.format_summary_lines(summary):
+            terminalreporter.write_line(line)
+
+    cache_stats, validator_stats = response_cache.stats(), validator_store.stats()
+    if cache_stats['hits'] + cache_stats['misses'] or validator_stats['requests']:
+        terminalreporter.write_sep("=", "API response cache")
+        if cache_stats['hits'] + cache_stats['misses']:
+            terminalreporter.write_line(f"hits: {cache_stats['hits']}, misses: {cache_stats['misses']}, "
+                                        f"hit rate: {cache_stats['hit_rate']:.0%}, "
+                                        f"invalidated: {cache_stats['invalidations']}")
+        if validator_stats['requests']:
+            terminalreporter.write_line(f"conditional GETs: {validator_stats['requests']}, "
+                                        f"not modified (304): {validator_stats['not_modified']}, "
+                                        f"unchanged body, parsing skipped: {validator_stats['unchanged']}")
+
+    resilience_summary = resilience_events.summary()
+    if resilience_summary:
+        terminalreporter.write_sep("=", "API retries and circuit breaker")
+        terminalreporter.write_line(", ".join(f"{kind}: {count}" for kind, count in sorted(resilience_summary.items())))
+        for event in resilience_events.events:
+            if event['kind'] == 'circuit_open':
+                terminalreporter.write_line(f"circuit opened in {event['test']}: {event['detail']}")
+
+    db_summary = db_metrics.summary()
+    if db_summary['total_queries']:
+        terminalreporter.write_sep("=", f"DB query summary ({db_summary['total_queries']} queries)")
+        for line in db_metrics.format_summary_lines(db_summary):
+            terminalreporter.write_line(line)
+
+    page_records = page_perf_store.all_records()
+    if page_records:
+        baseline = load_baseline(config.getoption("--perf-baseline"))
+        terminalreporter.write_sep("=", f"Page performance ({len(page_records)} page loads, medians)")
+        for page, metrics in sorted(build_baseline(page_records).items()):
+            trend = ""
+            if baseline.get(page, {}).get('ttfb_ms') and metrics.get('ttfb_ms') is not None:
+                trend = f" (baseline TTFB={baseline[page]['ttfb_ms']})"
+            terminalreporter.write_line(f"{page:<12} TTFB={metrics.get('ttfb_ms')}ms LCP={metrics.get('lcp_ms')}ms "
+                                        f"bytes={metrics.get('transfer_bytes')} "
+                                        f"requests={metrics.get('request_count')}{trend}")
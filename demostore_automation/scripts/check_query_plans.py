@@ -0,0 +1,54 @@
+"""Run EXPLAIN for every DAO query against the target database and flag full scans.
+
+Example:
+    source variables_local.env
+    python3 demostore_automation/scripts/check_query_plans.py --max-index-rows 10000
+
+Prints the access type, key and estimated rows of every table in every plan and
+exits with status 1 if any query scans a whole table (type 'ALL', unless estimated
+below --min-table-rows rows) or a whole index estimated above --max-index-rows rows.
+"""
+import argparse
+import json
+import os
+import sys
+import logging as logger
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.utilities.queryPlanUtility import (DEFAULT_MAX_INDEX_ROWS, DEFAULT_MIN_TABLE_ROWS,
+                                                                   check_query_plans, collect_dao_queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN the DAO queries and flag full scans.")
+    parser.add_argument("--max-index-rows", type=int, default=DEFAULT_MAX_INDEX_ROWS,
+                        help="Flag full index scans estimated above this many rows.")
+    parser.add_argument("--min-table-rows", type=int, default=DEFAULT_MIN_TABLE_ROWS,
+                        help="Ignore table scans estimated below this many rows.")
+    parser.add_argument("--only", default=None, help="Only check queries whose name contains this text, e.g. 'OrdersDAO'.")
+    parser.add_argument("--output", default=None,
+                        help="JSON report path. Defaults to 'query_plans.json' in the results directory.")
+    args = parser.parse_args()
+
+    logger.basicConfig(level=logger.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    queries = {name: sql for name, sql in collect_dao_queries().items() if not args.only or args.only in name}
+    results = check_query_plans(queries, max_index_rows=args.max_index_rows, min_table_rows=args.min_table_rows)
+
+    for result in results:
+        print(f"\n{'FULL SCAN' if result['full_scans'] else 'ok       '}  {result['name']}")
+        for row in result['plan']:
+            print(f"    {str(row.get('table')):<12} type={str(row.get('type')):<7} key={str(row.get('key')):<24} "
+                  f"rows={row.get('rows')}  {row.get('Extra') or ''}")
+
+    output = args.output or MainConfigs.get_results_file_path('query_plans.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2, default=str)
+
+    flagged = [result['name'] for result in results if result['full_scans']]
+    print(f"\n{len(results)} queries checked, {len(flagged)} with full scans. Report written to: {output}")
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == '__main__':
+    main()
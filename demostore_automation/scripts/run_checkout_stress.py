@@ -0,0 +1,64 @@
+"""Run the guest checkout flow in many concurrent browser sessions.
+
+Example:
+    source variables_local.env
+    python3 demostore_automation/scripts/run_checkout_stress.py --sessions 1,2,4,8 --iterations 3 --browser headlesschrome
+
+    # on a Selenium grid
+    REMOTE_WEBDRIVER=http://grid:4444/wd/hub python3 demostore_automation/scripts/run_checkout_stress.py \
+        --sessions 5,10,20 --browser remote_chrome
+
+Every level in --sessions is a separate run. The summary shows per-step latency,
+completed checkouts per minute and error rate per level, and the session count at
+which throughput stops growing (the throughput ceiling).
+"""
+import argparse
+import logging as logger
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.load_testing.checkout_stress import CheckoutStress
+from demostore_automation.src.load_testing.load_engine import LoadEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent browser checkout stress test.")
+    parser.add_argument("--sessions", default="4", type=lambda v: [int(s) for s in v.split(',')],
+                        help="Concurrent browser sessions, or a comma separated sweep, e.g. 1,2,4,8.")
+    parser.add_argument("--iterations", type=int, default=1, help="Checkouts per browser session.")
+    parser.add_argument("--browser", default="headlesschrome", help="Browser, e.g. headlesschrome or remote_chrome.")
+    parser.add_argument("--coupon", default=None, help="Coupon applied in the cart. Defaults to the 'FREE_COUPON' coupon.")
+    parser.add_argument("--output", default=None,
+                        help="JSON summary path. Defaults to 'checkout_stress.json' in the results directory.")
+    parser.add_argument("--no-cleanup", action="store_true", help="Keep the orders created during the run.")
+    args = parser.parse_args()
+
+    logger.basicConfig(level=logger.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    stress = CheckoutStress(args.sessions[0], iterations=args.iterations, browser=args.browser, coupon_code=args.coupon)
+    try:
+        result = stress.sweep(args.sessions)
+    finally:
+        if not args.no_cleanup:
+            stress.cleanup()
+
+    output = args.output or MainConfigs.get_results_file_path('checkout_stress.json')
+    LoadEngine.write_json(result, output)
+
+    for run in result['runs']:
+        print(f"\n{run['sessions']} sessions: completed={run['completed']} errors={run['errors']} "
+              f"error_rate={run['error_rate']} checkouts/min={run['checkouts_per_min']}")
+        for name, s in run['steps'].items():
+            print(f"  {name:<14} p50={s['p50_ms']:.0f}ms p95={s['p95_ms']:.0f}ms max={s['max_ms']:.0f}ms")
+        for sample in run['error_samples']:
+            print(f"  ERROR {sample}")
+
+    ceiling = result['ceiling']
+    if ceiling:
+        print(f"\nThroughput ceiling: {ceiling['checkouts_per_min']} checkouts/min at {ceiling['sessions']} sessions "
+              f"({ceiling['reason']})")
+    else:
+        print("\nNo session level completed checkouts within the error rate limit.")
+    print(f"Summary written to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Race concurrent coupon applications against a usage-limited coupon.
+
+Example:
+    source variables_local.env
+    python3 demostore_automation/scripts/run_coupon_contention.py --orders 50 --concurrency 25 --usage-limit 10
+
+Reports throughput of the applications, the status codes returned, any
+over-redemption and every broken usage-count invariant (API vs DB vs orders).
+"""
+import argparse
+import logging as logger
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.load_testing.coupon_contention import CouponContention
+from demostore_automation.src.load_testing.load_engine import LoadEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coupon usage-limit race harness.")
+    parser.add_argument("--orders", type=int, default=20, help="Orders the coupon is applied to.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Applications sent at the same time.")
+    parser.add_argument("--usage-limit", type=int, default=5, help="Usage limit of the coupon.")
+    parser.add_argument("--usage-limit-per-user", type=int, default=None, help="Per customer usage limit.")
+    parser.add_argument("--customers", type=int, default=5, help="Distinct customers the orders are spread over.")
+    parser.add_argument("--output", default=None,
+                        help="JSON summary path. Defaults to 'coupon_contention.json' in the results directory.")
+    parser.add_argument("--no-cleanup", action="store_true", help="Keep the orders and coupon created by the run.")
+    args = parser.parse_args()
+
+    logger.basicConfig(level=logger.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    contention = CouponContention(orders=args.orders, concurrency=args.concurrency, usage_limit=args.usage_limit,
+                                  usage_limit_per_user=args.usage_limit_per_user, customers=args.customers)
+    try:
+        result = contention.run()
+    finally:
+        if not args.no_cleanup:
+            contention.cleanup()
+
+    output = args.output or MainConfigs.get_results_file_path('coupon_contention.json')
+    LoadEngine.write_json(result, output)
+
+    burst, verification = result['burst'], result['verification']
+    print(f"\n{burst['applications']} applications in {burst['duration_s']}s ({burst['throughput_rps']}/s), "
+          f"p50={burst['p50_ms']:.0f}ms p95={burst['p95_ms']:.0f}ms")
+    print(f"accepted={burst['accepted']} rejected={burst['rejected']} not sent={burst['not_sent']} "
+          f"status codes={burst['status_codes']}")
+    print(f"usage limit={args.usage_limit} API usage_count={verification['api_usage_count']} "
+          f"DB usage_count={verification['db_usage_count']} over-redemption={verification['over_redemption']}")
+    for violation in verification['violations']:
+        print(f"  VIOLATION {violation}")
+    print(f"Summary written to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Run an open-loop API load test against the store.
+
+Example:
+    source variables_local.env
+    python3 demostore_automation/scripts/run_load_test.py --rate 5 --ramp-up 60 --hold 300 --ramp-down 60 \
+        --concurrency 30 --mix browse_products=70,create_order=20,apply_coupon=5,refund_order=5
+
+The live progress shows target vs achieved throughput, backlog and latency percentiles
+per scenario. Increase --rate between runs (or use a long ramp-up) to find the rate at
+which throughput stops following the target and errors or backlog start to grow.
+
+The API retries and the circuit breaker of WooAPIUtility are disabled, so every scheduled
+call is sent exactly once and a failure counts as an error of its scenario, instead of
+being hidden in a retried (and slower) call or turned into fail fast CircuitOpenErrors.
+Pass --allow-retries to keep the API_RETRY_*/API_CIRCUIT_* configs of the environment.
+"""
+import argparse
+import os
+import logging as logger
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.load_testing.load_engine import LoadEngine, LoadProfile
+from demostore_automation.src.load_testing.load_scenarios import StoreScenarios, DEFAULT_MIX
+from demostore_automation.src.utilities.apiMetricsUtility import api_metrics
+from demostore_automation.src.utilities.retryUtility import resilience_events
+from demostore_automation.src.utilities.seedUtility import configure_seed
+
+
+def parse_mix(value):
+    mix = {}
+    for pair in value.split(','):
+        name, weight = pair.split('=')
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def disable_api_resilience():
+    """Configure the WooAPIUtility instances created after this call without retries and circuit breaker."""
+    for name in [name for name in os.environ if name.startswith('API_RETRY_MAX_ATTEMPTS_')]:
+        del os.environ[name]
+    os.environ['API_RETRY_MAX_ATTEMPTS'] = '1'
+    os.environ['API_CIRCUIT_FAILURE_THRESHOLD'] = '0'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop API load test for the WooCommerce store.")
+    parser.add_argument("--rate", type=float, required=True, help="Target arrival rate (scenarios per second).")
+    parser.add_argument("--ramp-up", type=float, default=30, help="Ramp-up duration in seconds.")
+    parser.add_argument("--hold", type=float, default=60, help="Duration at the target rate in seconds.")
+    parser.add_argument("--ramp-down", type=float, default=30, help="Ramp-down duration in seconds.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Number of concurrent workers.")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help=f"Scenario weights, e.g. browse_products=60,create_order=20. Available: {list(DEFAULT_MIX)}")
+    parser.add_argument("--fixed-pacing", action="store_true", help="Use fixed instead of Poisson inter-arrival times.")
+    parser.add_argument("--report-interval", type=float, default=5, help="Seconds between live progress lines.")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for arrival times, scenario choice and test data. Defaults to TEST_SEED or a new seed.")
+    parser.add_argument("--output", default=None, help="JSON summary path. Defaults to 'load_test.json' in the results directory.")
+    parser.add_argument("--no-cleanup", action="store_true", help="Keep the orders created during the run.")
+    parser.add_argument("--allow-retries", action="store_true",
+                        help="Keep the API retries and circuit breaker configured in the environment.")
+    args = parser.parse_args()
+
+    logger.basicConfig(level=logger.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args.seed = configure_seed(args.seed)
+    logger.info(f"Test data seed: {args.seed}")
+    if not args.allow_retries:
+        disable_api_resilience()
+
+    store_scenarios = StoreScenarios()
+    profile = LoadProfile(args.rate, args.ramp_up, args.hold, args.ramp_down, poisson=not args.fixed_pacing)
+    engine = LoadEngine(store_scenarios.build(args.mix), profile, concurrency=args.concurrency,
+                        report_interval=args.report_interval, seed=args.seed)
+    try:
+        summary = engine.run()
+    finally:
+        if not args.no_cleanup:
+            store_scenarios.cleanup()
+
+    summary['seed'] = args.seed
+    summary['api_endpoints'] = api_metrics.summary()['endpoints']
+    summary['api_resilience'] = resilience_events.summary()
+    output = args.output or MainConfigs.get_results_file_path('load_test.json')
+    LoadEngine.write_json(summary, output)
+
+    print(f"\nCompleted {summary['completed']}/{summary['scheduled']} scenarios in {summary['duration_s']}s, "
+          f"throughput {summary['throughput_rps']}/s (peak {summary['peak_throughput_rps']}/s)")
+    for name, s in summary['scenarios'].items():
+        print(f"  {name:<16} calls={s['calls']:<6} errors={s['errors']:<5} error_rate={s['error_rate']:<7} "
+              f"p50={s['p50_ms']:.0f}ms p95={s['p95_ms']:.0f}ms p99={s['p99_ms']:.0f}ms")
+    if summary['api_resilience']:
+        print(f"  API retries and circuit breaker events: {summary['api_resilience']}")
+    print("\n" + "\n".join(api_metrics.format_summary_lines()))
+    print(f"\nSummary written to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -28,24 +28,29 @@ class CouponAPIHelper:
         """
         return self.woo_helper.post('coupons', params=payload, expected_status_code=expected_status_code)
 
-    def call_retrieve_coupon(self, coupon_id):
+    def call_retrieve_coupon(self, coupon_id, use_cache=False, conditional=False):
         """Retrieves coupon details by coupon ID.
 
         Args:
             coupon_id (int or str): The ID of the coupon to retrieve.
+            use_cache (bool, optional): Use the response cache, only for coupons no test modifies. Defaults to False.
+            conditional (bool, optional): Revalidate the previous response of this coupon instead of
+                parsing an unchanged one again. The returned dict must not be modified. Defaults to False.
 
         Returns:
             dict: The JSON response from the API representing the retrieved coupon.
         """
-        return self.woo_helper.get(f'coupons/{coupon_id}', expected_status_code=200)
+        return self.woo_helper.get(f'coupons/{coupon_id}', expected_status_code=200, cache=use_cache,
+                                   conditional=conditional)
 
-    def call_delete_coupon(self, coupon_id):
+    def call_delete_coupon(self, coupon_id, parse_response=True):
         """Deletes a coupon by coupon ID.
 
         Args:
             coupon_id (int or str): The ID of the coupon to delete.
+            parse_response (bool, optional): Decode the response, pass False in teardowns. Defaults to True.
 
         Returns:
-            dict: The JSON response from the API after deleting the coupon.
+            dict: The JSON response from the API after deleting the coupon, None if parse_response is False.
         """
-        return self.woo_helper.delete(f'coupons/{coupon_id}', expected_status_code=200)
+        return self.woo_helper.delete(f'coupons/{coupon_id}', expected_status_code=200, parse_response=parse_response)
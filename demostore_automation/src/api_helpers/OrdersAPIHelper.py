@@ -28,27 +28,48 @@ class OrdersAPIHelper:
         """
         return self.woo_api_utility.post("orders", params=payload, expected_status_code=201)
 
-    def call_retrieve_order(self, order_id):
+    def call_retrieve_order(self, order_id, conditional=False, fields=None):
         """Retrieves order details by order ID.
 
         Args:
             order_id (int or str): The ID of the order to retrieve.
+            conditional (bool, optional): Revalidate the previous response of this order instead of
+                parsing an unchanged one again. The returned dict must not be modified. Defaults to False.
+            fields (list[str], optional): Only retrieve these fields, e.g. ['id', 'status']. Defaults to all fields.
 
         Returns:
             dict: The JSON response from the API representing the retrieved order.
         """
-        return self.woo_api_utility.get(f'orders/{order_id}', expected_status_code=200)
+        return self.woo_api_utility.get(f'orders/{order_id}', expected_status_code=200, conditional=conditional,
+                                        fields=fields)
 
-    def call_delete_order(self, order_id):
+    def iter_all_orders(self, params=None, fields=None, per_page=100):
+        """Yields all orders one at a time, parsing every page while it is received.
+
+        Memory stays flat for large pages of orders with many line items.
+
+        Args:
+            params (dict, optional): Filters, e.g. {"status": "processing"}.
+            fields (list[str], optional): Only retrieve these fields of every order. Defaults to all fields.
+            per_page (int, optional): Orders per request, at most 100. Defaults to 100.
+
+        Yields:
+            dict: One order.
+        """
+        yield from self.woo_api_utility.iter_get("orders", params=params, fields=fields, per_page=per_page)
+
+    def call_delete_order(self, order_id, parse_response=True):
         """Deletes an order by order ID.
 
         Args:
             order_id (int or str): The ID of the order to delete.
+            parse_response (bool, optional): Decode the response, pass False in teardowns. Defaults to True.
 
         Returns:
-            dict: The JSON response from the API after deleting the order.
+            dict: The JSON response from the API after deleting the order, None if parse_response is False.
         """
-        return self.woo_api_utility.delete(f'orders/{order_id}', expected_status_code=200)
+        return self.woo_api_utility.delete(f'orders/{order_id}', expected_status_code=200,
+                                           parse_response=parse_response)
 
     def call_update_order(self, order_id, payload, expected_status_code=200):
         """Updates existing order using the WooCommerce API.
@@ -14,6 +14,67 @@ class MainConfigs:
         else:
             return base_url
 
+    @staticmethod
+    def get_results_dir():
+        results_dir = os.environ.get('RESULTS_DIR')
+        if not results_dir:
+            results_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))), 'reports')
+        return results_dir
+
+    @staticmethod
+    def get_results_file_path(file_name):
+        # suffix with the xdist worker id so parallel workers don't overwrite each other's files
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            base, ext = os.path.splitext(file_name)
+            file_name = f"{base}_{worker}{ext}"
+        return os.path.join(MainConfigs.get_results_dir(), file_name)
+
+    @staticmethod
+    def get_api_retry_configs():
+        # API_RETRY_MAX_ATTEMPTS_<METHOD> overrides the attempts for a single method, e.g. API_RETRY_MAX_ATTEMPTS_POST=2
+        # (POST is only retried if it is also listed in API_RETRY_METHODS)
+        methods = os.environ.get('API_RETRY_METHODS', 'GET,PUT,DELETE')
+        statuses = os.environ.get('API_RETRY_STATUSES', '429,500,502,503,504')
+        max_attempts = {}
+        for method in ('GET', 'POST', 'PUT', 'DELETE'):
+            value = os.environ.get(f'API_RETRY_MAX_ATTEMPTS_{method}')
+            if value:
+                max_attempts[method] = int(value)
+
+        return {
+            'methods': [m.strip().upper() for m in methods.split(',') if m.strip()],
+            'retry_statuses': [int(s) for s in statuses.split(',') if s.strip()],
+            'default_max_attempts': int(os.environ.get('API_RETRY_MAX_ATTEMPTS', 3)),
+            'max_attempts': max_attempts,
+            'backoff_base': float(os.environ.get('API_RETRY_BACKOFF_BASE', 0.5)),
+            'backoff_max': float(os.environ.get('API_RETRY_BACKOFF_MAX', 8)),
+            'circuit_failure_threshold': int(os.environ.get('API_CIRCUIT_FAILURE_THRESHOLD', 5)),
+            'circuit_reset_timeout': float(os.environ.get('API_CIRCUIT_RESET_TIMEOUT', 30)),
+        }
+
+    @staticmethod
+    def get_api_rate_limit_configs():
+        # off by default, enable with API_RATE_LIMIT=1 when sharing a store or running with xdist
+        return {
+            'enabled': os.environ.get('API_RATE_LIMIT', '').lower() in ('1', 'true', 'yes'),
+            'limits_file': os.environ.get('API_RATE_LIMITS_FILE'),
+        }
+
+    @staticmethod
+    def get_api_cache_configs():
+        # only GETs made with cache=True are cached, API_CACHE=0 turns those into regular calls
+        return {
+            'enabled': os.environ.get('API_CACHE', '1').lower() not in ('0', 'false', 'no'),
+            'ttl': float(os.environ.get('API_CACHE_TTL', 300)),
+            'max_entries': int(os.environ.get('API_CACHE_MAX_ENTRIES', 256)),
+        }
+
+    @staticmethod
+    def get_api_json_decoder():
+        # 'auto' uses orjson when installed, 'json' forces the standard library
+        return os.environ.get('API_JSON_DECODER', 'auto').lower()
+
     @staticmethod
     def get_coupon_code(filter):
 
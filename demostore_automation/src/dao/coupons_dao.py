@@ -1,3 +1,4 @@
+from demostore_automation.src.dao.records import Coupon
 from demostore_automation.src.utilities.dbUtility import DBUtility
 
 
@@ -9,21 +10,40 @@ class CouponsDAO():
 #fetching coupon by coupon text or partial text
 
     def fetch_coupon_by_text(self, text):
-        sql = f"""SELECT * FROM
+        sql = f"""SELECT {Coupon.columns()} FROM
         {self.db_helper.database}.{self.db_helper.table_prefix}posts
         WHERE
         post_type = 'shop_coupon'
         AND
         post_title = '{text}';"""
-        rs_sql = self.db_helper.execute_select(sql)
+        rs_sql = self.db_helper.execute_select_records(sql, Coupon)
         return rs_sql
 
     def fetch_coupon_by_discount_type(self, discount_type):
-        sql = f"""SELECT * FROM demostore.wp_posts p
-        JOIN demostore.wp_postmeta pm ON p.ID = pm.post_id
+        # seek the published coupons by the posts (post_type, post_status) index, then their
+        # 'discount_type' meta by the postmeta post_id index; meta_value has no index
+        sql = f"""SELECT p.ID, p.post_title, p.post_status FROM
+        {self.db_helper.database}.{self.db_helper.table_prefix}posts p
+        STRAIGHT_JOIN {self.db_helper.database}.{self.db_helper.table_prefix}postmeta pm
+        ON pm.post_id = p.ID AND pm.meta_key = 'discount_type'
         WHERE p.post_type = 'shop_coupon'
         AND p.post_status = 'publish'
-        AND pm.meta_key = 'discount_type'
         AND pm.meta_value = '{discount_type}';"""
-        rs_sql = self.db_helper.execute_select(sql)
+        rs_sql = self.db_helper.execute_select_records(sql, Coupon)
         return rs_sql
+
+#usage count and 'used by' entries (user id or billing email) WooCommerce stored for a coupon
+
+    def get_coupon_usage(self, coupon_id):
+        sql = f"""SELECT meta_key, meta_value FROM
+        {self.db_helper.database}.{self.db_helper.table_prefix}postmeta
+        WHERE
+        post_id = {coupon_id}
+        AND
+        meta_key IN ('usage_count', '_used_by');"""
+        rs_sql = self.db_helper.execute_select(sql)
+        usage_count = [int(r['meta_value']) for r in rs_sql if r['meta_key'] == 'usage_count']
+        return {
+            "usage_count": usage_count[0] if usage_count else 0,
+            "used_by": [r['meta_value'] for r in rs_sql if r['meta_key'] == '_used_by']
+        }
@@ -1,5 +1,6 @@
 
 
+from demostore_automation.src.dao.records import Customer
 from demostore_automation.src.utilities.dbUtility import DBUtility
 import random
 import logging as logger
@@ -10,15 +11,17 @@ class CustomersDAO:
         self.db_helper = DBUtility()
 
     def get_customer_by_email(self, email):
-        sql = f"""SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}users 
+        sql = f"""SELECT {Customer.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}users 
                   WHERE user_email = '{email}';"""
 
-        rs_sql = self.db_helper.execute_select(sql)
+        rs_sql = self.db_helper.execute_select_records(sql, Customer)
 
         return rs_sql
 
     def get_random_customer_from_db(self, qty=1):
-        sql = f"SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}users order by id desc LIMIT 1000;"
-        rs_sql = self.db_helper.execute_select(sql)
+        # not rewritten: ORDER BY the primary key with a LIMIT was already read backwards along the
+        # index and stops after 1000 rows, which EXPLAIN estimates at the LIMIT (see queryPlanUtility)
+        sql = f"SELECT {Customer.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}users ORDER BY ID DESC LIMIT 1000;"
+        rs_sql = self.db_helper.execute_select_records(sql, Customer)
         logger.info(f"Found {len(rs_sql)} random users from db.")
         return random.sample(rs_sql, int(qty))
\ No newline at end of file
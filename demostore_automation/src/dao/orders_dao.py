@@ -4,7 +4,8 @@ This module provides utility methods for fetching order information from the Wor
 database using raw SQL queries. It is primarily used for test validation in automation workflows.
 """
 
-from demostore_automation.src.utilities.dbUtility import DBUtility
+from demostore_automation.src.dao.records import Order, OrderNote, OrderStats, OrderStatus
+from demostore_automation.src.utilities.dbUtility import DBUtility, id_chunks
 import logging as logger
 import random
 
@@ -26,16 +27,37 @@ class OrdersDAO:
             order_id (int): The ID of the order to retrieve.
 
         Returns:
-            list[dict]: A list containing a single dictionary with the order's database fields.
+            list[Order]: A list containing the order record, empty if there is no such order.
 
         Raises:
-            Exception: If the database query fails or no matching order is found.
+            Exception: If the database query fails.
         """
         sql = f"""
-        SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
+        SELECT {Order.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
         WHERE post_type = 'shop_order_placehold' AND ID = {order_id};
         """
-        return self.db_helper.execute_select(sql)
+        return self.db_helper.execute_select_records(sql, Order)
+
+    def get_orders_by_ids(self, order_ids):
+        """Fetch several orders with one query per chunk of ids instead of one query per order.
+
+        Args:
+            order_ids (list[int]): IDs of the orders to retrieve.
+
+        Returns:
+            dict[int, Order]: Maps order ID to its record. IDs that do not exist are missing.
+
+        Raises:
+            Exception: If the database query fails.
+        """
+        orders = {}
+        for ids in id_chunks(order_ids):
+            sql = f"""
+            SELECT {Order.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
+            WHERE post_type = 'shop_order_placehold' AND ID IN ({ids});
+            """
+            orders.update((order.ID, order) for order in self.db_helper.execute_select_records(sql, Order))
+        return orders
 
 
     def get_random_existing_order_from_db(self, qty=1):
@@ -45,12 +67,12 @@ class OrdersDAO:
             qty (int, optional): Number of random orders to fetch. Defaults to 1.
 
         Returns:
-            list[dict]: List of randomly selected order records.
+            list[Order]: List of randomly selected order records.
         """
         sql =f"""
-        SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
+        SELECT {Order.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
         WHERE post_type = 'shop_order_placehold' order by id desc LIMIT 1000;"""
-        rs_sql = self.db_helper.execute_select(sql)
+        rs_sql = self.db_helper.execute_select_records(sql, Order)
         logger.info(f"Found {len(rs_sql)} random order(s) from db.")
         return random.sample(rs_sql, int(qty))
 
@@ -62,29 +84,51 @@ class OrdersDAO:
             qty (int, optional): Number of random orders to fetch. Defaults to 1.
 
         Returns:
-            list[dict]: Random orders matching the specified status.
+            list[OrderStats]: Random orders matching the specified status.
         """
-        sql = f"""SELECT * FROM
+        sql = f"""SELECT {OrderStats.columns()} FROM
         {self.db_helper.database}.{self.db_helper.table_prefix}wc_order_stats
-        WHERE status = 'wc-{status}';"""
-        rs_sql = self.db_helper.execute_select(sql)
+        WHERE status = 'wc-{status}' ORDER BY order_id;"""
+        rs_sql = self.db_helper.execute_select_records(sql, OrderStats)
         logger.info(f"Found {len(rs_sql)} orders with status {status}")
         return random.sample(rs_sql, int(qty))
 
-    def get_orders_by_note_text(self, note_text):
-        """Fetch orders containing a specific note text.
+    def iter_orders_by_status(self, status, batch_size=1000):
+        """Yield all orders with a status, streamed from the server in batches.
+
+        For full-table audits on big stores: memory stays bounded by one batch.
+
+        Args:
+            status (str): WooCommerce order status (e.g., 'processing', 'completed').
+            batch_size (int, optional): Rows fetched at a time. Defaults to 1000.
+
+        Yields:
+            OrderStats: One order.
+        """
+        sql = f"""SELECT {OrderStats.columns()} FROM
+        {self.db_helper.database}.{self.db_helper.table_prefix}wc_order_stats
+        WHERE status = 'wc-{status}' ORDER BY order_id;"""
+        yield from self.db_helper.iter_select(sql, OrderStats, batch_size=batch_size)
+
+    def get_order_notes(self, order_id, note_text=None):
+        """Fetch the notes of an order, optionally only those with a specific text.
+
+        Seeks by the indexed 'comment_post_ID' and 'comment_type' columns; the note text
+        only filters the few notes of the order.
 
         Args:
-            note_text (str): The note content to search for.
+            order_id (int): ID of the order.
+            note_text (str, optional): Only return notes with this text.
 
         Returns:
-            list[dict]: Orders that have the specified note text.
+            list[OrderNote]: Notes of the order, 'comment_post_ID' is the order id.
         """
-        sql = f"""SELECT * FROM
+        text_filter = f"AND comment_content = '{note_text}'" if note_text is not None else ""
+        sql = f"""SELECT {OrderNote.columns()} FROM
         {self.db_helper.database}.{self.db_helper.table_prefix}comments
-        WHERE comment_content = '{note_text}';"""
-        rs_sql = self.db_helper.execute_select(sql)
-        logger.info(f"Found {len(rs_sql)} orders with note '{note_text}'")
+        WHERE comment_post_ID = {int(order_id)} AND comment_type = 'order_note' {text_filter};"""
+        rs_sql = self.db_helper.execute_select_records(sql, OrderNote)
+        logger.info(f"Found {len(rs_sql)} notes on order {order_id}")
         return rs_sql
 
 
@@ -95,14 +139,34 @@ class OrdersDAO:
             order_id (int): The ID of the order to retrieve.
 
         Returns:
-            list[dict]: A list containing a single dictionary with the order's database fields.
+            list[OrderStatus]: A list containing the order's 'id' and 'status', empty if there is no such order.
 
         Raises:
-            Exception: If the database query fails or no matching order is found.
+            Exception: If the database query fails.
         """
         sql = f"""
-        SELECT status FROM {self.db_helper.database}.{self.db_helper.table_prefix}wc_orders
+        SELECT {OrderStatus.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}wc_orders
         WHERE id = {order_id};
         """
-        return self.db_helper.execute_select(sql)
+        return self.db_helper.execute_select_records(sql, OrderStatus)
+
+    def get_order_statuses_by_ids(self, order_ids):
+        """Fetch the status of several orders with one query per chunk of ids.
 
+        Args:
+            order_ids (list[int]): IDs of the orders.
+
+        Returns:
+            dict[int, OrderStatus]: Maps order ID to its 'id' and 'status'. IDs that do not exist are missing.
+
+        Raises:
+            Exception: If the database query fails.
+        """
+        statuses = {}
+        for ids in id_chunks(order_ids):
+            sql = f"""
+            SELECT {OrderStatus.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}wc_orders
+            WHERE id IN ({ids});
+            """
+            statuses.update((row.id, row) for row in self.db_helper.execute_select_records(sql, OrderStatus))
+        return statuses
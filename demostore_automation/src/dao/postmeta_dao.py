@@ -0,0 +1,92 @@
+"""Post meta Data Access Object (DAO) reading WordPress 'postmeta' pivoted per post.
+
+WooCommerce keeps product and coupon attributes (prices, stock, usage counts) as one
+'postmeta' row per key. Instead of returning those rows for callers to loop over, the
+queries here pivot the selected keys into columns in SQL, so one query returns one
+row per post and a key lookup is a dict access.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+from demostore_automation.src.utilities.dbUtility import DBUtility, id_chunks
+
+PRICE_KEYS = ('_regular_price', '_sale_price', '_price')
+
+_META_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+def to_number(value):
+    """Coerce a meta value (or API price string) to Decimal.
+
+    Args:
+        value (str or int or float or None): Value as stored, e.g. '19.99'.
+
+    Returns:
+        Decimal or None: None for a missing or empty value.
+
+    Raises:
+        ValueError: If the value is not numeric.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Meta value is not numeric: {value!r}") from None
+
+
+class PostMetaDAO:
+    """Reads selected meta keys of many posts with one query per chunk of post ids."""
+
+    def __init__(self):
+        self.db_helper = DBUtility()
+
+    def get_meta(self, post_ids, meta_keys, numeric_keys=()):
+        """Fetch meta keys of several posts, pivoted into one mapping per post.
+
+        Args:
+            post_ids (list[int]): IDs of the posts (products, coupons, ...).
+            meta_keys (list[str]): Meta keys to fetch, e.g. ['_price', '_stock'].
+            numeric_keys (list[str], optional): Keys whose values are coerced with `to_number`.
+
+        Returns:
+            dict[int, dict]: Maps post ID to {meta_key: value}, with None for keys the post does not have.
+                        Posts without any of the keys are missing.
+
+        Raises:
+            ValueError: If a meta key contains characters other than letters, digits and '_',
+                        or a numeric key has a non-numeric value.
+            Exception: If the database query fails.
+        """
+        meta_keys = list(meta_keys)
+        for meta_key in meta_keys:
+            if not _META_KEY_PATTERN.match(meta_key):
+                raise ValueError(f"Invalid meta key: {meta_key!r}")
+        pivot_columns = ",\n".join(f"MAX(CASE WHEN meta_key = '{key}' THEN meta_value END) AS `{key}`"
+                                   for key in meta_keys)
+        key_list = ", ".join(f"'{key}'" for key in meta_keys)
+
+        meta = {}
+        for ids in id_chunks(post_ids):
+            sql = f"""SELECT post_id,
+            {pivot_columns}
+            FROM {self.db_helper.database}.{self.db_helper.table_prefix}postmeta
+            WHERE post_id IN ({ids}) AND meta_key IN ({key_list})
+            GROUP BY post_id;"""
+            for row in self.db_helper.execute_select(sql):
+                post_id = row.pop('post_id')
+                for key in numeric_keys:
+                    row[key] = to_number(row[key])
+                meta[post_id] = row
+        return meta
+
+    def get_product_prices(self, product_ids):
+        """Fetch '_regular_price', '_sale_price' and '_price' of several products as Decimals.
+
+        Args:
+            product_ids (list[int]): IDs of the products.
+
+        Returns:
+            dict[int, dict]: Maps product ID to {'_regular_price': Decimal, '_sale_price': Decimal or None,
+                        '_price': Decimal}.
+        """
+        return self.get_meta(product_ids, PRICE_KEYS, numeric_keys=PRICE_KEYS)
@@ -4,7 +4,8 @@ This module provides utility methods for fetching product information from the W
 database using raw SQL queries. It is primarily used for test validation in automation workflows.
 """
 
-from demostore_automation.src.utilities.dbUtility import DBUtility
+from demostore_automation.src.dao.records import PriceMeta, Product, ProductPriceMeta, Review
+from demostore_automation.src.utilities.dbUtility import DBUtility, id_chunks
 import random
 import logging as logger
 
@@ -26,18 +27,17 @@ class ProductsDAO:
             qty (int): The number of random products to retrieve. Defaults to 1.
 
         Returns:
-            list[dict]: A list of product records, each as a dictionary containing fields
-            such as `ID`, `post_title`, and `post_name`.
+            list[Product]: A list of product records with `ID`, `post_title`, `post_name` and `post_status`.
 
         Raises:
             ValueError: If `qty` exceeds the number of available products in the query result.
         """
 
         logger.info(f"Getting random products from db. qty= {qty}")
-        sql = f"""SELECT ID, post_title, post_name FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts 
-        WHERE post_type = 'product' AND post_status = 'publish' LIMIT 500;"""
+        sql = f"""SELECT {Product.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts 
+        WHERE post_type = 'product' AND post_status = 'publish' ORDER BY ID LIMIT 500;"""
 
-        rs_sql = self.db_helper.execute_select(sql)
+        rs_sql = self.db_helper.execute_select_records(sql, Product)
 
         return random.sample(rs_sql, int(qty))
 
@@ -49,15 +49,35 @@ class ProductsDAO:
             product_id (int): The ID of the product to retrieve.
 
         Returns:
-            list[dict]: A list containing a single dictionary with the product's database fields.
+            list[Product]: A list containing the product record, empty if there is no such product.
 
         Raises:
-            Exception: If the database query fails or no matching product is found.
+            Exception: If the database query fails.
         """
-        sql = f"""SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts 
+        sql = f"""SELECT {Product.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts 
         WHERE post_type = 'product' AND ID = {product_id};"""
 
-        return self.db_helper.execute_select(sql)
+        return self.db_helper.execute_select_records(sql, Product)
+
+
+    def get_products_by_ids(self, product_ids):
+        """Fetch several products with one query per chunk of ids instead of one query per product.
+
+        Args:
+            product_ids (list[int]): IDs of the products to retrieve.
+
+        Returns:
+            dict[int, Product]: Maps product ID to its record. IDs that do not exist are missing.
+
+        Raises:
+            Exception: If the database query fails.
+        """
+        products = {}
+        for ids in id_chunks(product_ids):
+            sql = f"""SELECT {Product.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}posts
+            WHERE post_type = 'product' AND ID IN ({ids});"""
+            products.update((product.ID, product) for product in self.db_helper.execute_select_records(sql, Product))
+        return products
 
 
     def get_product_price(self, product_id):
@@ -67,13 +87,32 @@ class ProductsDAO:
             product_id (int): ID of the product.
 
         Returns:
-            list[dict]: List of dictionaries with 'meta_key' and 'meta_value'
+            list[PriceMeta]: Records with 'meta_key' and 'meta_value'
                         for '_regular_price', '_sale_price', and '_price'.
         """
-        sql = f""" SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}postmeta
+        sql = f""" SELECT {PriceMeta.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}postmeta
         WHERE post_id = {product_id} AND meta_key IN ('_regular_price', '_sale_price', '_price');
         """
-        return self.db_helper.execute_select(sql)
+        return self.db_helper.execute_select_records(sql, PriceMeta)
+
+    def get_product_prices_by_ids(self, product_ids):
+        """Fetch the price-related meta fields of several products with one query per chunk of ids.
+
+        Args:
+            product_ids (list[int]): IDs of the products.
+
+        Returns:
+            dict[int, list[ProductPriceMeta]]: Maps product ID to its '_regular_price', '_sale_price'
+                        and '_price' records. Every requested ID is present, with an empty list if nothing matched.
+        """
+        prices = {int(product_id): [] for product_id in product_ids}
+        for ids in id_chunks(product_ids):
+            sql = f""" SELECT {ProductPriceMeta.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}postmeta
+            WHERE post_id IN ({ids}) AND meta_key IN ('_regular_price', '_sale_price', '_price');
+            """
+            for row in self.db_helper.execute_select_records(sql, ProductPriceMeta):
+                prices[row.post_id].append(row)
+        return prices
 
     def get_product_review_info(self, product_id):
         """Fetch the review-related fields of a product from the database.
@@ -82,9 +121,34 @@ class ProductsDAO:
             product_id (int): ID of the product.
 
         Returns:
-            list[dict]: A list containing a single dictionary with the product's database fields.
+            list[Review]: The review records of the product.
         """
-        sql = f""" SELECT * FROM {self.db_helper.database}.{self.db_helper.table_prefix}comments
+        sql = f""" SELECT {Review.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}comments
         WHERE comment_type = 'comment' and comment_post_ID = {product_id};
         """
-        return self.db_helper.execute_select(sql)
\ No newline at end of file
+        return self.db_helper.execute_select_records(sql, Review)
+
+    def iter_reviews(self, product_ids=None, batch_size=1000):
+        """Yield the reviews of products, or of all products, streamed from the server in batches.
+
+        Reviews are ordered by product, so the reviews of one product are consecutive
+        (e.g. for `itertools.groupby` on 'comment_post_ID').
+
+        Args:
+            product_ids (list[int], optional): Only the reviews of these products, nothing for an empty list.
+                Defaults to all products.
+            batch_size (int, optional): Rows fetched at a time. Defaults to 1000.
+
+        Yields:
+            Review: One review.
+        """
+        product_filter = ""
+        if product_ids is not None:
+            if not product_ids:
+                return
+            product_filter = f"AND comment_post_ID IN ({', '.join(str(int(i)) for i in product_ids)})"
+        sql = f""" SELECT {Review.columns()} FROM {self.db_helper.database}.{self.db_helper.table_prefix}comments
+        WHERE comment_type = 'comment' {product_filter}
+        ORDER BY comment_post_ID, comment_ID;
+        """
+        yield from self.db_helper.iter_select(sql, Review, batch_size=batch_size)
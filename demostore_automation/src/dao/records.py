@@ -0,0 +1,107 @@
+"""Compact row types for DAO query results.
+
+Every record class lists the columns of one query in `__slots__`, so a row keeps
+only the selected values (no per-row dict) and attribute access is a slot lookup.
+`DBUtility.execute_select_records` builds them from tuple cursor rows and checks
+the cursor columns against the slots first, so a column typo in a query or a
+record fails right away instead of as a KeyError deep inside a test.
+
+Records also support `row['column']` and `row.get('column')`, so code written
+for the former dict rows keeps working.
+"""
+
+
+class Record:
+    """Base class of the DAO rows. Subclasses define the columns in `__slots__`."""
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        if len(values) != len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} expects {len(self.__slots__)} values "
+                            f"({', '.join(self.__slots__)}), got {len(values)}")
+        for column, value in zip(self.__slots__, values):
+            setattr(self, column, value)
+
+    @classmethod
+    def columns(cls):
+        """Return the columns as a comma separated list for the SELECT clause."""
+        return ", ".join(cls.__slots__)
+
+    @classmethod
+    def validate_columns(cls, column_names):
+        """Check that a query returns exactly the record's columns, in order.
+
+        Raises:
+            Exception: If the columns differ.
+        """
+        if tuple(column_names) != cls.__slots__:
+            raise Exception(f"Query columns {list(column_names)} do not match {cls.__name__} "
+                            f"columns {list(cls.__slots__)}")
+
+    def __getitem__(self, column):
+        try:
+            return getattr(self, column)
+        except (AttributeError, TypeError):
+            raise KeyError(column) from None
+
+    def get(self, column, default=None):
+        return getattr(self, column, default) if column in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def as_dict(self):
+        return {column: getattr(self, column) for column in self.__slots__}
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.as_dict() == other.as_dict()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        values = ", ".join(f"{column}={getattr(self, column)!r}" for column in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class Product(Record):
+    __slots__ = ('ID', 'post_title', 'post_name', 'post_status')
+
+
+class Order(Record):
+    __slots__ = ('ID', 'post_status', 'post_date')
+
+
+class OrderStats(Record):
+    __slots__ = ('order_id', 'status', 'customer_id', 'total_sales', 'date_created')
+
+
+class OrderStatus(Record):
+    __slots__ = ('id', 'status')
+
+
+class OrderNote(Record):
+    __slots__ = ('comment_ID', 'comment_post_ID', 'comment_content')
+
+
+class Coupon(Record):
+    __slots__ = ('ID', 'post_title', 'post_status')
+
+
+class Customer(Record):
+    __slots__ = ('ID', 'user_login', 'user_email', 'user_pass', 'display_name', 'user_registered')
+
+
+class Review(Record):
+    __slots__ = ('comment_ID', 'comment_post_ID', 'comment_approved', 'user_id', 'comment_author_email',
+                 'comment_content')
+
+
+class PriceMeta(Record):
+    __slots__ = ('meta_key', 'meta_value')
+
+
+class ProductPriceMeta(Record):
+    __slots__ = ('post_id', 'meta_key', 'meta_value')
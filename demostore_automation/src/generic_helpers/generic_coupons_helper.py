@@ -69,16 +69,17 @@ class GenericCouponsHelper:
             coupon_code = coupon[0]['post_title']
         return coupon_id, coupon_code
 
-    def is_coupon_valid(self, coupon_id):
+    def is_coupon_valid(self, coupon_id, use_cache=False):
         """Check if a coupon is still valid (not expired).
 
         Args:
             coupon_id (int): ID of the coupon to check.
+            use_cache (bool, optional): Use the API response cache. Defaults to False.
 
         Returns:
             bool: True if valid, False if expired.
         """
-        get_coupon = self.coupons_api_helper.call_retrieve_coupon(coupon_id)
+        get_coupon = self.coupons_api_helper.call_retrieve_coupon(coupon_id, use_cache=use_cache)
         status = get_coupon['status']
         expiration = get_coupon['date_expires']
         if status != 'publish': # first check if status is valid
@@ -105,8 +106,8 @@ class GenericCouponsHelper:
         Raises:
             AssertionError: If coupon was not applied correctly or totals mismatch.
         """
-        order_response = self.orders_api_helper.call_retrieve_order(order_id)
-        coupon_response = self.coupons_api_helper.call_retrieve_coupon(coupon_id)
+        order_response = self.orders_api_helper.call_retrieve_order(order_id, conditional=True)
+        coupon_response = self.coupons_api_helper.call_retrieve_coupon(coupon_id, conditional=True)
         discount_type = coupon_response['discount_type']
 
         total_before_float = float(total_before)
@@ -142,7 +143,7 @@ class GenericCouponsHelper:
         Raises:
             AssertionError: If customer not listed in 'used_by' field of coupon.
         """
-        coupon_response = self.coupons_api_helper.call_retrieve_coupon(coupon_id)
+        coupon_response = self.coupons_api_helper.call_retrieve_coupon(coupon_id, conditional=True)
         coupon_users = [str(u).lower() for u in coupon_response['used_by']]  # normalize
 
         customer_id_str = str(customer_id)
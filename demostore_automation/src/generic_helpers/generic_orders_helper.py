@@ -4,11 +4,10 @@ Provides utilities to create orders with optional custom payloads, attach notes,
 and verify existence of orders and notes via API and database.
 """
 import logging as logger
-import json
-import os
 from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
 from demostore_automation.src.dao.products_dao import ProductsDAO
 from demostore_automation.src.dao.orders_dao import OrdersDAO
+from demostore_automation.src.utilities.payloadUtility import OrderPayloadBuilder
 
 
 class GenericOrdersHelper:
@@ -17,13 +16,12 @@ class GenericOrdersHelper:
     Attributes:
         orders_api_helper (OrdersAPIHelper): API helper for orders.
         products_dao (ProductsDAO): Access to product data.
-        current_file_dir (str): Path to the current file directory.
+        orders_dao (OrdersDAO): Access to order data.
     """
     def __init__(self):
         self.orders_api_helper = OrdersAPIHelper()
         self.products_dao = ProductsDAO()
         self.orders_dao = OrdersDAO()
-        self.current_file_dir = os.path.dirname(os.path.realpath(__file__))
 
 
     def create_order(self, order_qty=1, product_qty=1, additional_args=None):
@@ -39,33 +37,21 @@ class GenericOrdersHelper:
 
         Raises:
             TypeError: If `additional_args` is not a dict.
-            FileNotFoundError, IOError, PermissionError, UnicodeError: File read errors.
+            AssertionError: If the create order API call does not return the expected status code.
         """
-        # Create full path regardless of os
-        payload_json_file = os.path.join(self.current_file_dir, '..', 'data', 'create_order_payload.json')
+        builder = OrderPayloadBuilder()
+        if additional_args:
+            builder.with_overrides(additional_args)
+        payload = builder.build()
 
-        try:
-            with open(payload_json_file, 'r') as f:
-                payload = json.load(f)
+        if "line_items" not in payload:
+            random_product = self.products_dao.get_random_product_from_db(qty=1)
+            random_product_id = random_product[0]['ID']
+            payload["line_items"] = [{"product_id": random_product_id, "quantity": product_qty}]
 
-            if additional_args:
-                if not isinstance(additional_args, dict):
-                    raise TypeError(f"File must be of type dict. Actual: {type(additional_args)}")
-                payload.update(additional_args)
-
-            if "line_items" not in payload:
-                random_product = self.products_dao.get_random_product_from_db(qty=1)
-                random_product_id = random_product[0]['ID']
-                payload["line_items"] = [{"product_id": random_product_id, "quantity": product_qty}]
-
-            else:
-                for i in payload["line_items"]:
-                    i["quantity"] = product_qty # if not line_items, payload will still take product_qty
-
-
-        except (FileNotFoundError, IOError, PermissionError, UnicodeError) as e:
-            logger.error(f"Could not read payload file: {e}")
-            raise
+        else:
+            for i in payload["line_items"]:
+                i["quantity"] = product_qty # if not line_items, payload will still take product_qty
 
         create_order_responses = []
         for i in range(order_qty):
@@ -102,6 +88,40 @@ class GenericOrdersHelper:
 
         return get_order_response
 
+    def verify_new_orders_exist(self, order_ids):
+        """Batch form of `verify_new_order_exists`, e.g. for all orders of `create_order(order_qty=N)`.
+
+        Lists the orders with one paginated API call filtered by 'include' and fetches
+        them from the DB with one query per chunk of ids, instead of two calls per order.
+
+        Args:
+            order_ids (list[int]): IDs of the orders to verify.
+
+        Raises:
+            AssertionError: If an order is missing in the API or DB.
+
+        Returns:
+            dict[int, dict]: Maps order ID to its API response.
+        """
+        order_ids = list(order_ids)
+        if not order_ids:
+            return {}
+
+        # API check
+        params = {"include": ",".join(str(order_id) for order_id in order_ids)}
+        api_orders = {order['id']: order for order in self.orders_api_helper.iter_all_orders(params=params)}
+        missing = [order_id for order_id in order_ids if order_id not in api_orders]
+        assert not missing, f"List orders api response is missing order ids: {missing}"
+        logger.info(f"List orders api call successfully found {len(order_ids)} new orders")
+
+        # DB check
+        db_orders = self.orders_dao.get_orders_by_ids(order_ids)
+        missing = [order_id for order_id in order_ids if order_id not in db_orders]
+        assert not missing, f"DB query for fetching orders by ids is missing order ids: {missing}"
+        logger.info(f"DB query for fetching orders by ids successfully found {len(order_ids)} new orders")
+
+        return {order_id: api_orders[order_id] for order_id in order_ids}
+
     def create_order_for_customer(self, customer_id, product_id):
         """Create an order for a specific customer and product with free shipping.
 
@@ -169,8 +189,8 @@ class GenericOrdersHelper:
                                                     f"Actual: {get_note_response['id']}, Expected: {note_id}")
         logger.info(f"GET api call for order note by note id successfully found new order note")
 
-        db_orders_with_note_text = self.orders_dao.get_orders_by_note_text(note_text)
-        for i in db_orders_with_note_text:
+        db_order_notes = self.orders_dao.get_order_notes(order_id, note_text=note_text)
+        for i in db_order_notes:
             if i['comment_ID'] == note_id:
                 break
         else:
@@ -191,11 +211,32 @@ class GenericOrdersHelper:
         Raises:
             AssertionError: If any check fails.
         """
+        db_details = self.orders_dao.get_order_status_by_id(get_response['id'])
+        assert db_details, f"DB query for fetching order status returned nothing for order id: {get_response['id']}"
+        self._check_order_status(get_response, order_status, db_details[0]['status'])
+
+    def verify_order_statuses(self, get_responses, order_status):
+        """Batch form of `verify_order_status`: one DB query for all orders.
+
+        Args:
+            get_responses (list[dict]): API responses of the orders.
+            order_status (str): Expected status of every order.
+
+        Raises:
+            AssertionError: If any check fails for any order.
+        """
+        db_statuses = self.orders_dao.get_order_statuses_by_ids([r['id'] for r in get_responses])
+        for get_response in get_responses:
+            db_status = db_statuses.get(get_response['id'])
+            assert db_status, f"DB query for fetching order statuses is missing order id: {get_response['id']}"
+            self._check_order_status(get_response, order_status, db_status['status'])
+
+    @staticmethod
+    def _check_order_status(get_response, order_status, db_status):
         order_id = get_response['id']
         assert get_response['status'] == order_status
-        db_details = self.orders_dao.get_order_status_by_id(order_id)
-        assert db_details[0]['status'].endswith(order_status), (f"Wrong status in DB. Actual: {db_details[0]['status']}"
-                                                                f"Expected: {order_status}")
+        assert db_status.endswith(order_status), (f"Wrong status in DB. Actual: {db_status}"
+                                                  f"Expected: {order_status}")
         if order_status in ["completed", "cancelled", "refunded"]:
             assert not get_response['needs_payment'], (f"Error. 'needs_payment' expected to be 'False'"
                                                        f"for order status:{order_status} but returned 'True'")
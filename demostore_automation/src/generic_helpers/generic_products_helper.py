@@ -11,11 +11,13 @@ Methods:
     GenericProductsHelper.__init__: Initializes API and database access helpers.
     GenericProductsHelper.create_product_by_type: Create a product of a given type with optional attributes.
     GenericProductsHelper.verify_product_is_created: Verify that a product exists in API and database.
+    GenericProductsHelper.verify_product_prices: Verify the prices of products in the database with one query.
     GenericProductsHelper.create_product_invalid_param: Attempt to create a product with an invalid parameter.
     GenericProductsHelper.verify_error_message: Verify that the API response contains expected error information.
 """
 import logging as logger
 from demostore_automation.src.api_helpers.ProductsAPIHelper import ProductsAPIHelper
+from demostore_automation.src.dao.postmeta_dao import PostMetaDAO, to_number
 from demostore_automation.src.dao.products_dao import ProductsDAO
 from demostore_automation.src.utilities.genericUtilities import generate_random_string
 
@@ -27,11 +29,13 @@ class GenericProductsHelper:
 
     Attributes:
         products_dao (ProductsDAO): Database access for products.
+        postmeta_dao (PostMetaDAO): Database access for product meta such as prices.
         products_api_helper (ProductsAPIHelper): API access for product endpoints.
     """
 
     def __init__(self):
         self.products_dao = ProductsDAO()
+        self.postmeta_dao = PostMetaDAO()
         self.products_api_helper = ProductsAPIHelper()
 
     def create_product_by_type(self, product_type, additional_args=None):
@@ -160,28 +164,34 @@ class GenericProductsHelper:
                                                             f"Expected: {product_name}, Actual: {db_product[0]['post_name']}")
 
         if post_response['regular_price']:
-            db_prices = self.products_dao.get_product_price(product_id)
-
-            for row in db_prices: # iterate through list as dao method returns rows
-                if row['meta_key'] == '_regular_price':
-                    assert row['meta_value'] == post_response['regular_price'], (
-                        f"Wrong product 'regular_price' in DB. "
-                        f"Actual: {row['meta_value']}, Expected: {post_response['regular_price']}"
-                    )
-                elif row['meta_key'] == '_sale_price':
-                    assert row['meta_value'] == post_response['sale_price'], (
-                        f"Wrong product 'sale_price' in db. "
-                        f"Actual: {row['meta_value']}, Expected: {post_response['sale_price']}"
-                    )
-                elif row['meta_key'] == '_price':
-                    assert row['meta_value'] == post_response['price'], (
-                        f"Wrong product 'price' in db. "
-                        f"Actual: {row['meta_value']}, Expected: {post_response['price']}"
-                    )
+            self.verify_product_prices([post_response])
 
         logger.info(f"Successfully found product with id: {product_id} in DB")
         return post_response
 
+    def verify_product_prices(self, product_responses):
+        """Verify the regular, sale and current price of products in the database.
+
+        Fetches the prices of all products with one query, pivoted per product,
+        and compares them numerically with the API responses.
+
+        Args:
+            product_responses (list[dict]): Create or GET api responses of the products.
+
+        Raises:
+            AssertionError: If a product has no prices in the DB or a price differs.
+        """
+        db_prices = self.postmeta_dao.get_product_prices([p['id'] for p in product_responses])
+        for product_response in product_responses:
+            product_id = product_response['id']
+            assert product_id in db_prices, f"No prices found in DB for product id: {product_id}"
+            for meta_key, field in (('_regular_price', 'regular_price'), ('_sale_price', 'sale_price'),
+                                    ('_price', 'price')):
+                actual, expected = db_prices[product_id][meta_key], to_number(product_response[field])
+                assert actual == expected, (f"Wrong product '{field}' in DB for product id: {product_id}. "
+                                            f"Actual: {actual}, Expected: {expected}")
+        logger.info(f"Successfully verified prices of {len(product_responses)} product(s) in DB")
+
 
     def create_product_invalid_param(self, param, value):
         """Attempt to create a product with an invalid parameter.
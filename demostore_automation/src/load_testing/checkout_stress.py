@@ -0,0 +1,246 @@
+"""Concurrent browser checkout stress runner.
+
+Runs the guest checkout flow of `TestEndToEndCheckout` (HomePage -> CartPage ->
+CheckoutPage -> OrderReceivedPage) in N browser sessions at the same time,
+local or on the 'REMOTE_WEBDRIVER' grid. Every step is timed so latency under
+contention can be compared with a single session, and every order number shown
+on the order received page is verified through OrdersAPIHelper. A sweep over
+increasing session counts finds the throughput ceiling: the point where adding
+sessions no longer adds completed checkouts per minute.
+"""
+import threading
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.pages.CartPage import CartPage
+from demostore_automation.src.pages.CheckoutPage import CheckoutPage
+from demostore_automation.src.pages.Header import Header
+from demostore_automation.src.pages.HomePage import HomePage
+from demostore_automation.src.pages.OrderReceivedPage import OrderReceivedPage
+from demostore_automation.src.utilities.apiMetricsUtility import LatencyHistogram
+from demostore_automation.src.utilities.webdriverUtility import create_driver
+
+CHECKOUT_STEPS = ('start_browser', 'home', 'add_to_cart', 'cart', 'apply_coupon', 'checkout', 'place_order', 'verify_order')
+
+
+class CheckoutFlow:
+    """One browser session running the guest checkout flow with per-step timing.
+
+    Attributes:
+        driver: WebDriver session used by the page objects.
+        coupon_code (str): Coupon applied in the cart. The default makes the order total $0.
+        steps (dict): Step durations in ms of the current iteration.
+    """
+
+    def __init__(self, driver, coupon_code=None):
+        self.driver = driver
+        self.coupon_code = coupon_code or MainConfigs.get_coupon_code('FREE_COUPON')
+        self.home_page = HomePage(driver)
+        self.header = Header(driver)
+        self.cart_page = CartPage(driver)
+        self.checkout_page = CheckoutPage(driver)
+        self.order_received = OrderReceivedPage(driver)
+        self.orders_api_helper = OrdersAPIHelper()
+        self.steps = {}
+
+    def _step(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.steps[name] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    def _add_to_cart(self):
+        self.home_page.click_first_add_to_cart_button()
+        self.header.wait_until_cart_item_count(1)
+
+    def _cart(self):
+        self.header.click_on_cart_on_right_header()
+        product_names = self.cart_page.get_all_product_names_in_cart()
+        assert len(product_names) == 1, f"Expected 1 product in cart but found {len(product_names)}"
+
+    def _apply_coupon(self):
+        self.cart_page.click_apply_coupon_arrow()
+        self.cart_page.apply_coupon(self.coupon_code)
+        self.cart_page.verify_order_total_is_0()
+
+    def _checkout(self):
+        self.cart_page.click_on_proceed_to_checkout()
+        self.checkout_page.fill_in_billing_info()
+
+    def _place_order(self):
+        self.checkout_page.click_place_order()
+        self.checkout_page.click_place_order()
+        self.order_received.verify_order_received_page_loaded()
+        return self.order_received.get_order_number()
+
+    def _verify_order(self, order_number):
+        order = self.orders_api_helper.call_retrieve_order(order_number, fields=["id"])
+        assert str(order['id']) == str(order_number), (f"Order from the order received page not found in the API. "
+                                                       f"Expected: {order_number}, Actual: {order['id']}")
+        return order
+
+    def run(self):
+        """Run the checkout once.
+
+        Returns:
+            str: Order number shown on the order received page and verified via the API.
+        """
+        self.steps = {}
+        self.driver.delete_all_cookies()  # start every iteration with an empty cart
+        self._step('home', self.home_page.go_to_home_page)
+        self._step('add_to_cart', self._add_to_cart)
+        self._step('cart', self._cart)
+        self._step('apply_coupon', self._apply_coupon)
+        self._step('checkout', self._checkout)
+        order_number = self._step('place_order', self._place_order)
+        self._step('verify_order', self._verify_order, order_number)
+        return order_number
+
+
+class CheckoutStress:
+    """Runs the checkout flow in `sessions` concurrent browsers.
+
+    Attributes:
+        sessions (int): Number of concurrent browser sessions.
+        iterations (int): Checkouts per session.
+        browser (str): Browser passed to `create_driver`, e.g. 'headlesschrome' or 'remote_chrome'.
+        coupon_code (str): Coupon applied in the cart.
+        order_ids (list[str]): Orders created by the run, deleted by `cleanup`.
+    """
+
+    def __init__(self, sessions, iterations=1, browser='headlesschrome', coupon_code=None):
+        self.sessions = sessions
+        self.iterations = iterations
+        self.browser = browser
+        self.coupon_code = coupon_code
+        self.order_ids = []
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.step_stats = {step: LatencyHistogram() for step in CHECKOUT_STEPS}
+        self.completed = 0
+        self.errors = 0
+        self.error_samples = []
+
+    def _record_steps(self, steps):
+        with self._lock:
+            for name, ms in steps.items():
+                self.step_stats[name].add(ms, 'ok', 0)
+
+    def _record_error(self, session, error, failed_step):
+        with self._lock:
+            self.errors += 1
+            if len(self.error_samples) < 10:
+                self.error_samples.append(f"session {session} step '{failed_step}': {repr(error)[:300]}")
+
+    def _session(self, session):
+        try:
+            start = time.perf_counter()
+            driver = create_driver(self.browser)
+            self._record_steps({'start_browser': round((time.perf_counter() - start) * 1000, 2)})
+        except Exception as e:
+            self._record_error(session, e, 'start_browser')
+            return
+
+        try:
+            flow = CheckoutFlow(driver, self.coupon_code)
+            for _ in range(self.iterations):
+                try:
+                    order_number = flow.run()
+                except Exception as e:
+                    failed_step = next((s for s in CHECKOUT_STEPS[1:] if s not in flow.steps), 'unknown')
+                    self._record_error(session, e, failed_step)
+                    continue
+                self._record_steps(flow.steps)
+                with self._lock:
+                    self.completed += 1
+                    self.order_ids.append(order_number)
+                logger.info(f"Session {session} placed order {order_number}: {flow.steps}")
+        finally:
+            driver.quit()
+
+    def run(self, sessions=None):
+        """Run all sessions concurrently and wait for them to finish.
+
+        Args:
+            sessions (int, optional): Overrides the number of concurrent sessions for this run.
+
+        Returns:
+            dict: Run summary with per-step percentiles, throughput and error rate.
+        """
+        sessions = sessions or self.sessions
+        self._reset()
+        logger.info(f"Starting checkout stress: {sessions} sessions x {self.iterations} checkouts ({self.browser})")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix='checkout') as executor:
+            list(executor.map(self._session, range(sessions)))
+        return self.summary(sessions, time.perf_counter() - start)
+
+    def summary(self, sessions, duration):
+        attempted = self.completed + self.errors
+        return {
+            "sessions": sessions,
+            "duration_s": round(duration, 1),
+            "completed": self.completed,
+            "errors": self.errors,
+            "error_rate": round(self.errors / attempted, 4) if attempted else 0.0,
+            "checkouts_per_min": round(self.completed / duration * 60, 2) if duration else 0.0,
+            "steps": {name: {"calls": h.total_calls, "p50_ms": h.percentile(50), "p95_ms": h.percentile(95),
+                             "max_ms": round(h.max_ms, 2)}
+                      for name, h in self.step_stats.items() if h.total_calls},
+            "error_samples": list(self.error_samples),
+        }
+
+    def sweep(self, session_levels):
+        """Run the stress at each session count and locate the throughput ceiling.
+
+        Args:
+            session_levels (list[int]): Increasing numbers of concurrent sessions, e.g. [1, 2, 4, 8].
+
+        Returns:
+            dict: {"runs": [summary per level], "ceiling": see `find_throughput_ceiling`}
+        """
+        runs = [self.run(level) for level in session_levels]
+        return {"runs": runs, "ceiling": find_throughput_ceiling(runs)}
+
+    def cleanup(self):
+        """Delete all orders created by the stress runs."""
+        orders_api_helper = OrdersAPIHelper()
+        for order_id in self.order_ids:
+            try:
+                orders_api_helper.call_delete_order(order_id, parse_response=False)
+            except Exception as e:
+                logger.error(f"Could not delete order id: {order_id}. Error: {e}")
+        logger.info(f"Deleted {len(self.order_ids)} orders created by the checkout stress run")
+
+
+def find_throughput_ceiling(runs, min_gain_pct=10, max_error_rate=0.05):
+    """Find the session count after which more sessions stop adding throughput.
+
+    Args:
+        runs (list[dict]): Run summaries ordered by increasing 'sessions'.
+        min_gain_pct (float, optional): Throughput gain below which the next level counts as saturated.
+        max_error_rate (float, optional): Error rate at which a level counts as failing.
+
+    Returns:
+        dict: {"sessions": int, "checkouts_per_min": float, "reason": str} for the best healthy level,
+            or None if no level was healthy.
+    """
+    best = None
+    for run in runs:
+        if run['error_rate'] > max_error_rate:
+            reason = f"error rate {run['error_rate']} at {run['sessions']} sessions"
+            break
+        if best and run['checkouts_per_min'] < best['checkouts_per_min'] * (1 + min_gain_pct / 100):
+            reason = f"throughput gain below {min_gain_pct}% at {run['sessions']} sessions"
+            break
+        best = run
+    else:
+        reason = "not reached, increase the session levels"
+
+    if not best:
+        return None
+    return {"sessions": best['sessions'], "checkouts_per_min": best['checkouts_per_min'], "reason": reason}
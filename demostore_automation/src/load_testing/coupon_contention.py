@@ -0,0 +1,253 @@
+"""Coupon usage-limit race harness.
+
+Creates a coupon with a usage limit, creates more orders than the limit allows
+for several customers, then applies the coupon to all of them at the same time
+with `GenericCouponsHelper.apply_coupon_to_order`. WooCommerce validates the
+usage limit and increments the usage count in separate steps, so concurrent
+applications can redeem the coupon more often than allowed. After the burst the
+usage count, 'used_by' entries and the orders carrying the coupon are compared
+through the API and CouponsDAO.
+"""
+import random
+import threading
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+from demostore_automation.src.api_helpers.CouponAPIHelper import CouponAPIHelper
+from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
+from demostore_automation.src.dao.coupons_dao import CouponsDAO
+from demostore_automation.src.dao.customers_dao import CustomersDAO
+from demostore_automation.src.dao.products_dao import ProductsDAO
+from demostore_automation.src.generic_helpers.generic_coupons_helper import GenericCouponsHelper
+from demostore_automation.src.generic_helpers.generic_orders_helper import GenericOrdersHelper
+from demostore_automation.src.utilities.apiMetricsUtility import LatencyHistogram
+from demostore_automation.src.utilities.genericUtilities import generate_random_string
+
+
+def check_usage_invariants(usage_limit, accepted, api_coupon, db_usage, orders_with_coupon, usage_limit_per_user=None):
+    """Compare the coupon usage bookkeeping with what was actually redeemed.
+
+    Args:
+        usage_limit (int): Usage limit set on the coupon.
+        accepted (int): Applications the API answered with 200.
+        api_coupon (dict): GET coupon API response.
+        db_usage (dict): CouponsDAO.get_coupon_usage result.
+        orders_with_coupon (list[dict]): Orders whose 'coupon_lines' contain the coupon,
+            each with 'id' and 'customer' (user id or billing email).
+        usage_limit_per_user (int, optional): Per customer limit set on the coupon.
+
+    Returns:
+        list[str]: One message per broken invariant, empty if the bookkeeping is consistent.
+    """
+    violations = []
+    redeemed = len(orders_with_coupon)
+    if redeemed > usage_limit:
+        violations.append(f"Over-redemption: coupon is on {redeemed} orders, usage limit is {usage_limit}")
+    if accepted != redeemed:
+        violations.append(f"{accepted} applications were accepted but the coupon is on {redeemed} orders")
+    if api_coupon['usage_count'] > usage_limit:
+        violations.append(f"API usage_count {api_coupon['usage_count']} exceeds usage limit {usage_limit}")
+    if api_coupon['usage_count'] != redeemed:
+        violations.append(f"API usage_count {api_coupon['usage_count']} does not match {redeemed} redeemed orders")
+    if db_usage['usage_count'] != api_coupon['usage_count']:
+        violations.append(f"DB usage_count {db_usage['usage_count']} does not match API usage_count "
+                          f"{api_coupon['usage_count']}")
+    if len(api_coupon['used_by']) != api_coupon['usage_count']:
+        violations.append(f"API used_by has {len(api_coupon['used_by'])} entries for usage_count "
+                          f"{api_coupon['usage_count']}")
+    if sorted(map(str, db_usage['used_by'])) != sorted(map(str, api_coupon['used_by'])):
+        violations.append(f"DB used_by {db_usage['used_by']} does not match API used_by {api_coupon['used_by']}")
+    if usage_limit_per_user:
+        per_customer = {}
+        for order in orders_with_coupon:
+            per_customer[order['customer']] = per_customer.get(order['customer'], 0) + 1
+        for customer, count in per_customer.items():
+            if count > usage_limit_per_user:
+                violations.append(f"Over-redemption: customer {customer} redeemed {count} times, "
+                                  f"per user limit is {usage_limit_per_user}")
+    return violations
+
+
+class CouponContention:
+    """Fires concurrent coupon applications against a usage-limited coupon.
+
+    Attributes:
+        orders (int): Number of orders the coupon is applied to. Should exceed `usage_limit`.
+        concurrency (int): Number of applications in flight at the same time.
+        usage_limit (int): Usage limit of the coupon.
+        usage_limit_per_user (int): Per customer usage limit of the coupon, None for no limit.
+        customers (int): Number of distinct customers the orders are spread over.
+        barrier_timeout (float): Seconds a worker waits for the rest of its batch before giving up.
+        coupon (dict): Coupon created by `setup`.
+        order_ids (list[int]): Orders created by `setup`, deleted by `cleanup`.
+    """
+
+    def __init__(self, orders=20, concurrency=10, usage_limit=5, usage_limit_per_user=None, customers=5,
+                 barrier_timeout=60):
+        self.orders = orders
+        self.concurrency = concurrency
+        self.usage_limit = usage_limit
+        self.usage_limit_per_user = usage_limit_per_user
+        self.customers = customers
+        self.barrier_timeout = barrier_timeout
+        self.coupon = None
+        self.order_ids = []
+        self.orders_by_id = {}
+        self._local = threading.local()
+
+    def _helper(self):
+        # the API helpers keep per-request state, so every thread needs its own
+        helper = getattr(self._local, 'helper', None)
+        if helper is None:
+            helper = self._local.helper = GenericCouponsHelper()
+        return helper
+
+    def setup(self):
+        """Create the usage-limited coupon and the orders for random customers."""
+        payload = {
+            "code": generate_random_string(),
+            "discount_type": "percent",
+            "amount": "10",
+            "usage_limit": self.usage_limit,
+        }
+        if self.usage_limit_per_user:
+            payload["usage_limit_per_user"] = self.usage_limit_per_user
+        self.coupon = CouponAPIHelper().call_create_coupon(payload, expected_status_code=201)
+        logger.info(f"Created coupon {self.coupon['code']} with usage limit {self.usage_limit}")
+
+        customers = CustomersDAO().get_random_customer_from_db(qty=self.customers)
+        product_id = ProductsDAO().get_random_product_from_db(qty=1)[0]['ID']
+        generic_orders_helper = GenericOrdersHelper()
+        for i in range(self.orders):
+            customer = customers[i % len(customers)]
+            order = generic_orders_helper.create_order_for_customer(customer['ID'], product_id)[0]
+            self.order_ids.append(order['id'])
+            self.orders_by_id[order['id']] = customer
+        logger.info(f"Created {len(self.order_ids)} orders for {len(customers)} customers")
+
+    def _apply(self, order_id, barrier):
+        try:
+            helper = self._helper()
+        except Exception:
+            barrier.abort()  # the rest of the batch would otherwise wait for this worker forever
+            raise
+        try:
+            barrier.wait(timeout=self.barrier_timeout)  # release a whole batch at once to widen the race window
+        except threading.BrokenBarrierError:
+            # a worker of the batch failed or timed out, the application is not sent
+            return order_id, None, 0.0, None
+        start = time.perf_counter()
+        try:
+            helper.apply_coupon_to_order(self.coupon['code'], order_id)
+            error = None
+        except AssertionError as e:
+            error = e
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return order_id, helper.orders_api_helper.woo_api_utility.status_code, elapsed_ms, error
+
+    def fire(self):
+        """Apply the coupon to all orders, `concurrency` at a time.
+
+        Returns:
+            dict: Accepted and rejected applications, applications not sent because their batch
+                barrier broke, status codes, latency and throughput.
+        """
+        order_ids = list(self.order_ids)
+        random.shuffle(order_ids)
+        latency = LatencyHistogram()
+        accepted, not_sent, status_codes, error_samples = [], [], {}, []
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='coupon') as executor:
+            for i in range(0, len(order_ids), self.concurrency):
+                batch = order_ids[i:i + self.concurrency]
+                barrier = threading.Barrier(len(batch))
+                for order_id, status_code, elapsed_ms, error in executor.map(lambda o: self._apply(o, barrier), batch):
+                    if status_code is None:
+                        not_sent.append(order_id)
+                        continue
+                    latency.add(elapsed_ms, status_code, 0)
+                    status_codes[status_code] = status_codes.get(status_code, 0) + 1
+                    if error is None:
+                        accepted.append(order_id)
+                    elif len(error_samples) < 5:
+                        error_samples.append(str(error)[:300])
+        duration = time.perf_counter() - start
+
+        return {
+            "applications": len(order_ids),
+            "accepted": len(accepted),
+            "accepted_order_ids": accepted,
+            "rejected": len(order_ids) - len(accepted) - len(not_sent),
+            "not_sent": len(not_sent),
+            "status_codes": status_codes,
+            "duration_s": round(duration, 2),
+            "throughput_rps": round(len(order_ids) / duration, 2) if duration else 0.0,
+            "p50_ms": latency.percentile(50),
+            "p95_ms": latency.percentile(95),
+            "max_ms": round(latency.max_ms, 2),
+            "rejection_samples": error_samples,
+        }
+
+    def verify(self, burst):
+        """Check the usage invariants after a burst.
+
+        Args:
+            burst (dict): Result of `fire`.
+
+        Returns:
+            dict: API and DB usage, redeemed orders and the list of violations.
+        """
+        api_coupon = CouponAPIHelper().call_retrieve_coupon(self.coupon['id'])
+        db_usage = CouponsDAO().get_coupon_usage(self.coupon['id'])
+
+        orders_api_helper = OrdersAPIHelper()
+        code = self.coupon['code'].lower()
+        orders_with_coupon = []
+        for order_id in self.order_ids:
+            order = orders_api_helper.call_retrieve_order(order_id, fields=["id", "coupon_lines", "customer_id",
+                                                                          "billing"])
+            if any(line['code'].lower() == code for line in order['coupon_lines']):
+                orders_with_coupon.append({"id": order_id, "customer": order['customer_id'] or order['billing']['email']})
+
+        violations = check_usage_invariants(self.usage_limit, burst['accepted'], api_coupon, db_usage,
+                                            orders_with_coupon, self.usage_limit_per_user)
+        over_redemption = max(len(orders_with_coupon) - self.usage_limit, 0)
+        for violation in violations:
+            logger.error(violation)
+        return {
+            "api_usage_count": api_coupon['usage_count'],
+            "db_usage_count": db_usage['usage_count'],
+            "redeemed_orders": [o['id'] for o in orders_with_coupon],
+            "over_redemption": over_redemption,
+            "violations": violations,
+        }
+
+    def run(self):
+        """Set up, fire and verify.
+
+        Returns:
+            dict: Configuration, burst result and verification result.
+        """
+        self.setup()
+        burst = self.fire()
+        logger.info(f"Coupon burst: {burst['accepted']} accepted, {burst['rejected']} rejected "
+                    f"at {burst['throughput_rps']}/s")
+        return {
+            "config": {"orders": self.orders, "concurrency": self.concurrency, "usage_limit": self.usage_limit,
+                       "usage_limit_per_user": self.usage_limit_per_user, "customers": self.customers},
+            "burst": burst,
+            "verification": self.verify(burst),
+        }
+
+    def cleanup(self):
+        """Delete the orders and the coupon created by `setup`."""
+        orders_api_helper = OrdersAPIHelper()
+        for order_id in self.order_ids:
+            try:
+                orders_api_helper.call_delete_order(order_id, parse_response=False)
+            except Exception as e:
+                logger.error(f"Could not delete order id: {order_id}. Error: {e}")
+        if self.coupon:
+            CouponAPIHelper().call_delete_coupon(self.coupon['id'], parse_response=False)
+        logger.info(f"Deleted {len(self.order_ids)} orders and coupon {self.coupon and self.coupon['id']}")
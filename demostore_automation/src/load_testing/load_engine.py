@@ -0,0 +1,257 @@
+"""Open-loop load generation engine for the WooCommerce store.
+
+Arrivals are scheduled from a LoadProfile (ramp-up, hold, ramp-down) regardless
+of how fast the store responds, so a slow store builds a backlog instead of
+silently lowering the offered load. A pool of asyncio workers takes arrivals
+from a queue and runs the blocking scenario functions (built on the API helpers)
+in a thread pool. Latency is measured from the scheduled arrival time, so
+queueing delay is included and the reported percentiles are not hidden by
+coordinated omission.
+"""
+import asyncio
+import json
+import os
+import random
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+from demostore_automation.src.utilities.apiMetricsUtility import LatencyHistogram
+
+
+class LoadScenario:
+    """A weighted unit of work executed by the load engine.
+
+    Attributes:
+        name (str): Scenario name used in reports.
+        weight (float): Relative probability of the scenario being picked for an arrival.
+        func (callable): Blocking function performing the scenario. Any exception counts as an error.
+    """
+
+    def __init__(self, name, weight, func):
+        self.name = name
+        self.weight = weight
+        self.func = func
+
+
+class LoadProfile:
+    """Arrival rate over time: linear ramp-up, constant hold, linear ramp-down.
+
+    Attributes:
+        target_rps (float): Arrival rate during the hold phase, in scenarios per second.
+        ramp_up (float): Ramp-up duration in seconds.
+        hold (float): Hold duration in seconds.
+        ramp_down (float): Ramp-down duration in seconds.
+        poisson (bool): Use exponentially distributed inter-arrival times instead of fixed pacing.
+    """
+
+    def __init__(self, target_rps, ramp_up=30, hold=60, ramp_down=30, poisson=True):
+        if target_rps <= 0:
+            raise ValueError(f"target_rps must be greater than 0. Actual: {target_rps}")
+        self.target_rps = target_rps
+        self.ramp_up = ramp_up
+        self.hold = hold
+        self.ramp_down = ramp_down
+        self.poisson = poisson
+
+    @property
+    def duration(self):
+        return self.ramp_up + self.hold + self.ramp_down
+
+    def rate_at(self, elapsed):
+        """Return the target arrival rate at `elapsed` seconds into the run."""
+        if elapsed < 0 or elapsed >= self.duration:
+            return 0.0
+        if elapsed < self.ramp_up:
+            return self.target_rps * elapsed / self.ramp_up
+        if elapsed < self.ramp_up + self.hold:
+            return self.target_rps
+        return self.target_rps * (self.duration - elapsed) / self.ramp_down
+
+    def arrival_times(self, rng=None, step=0.002):
+        """Yield arrival offsets in seconds from the start of the run.
+
+        Arrivals are placed where the cumulative expected arrival count (the integral
+        of `rate_at`) crosses the next threshold: unit spacing for fixed pacing,
+        exponentially distributed spacing for Poisson arrivals.
+
+        Args:
+            rng (random.Random, optional): Random generator for Poisson arrivals.
+            step (float, optional): Integration step in seconds. Defaults to 2 ms.
+
+        Yields:
+            float: Offset of the next arrival.
+        """
+        rng = rng or random.Random()
+        next_gap = (lambda: rng.expovariate(1.0)) if self.poisson else (lambda: 1.0)
+        threshold = next_gap()
+        cumulative = 0.0
+        elapsed = 0.0
+        while elapsed < self.duration:
+            cumulative += self.rate_at(elapsed) * step
+            elapsed += step
+            while cumulative >= threshold:
+                yield elapsed
+                threshold += next_gap()
+
+
+class ScenarioStats:
+    """Latency and error counts for one scenario, for the whole run and the current report window."""
+
+    def __init__(self):
+        self.total = LatencyHistogram()
+        self.window = LatencyHistogram()
+        self.errors = 0
+        self.window_errors = 0
+        self.error_samples = []
+
+    def add(self, latency_ms, error=None):
+        status = 'error' if error else 'ok'
+        self.total.add(latency_ms, status, 0)
+        self.window.add(latency_ms, status, 0)
+        if error:
+            self.errors += 1
+            self.window_errors += 1
+            if len(self.error_samples) < 5:
+                self.error_samples.append(repr(error)[:300])
+
+    def reset_window(self):
+        self.window = LatencyHistogram()
+        self.window_errors = 0
+
+
+class LoadEngine:
+    """Drives weighted scenarios against the store with an open-loop arrival rate.
+
+    Attributes:
+        scenarios (list[LoadScenario]): Scenarios to pick from for every arrival.
+        profile (LoadProfile): Arrival rate over time.
+        concurrency (int): Number of asyncio workers, and threads executing scenarios.
+        report_interval (float): Seconds between live progress lines.
+        stats (dict): Maps scenario name to ScenarioStats.
+        timeline (list[dict]): One live snapshot per report interval.
+    """
+
+    def __init__(self, scenarios, profile, concurrency=20, report_interval=5, seed=None):
+        if not scenarios:
+            raise ValueError("At least one scenario is required.")
+        self.scenarios = scenarios
+        self.profile = profile
+        self.concurrency = concurrency
+        self.report_interval = report_interval
+        self.rng = random.Random(seed)
+        self.stats = {s.name: ScenarioStats() for s in scenarios}
+        self.timeline = []
+        self.scheduled = 0
+        self.completed = 0
+        self.in_flight = 0
+        self._queue = None
+
+    async def _schedule_arrivals(self, start):
+        weights = [s.weight for s in self.scenarios]
+        for offset in self.profile.arrival_times(self.rng):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            scenario = self.rng.choices(self.scenarios, weights=weights)[0]
+            self._queue.put_nowait((scenario, start + offset))
+            self.scheduled += 1
+        for _ in range(self.concurrency):
+            self._queue.put_nowait(None)
+
+    async def _worker(self, executor):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            scenario, scheduled_at = item
+            self.in_flight += 1
+            error = None
+            try:
+                await loop.run_in_executor(executor, scenario.func)
+            except Exception as e:
+                error = e
+            finally:
+                self.in_flight -= 1
+            self.completed += 1
+            self.stats[scenario.name].add((time.perf_counter() - scheduled_at) * 1000, error)
+
+    async def _report_progress(self, start):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            elapsed = time.perf_counter() - start
+            snapshot = {
+                "elapsed_s": round(elapsed, 1),
+                "target_rps": round(self.profile.rate_at(elapsed), 2),
+                "throughput_rps": round(sum(s.window.total_calls for s in self.stats.values()) / self.report_interval, 2),
+                "errors": sum(s.window_errors for s in self.stats.values()),
+                "backlog": self._queue.qsize(),
+                "in_flight": self.in_flight,
+                "scenarios": {name: {"calls": s.window.total_calls, "p50_ms": s.window.percentile(50),
+                                     "p95_ms": s.window.percentile(95), "p99_ms": s.window.percentile(99)}
+                              for name, s in self.stats.items() if s.window.total_calls},
+            }
+            self.timeline.append(snapshot)
+            for s in self.stats.values():
+                s.reset_window()
+            latencies = " ".join(f"{name}[p50={v['p50_ms']:.0f} p95={v['p95_ms']:.0f} p99={v['p99_ms']:.0f}]"
+                                 for name, v in snapshot['scenarios'].items())
+            logger.info(f"t={snapshot['elapsed_s']}s target={snapshot['target_rps']}/s "
+                        f"throughput={snapshot['throughput_rps']}/s errors={snapshot['errors']} "
+                        f"backlog={snapshot['backlog']} in_flight={snapshot['in_flight']} {latencies}")
+
+    async def _run(self):
+        self._queue = asyncio.Queue()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='load') as executor:
+            reporter = asyncio.create_task(self._report_progress(start))
+            workers = [asyncio.create_task(self._worker(executor)) for _ in range(self.concurrency)]
+            await self._schedule_arrivals(start)
+            await asyncio.gather(*workers)
+            reporter.cancel()
+        return time.perf_counter() - start
+
+    def run(self):
+        """Run the load profile to completion.
+
+        Returns:
+            dict: Summary of the run (see `summary`).
+        """
+        logger.info(f"Starting load: target={self.profile.target_rps}/s ramp_up={self.profile.ramp_up}s "
+                    f"hold={self.profile.hold}s ramp_down={self.profile.ramp_down}s concurrency={self.concurrency}")
+        duration = asyncio.run(self._run())
+        return self.summary(duration)
+
+    def summary(self, duration):
+        """Build the run summary with per-scenario percentiles, throughput and error rate."""
+        scenarios = {}
+        for name, s in self.stats.items():
+            calls = s.total.total_calls
+            scenarios[name] = {
+                "calls": calls,
+                "errors": s.errors,
+                "error_rate": round(s.errors / calls, 4) if calls else 0.0,
+                "throughput_rps": round(calls / duration, 2) if duration else 0.0,
+                "p50_ms": s.total.percentile(50),
+                "p95_ms": s.total.percentile(95),
+                "p99_ms": s.total.percentile(99),
+                "max_ms": round(s.total.max_ms, 2),
+                "error_samples": s.error_samples,
+            }
+        peak = max(self.timeline, key=lambda t: t['throughput_rps'], default=None)
+        return {
+            "duration_s": round(duration, 1),
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "throughput_rps": round(self.completed / duration, 2) if duration else 0.0,
+            "peak_throughput_rps": peak['throughput_rps'] if peak else None,
+            "scenarios": scenarios,
+            "timeline": self.timeline,
+        }
+
+    @staticmethod
+    def write_json(summary, file_path):
+        """Write a run summary to a JSON file, creating the directory if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w') as f:
+            json.dump(summary, f, indent=2)
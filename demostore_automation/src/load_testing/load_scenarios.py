@@ -0,0 +1,107 @@
+"""Store scenarios for the load engine, built on the existing API and generic helpers.
+
+The helpers keep per-request state (status code, last response), so every worker
+thread gets its own helper instances. Orders created during the run are tracked
+and deleted by `cleanup`.
+"""
+import random
+import threading
+import logging as logger
+from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
+from demostore_automation.src.api_helpers.ProductsAPIHelper import ProductsAPIHelper
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.generic_helpers.generic_coupons_helper import GenericCouponsHelper
+from demostore_automation.src.generic_helpers.generic_orders_helper import GenericOrdersHelper
+from demostore_automation.src.load_testing.load_engine import LoadScenario
+
+DEFAULT_MIX = {
+    "browse_products": 60,
+    "create_order": 20,
+    "apply_coupon": 10,
+    "refund_order": 10,
+}
+
+
+class StoreScenarios:
+    """Scenario functions for browsing products, creating orders, applying coupons and refunds.
+
+    Attributes:
+        product_ids (list[int]): Purchasable products used for browsing and order line items.
+        coupon_code (str): Coupon applied by the 'apply_coupon' scenario.
+        created_order_ids (list[int]): Orders created during the run, deleted by `cleanup`.
+    """
+
+    def __init__(self, product_ids=None, coupon_code=None):
+        self._local = threading.local()
+        self.product_ids = product_ids or self.fetch_purchasable_product_ids()
+        if not self.product_ids:
+            raise Exception("No purchasable products found in the store to run load scenarios with.")
+        self.coupon_code = coupon_code or MainConfigs.get_coupon_code('50_OFF')
+        self.created_order_ids = []
+
+    @staticmethod
+    def fetch_purchasable_product_ids():
+        """Return the ids of published, in-stock simple products."""
+        products = ProductsAPIHelper().call_get_all_products(
+            use_cache=True, fields=["id", "type", "purchasable", "stock_status"])
+        return [p['id'] for p in products
+                if p['type'] == 'simple' and p['purchasable'] and p['stock_status'] == 'instock']
+
+    def _helpers(self):
+        helpers = getattr(self._local, 'helpers', None)
+        if helpers is None:
+            helpers = self._local.helpers = {
+                "products_api_helper": ProductsAPIHelper(),
+                "orders_api_helper": OrdersAPIHelper(),
+                "generic_orders_helper": GenericOrdersHelper(),
+                "generic_coupons_helper": GenericCouponsHelper(),
+            }
+        return helpers
+
+    def _create_order(self):
+        line_items = [{"product_id": random.choice(self.product_ids), "quantity": random.randint(1, 3)}]
+        order = self._helpers()["generic_orders_helper"].create_order(additional_args={"line_items": line_items})[0]
+        self.created_order_ids.append(order['id'])
+        return order
+
+    def browse_products(self):
+        self._helpers()["products_api_helper"].call_get_product_by_id(random.choice(self.product_ids))
+
+    def create_order(self):
+        self._create_order()
+
+    def apply_coupon(self):
+        order = self._create_order()
+        self._helpers()["generic_coupons_helper"].apply_coupon_to_order(self.coupon_code, order['id'])
+
+    def refund_order(self):
+        order = self._create_order()
+        self._helpers()["generic_orders_helper"].create_order_refund(order, 'partial')
+
+    def build(self, mix=None):
+        """Build the weighted LoadScenario list.
+
+        Args:
+            mix (dict, optional): Maps scenario name to weight. Defaults to DEFAULT_MIX.
+
+        Returns:
+            list[LoadScenario]: Scenarios with a weight above 0.
+
+        Raises:
+            ValueError: If the mix names an unknown scenario.
+        """
+        mix = mix or DEFAULT_MIX
+        unknown = set(mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f"Unknown scenario(s) {sorted(unknown)}. Available: {list(DEFAULT_MIX)}")
+        return [LoadScenario(name, weight, getattr(self, name)) for name, weight in mix.items() if weight > 0]
+
+    def cleanup(self):
+        """Delete all orders created during the run."""
+        orders_api_helper = OrdersAPIHelper()
+        for order_id in self.created_order_ids:
+            try:
+                orders_api_helper.call_delete_order(order_id, parse_response=False)
+            except Exception as e:
+                logger.error(f"Could not delete order id: {order_id}. Error: {e}")
+        logger.info(f"Deleted {len(self.created_order_ids)} orders created by the load run")
@@ -15,7 +15,7 @@ class CartPage(CartPageLocators):
     def go_to_cart_page(self):
         base_url = MainConfigs.get_base_url()
         cart_url = base_url + self.endpoint
-        self.driver.get(cart_url)
+        self.sl.go_to_url(cart_url, page_name='cart')
 
     def get_cart_header(self):
         return self.sl.wait_and_get_text(self.CART_HEADER)
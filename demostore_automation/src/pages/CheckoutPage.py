@@ -16,7 +16,7 @@ class CheckoutPage(CheckoutPageLocators):
     def go_to_checkout_page(self):
         base_url = MainConfigs.get_base_url()
         checkout_url = base_url + self.endpoint
-        self.driver.get(checkout_url)
+        self.sl.go_to_url(checkout_url, page_name='checkout')
 
     def input_billing_first_name(self, first_name=None):
         first_name = first_name if first_name else 'AutomationFname'
@@ -11,7 +11,7 @@ class HomePage(HomePageLocators):
 
     def go_to_home_page(self):
         base_url = MainConfigs.get_base_url()
-        self.driver.get(base_url)
+        self.sl.go_to_url(base_url, page_name='home')
 
     def click_first_add_to_cart_button(self):
         self.sl.wait_and_click(self.ADD_TO_CART_BTN)
@@ -17,7 +17,7 @@ class MyAccountSignedOutPage(MyAccountSignedOutPageLocators):
     def go_to_my_account(self):
         base_url = MainConfigs.get_base_url()
         my_account_url = base_url + self.endpoint
-        self.driver.get(my_account_url)
+        self.sl.go_to_url(my_account_url, page_name='my_account')
 
     def input_login_username(self, username):
         self.sl.wait_and_input_text(self.LOGIN_USER_NAME, username)
@@ -34,7 +34,7 @@ class ProductDescriptionPage(ProductDescriptionPageLocators):
         """
         base_url = MainConfigs.get_base_url()
         product_url = f"{base_url}/{product_endpoint}"
-        self.sl.go_to_url(product_url)
+        self.sl.go_to_url(product_url, page_name='pdp')
 
     def get_displayed_product_name(self):
         """Gets the product name displayed on the page.
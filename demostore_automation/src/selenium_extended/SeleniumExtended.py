@@ -1,10 +1,12 @@
 
 import time
+import logging as logger
 
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.ui import Select
+from demostore_automation.src.utilities.pagePerfUtility import collect_page_performance, page_perf_store
 
 class SeleniumExtended:
     """Helper class extending Selenium WebDriver with convenience methods and smart waits.
@@ -26,13 +28,42 @@ class SeleniumExtended:
         self.driver = driver
         self.default_timeout = 5
 
-    def go_to_url(self, url):
+    def go_to_url(self, url, page_name=None):
         """Navigate to a specific URL.
 
+        When page performance collection is enabled, the navigation timing and
+        Web Vitals of the loaded page are recorded for the current test.
+
         Args:
             url (str): The URL to navigate to.
+            page_name (str, optional): Logical page name for performance reporting. Defaults to the URL.
         """
         self.driver.get(url)
+        if page_perf_store.enabled:
+            self.record_page_performance(page_name or url, url)
+
+    def record_page_performance(self, page_name, url=None):
+        """Collect navigation timing and Web Vitals for the currently loaded page.
+
+        Can also be called after navigations triggered by clicks. Collection errors
+        are logged and never fail the test.
+
+        Args:
+            page_name (str): Logical page name for performance reporting (e.g. 'cart').
+            url (str, optional): Requested URL. Defaults to the driver's current URL.
+
+        Returns:
+            dict or None: The collected record, or None if collection failed.
+        """
+        try:
+            record = collect_page_performance(self.driver, page_name, url)
+        except WebDriverException as e:
+            logger.warning(f"Could not collect page performance for '{page_name}': {e}")
+            return None
+        page_perf_store.add(record)
+        logger.info(f"Page performance '{page_name}': TTFB={record['ttfb_ms']}ms LCP={record['lcp_ms']}ms "
+                    f"CLS={record['cls']} requests={record['request_count']} bytes={record['transfer_bytes']}")
+        return record
 
     def wait_and_input_text(self, locator, text, timeout=None):
         """Wait for visibility of element, then input text.
@@ -0,0 +1,218 @@
+"""Lightweight latency instrumentation for WooCommerce API calls.
+
+Every request sent through WooAPIUtility is recorded into a fixed-bucket
+histogram keyed by HTTP method and normalized endpoint template
+(e.g. 'orders/{id}/notes/{id}'). Recording is a bisect plus a few integer
+increments, so it stays enabled for every run. At the end of the session
+the collected data is summarized (p50/p95/p99, call counts, slowest calls)
+for the terminal, JUnit properties and a JSON file.
+"""
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+
+# Upper bounds (ms) of the histogram buckets. Anything slower lands in the overflow bucket.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 75, 100, 150, 200, 300, 400, 500, 750,
+                      1000, 1500, 2000, 3000, 5000, 10000)
+
+_ID_SEGMENT = re.compile(r'^\d+$')
+
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(endpoint):
+    """Convert a concrete endpoint into its template by replacing numeric ids.
+
+    Args:
+        endpoint (str): Endpoint as passed to WooAPIUtility, e.g. 'orders/123/notes/45'.
+
+    Returns:
+        str: Normalized endpoint template, e.g. 'orders/{id}/notes/{id}'.
+    """
+    segments = endpoint.strip('/').split('/')
+    return '/'.join('{id}' if _ID_SEGMENT.match(s) else s for s in segments)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for a single method + endpoint template.
+
+    Attributes:
+        counts (list[int]): Number of calls per bucket (last item is the overflow bucket).
+        total_calls (int): Number of recorded calls.
+        total_ms (float): Sum of all latencies in milliseconds.
+        max_ms (float): Slowest recorded latency in milliseconds.
+        total_bytes (int): Sum of response payload sizes in bytes.
+        status_codes (dict): Count of calls per HTTP status code.
+    """
+
+    __slots__ = ('counts', 'total_calls', 'total_ms', 'max_ms', 'total_bytes', 'status_codes')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_bytes = 0
+        self.status_codes = {}
+
+    def add(self, latency_ms, status_code, payload_size):
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.total_calls += 1
+        self.total_ms += latency_ms
+        self.total_bytes += payload_size
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+    def percentile(self, pct):
+        """Estimate a percentile from the bucket counts.
+
+        The upper bound of the bucket containing the requested rank is returned,
+        capped by the slowest recorded call.
+
+        Args:
+            pct (float): Percentile to estimate, between 0 and 100.
+
+        Returns:
+            float: Estimated latency in milliseconds.
+        """
+        if not self.total_calls:
+            return 0.0
+        rank = self.total_calls * pct / 100
+        cumulative = 0
+        for idx, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                if idx == len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                return min(float(LATENCY_BUCKETS_MS[idx]), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            "calls": self.total_calls,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 2),
+            "avg_ms": round(self.total_ms / self.total_calls, 2) if self.total_calls else 0.0,
+            "total_ms": round(self.total_ms, 2),
+            "total_bytes": self.total_bytes,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items(), key=lambda item: str(item[0]))},
+            "buckets_ms": dict(zip([str(b) for b in LATENCY_BUCKETS_MS] + ['inf'], self.counts)),
+        }
+
+
+class ApiMetrics:
+    """Collects per-endpoint latency histograms and the slowest individual calls.
+
+    A single shared instance (`api_metrics`) is used by WooAPIUtility; the
+    conftest keeps `current_test` up to date so slow calls can be traced back
+    to the test that made them.
+
+    Attributes:
+        histograms (dict): Maps (method, endpoint template) to LatencyHistogram.
+        slow_calls (list): Min-heap of the slowest calls, bounded by `max_slow_calls`.
+        current_test (str): Node id of the test currently running.
+        test_totals (dict): Maps test node id to [call count, total latency ms].
+    """
+
+    def __init__(self, max_slow_calls=20):
+        self.max_slow_calls = max_slow_calls
+        self.histograms = {}
+        self.slow_calls = []
+        # tiebreaker of equal latencies, so the heap never compares the None-able fields after it
+        self._sequence = itertools.count()
+        self.current_test = None
+        self.test_totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, endpoint, status_code, elapsed_seconds, payload_size=0):
+        """Record a single API call.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint as passed to WooAPIUtility.
+            status_code (int): HTTP status code of the response.
+            elapsed_seconds (float): Wall clock duration of the call.
+            payload_size (int, optional): Response body size in bytes. Defaults to 0.
+        """
+        latency_ms = elapsed_seconds * 1000
+        key = (method, normalize_endpoint(endpoint))
+        test_id = self.current_test
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.add(latency_ms, status_code, payload_size)
+
+            totals = self.test_totals.get(test_id)
+            if totals is None:
+                totals = self.test_totals[test_id] = [0, 0.0]
+            totals[0] += 1
+            totals[1] += latency_ms
+
+            entry = (latency_ms, next(self._sequence), method, endpoint, status_code, test_id)
+            if len(self.slow_calls) < self.max_slow_calls:
+                heapq.heappush(self.slow_calls, entry)
+            elif latency_ms > self.slow_calls[0][0]:
+                heapq.heapreplace(self.slow_calls, entry)
+
+    def get_test_totals(self, test_id):
+        """Return (call count, total latency ms) recorded for a test."""
+        calls, total_ms = self.test_totals.get(test_id, (0, 0.0))
+        return calls, round(total_ms, 2)
+
+    def summary(self):
+        """Build the session summary.
+
+        Returns:
+            dict: 'endpoints' sorted by total time and 'slowest_calls' sorted by latency.
+        """
+        with self._lock:
+            endpoints = [dict(method=method, endpoint=endpoint, **histogram.to_dict())
+                         for (method, endpoint), histogram in self.histograms.items()]
+            slowest = sorted(self.slow_calls, reverse=True)
+
+        endpoints.sort(key=lambda e: e['total_ms'], reverse=True)
+        return {
+            "total_calls": sum(e['calls'] for e in endpoints),
+            "endpoints": endpoints,
+            "slowest_calls": [{"latency_ms": round(latency, 2), "method": method, "endpoint": endpoint,
+                               "status_code": status_code, "test": test_id}
+                              for latency, _, method, endpoint, status_code, test_id in slowest],
+        }
+
+    def format_summary_lines(self, summary=None, top=10):
+        """Format the summary as plain text lines for the terminal report."""
+        summary = summary or self.summary()
+        lines = [f"{'method':<7}{'endpoint':<40}{'calls':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>10}"]
+        for e in summary['endpoints']:
+            lines.append(f"{e['method']:<7}{e['endpoint']:<40}{e['calls']:>7}{e['p50_ms']:>9.0f}"
+                         f"{e['p95_ms']:>9.0f}{e['p99_ms']:>9.0f}{e['max_ms']:>10.0f}")
+        if summary['slowest_calls']:
+            lines.append("")
+            lines.append(f"Top {min(top, len(summary['slowest_calls']))} slowest calls (ms):")
+            for call in summary['slowest_calls'][:top]:
+                lines.append(f"  {call['latency_ms']:>9.0f}  {call['method']} {call['endpoint']} "
+                             f"[{call['status_code']}]  {call['test']}")
+        return lines
+
+    def write_json(self, file_path, summary=None):
+        """Write the summary to a JSON file, creating the directory if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w') as f:
+            json.dump(summary or self.summary(), f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.slow_calls.clear()
+            self.test_totals.clear()
+
+
+api_metrics = ApiMetrics()
@@ -0,0 +1,207 @@
+"""Query timing and N+1 detection for DBUtility.
+
+Every statement run through DBUtility is reduced to a fingerprint (literals
+replaced by '?', whitespace collapsed) and its latency, row count and an
+estimate of the transferred bytes are aggregated per fingerprint. Counting
+fingerprints per test exposes N+1 patterns: the same query shape executed
+many times by one test, typically from a loop over ids.
+"""
+import json
+import os
+import re
+import threading
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql):
+    """Normalize a SQL statement so queries differing only by literal values match.
+
+    Args:
+        sql (str): The SQL statement.
+
+    Returns:
+        str: The fingerprint, e.g. "SELECT * FROM demostore.wp_posts WHERE ID = ?".
+    """
+    fingerprint = _STRING_LITERAL.sub('?', sql)
+    fingerprint = _NUMBER.sub('?', fingerprint)
+    fingerprint = _IN_LIST.sub('(?+)', fingerprint)
+    return _WHITESPACE.sub(' ', fingerprint).strip().rstrip(';').strip()
+
+
+def estimate_rows_size(rows):
+    """Estimate the payload size in bytes of a result set.
+
+    Strings and bytes count their length; every other value counts as 8 bytes.
+
+    Args:
+        rows (list[dict] or list[tuple]): Rows returned by the cursor.
+
+    Returns:
+        int: Estimated number of bytes.
+    """
+    size = 0
+    for row in rows:
+        values = row.values() if isinstance(row, dict) else row
+        for value in values:
+            size += len(value) if isinstance(value, (str, bytes)) else 8
+    return size
+
+
+class QueryStats:
+    """Aggregated statistics for one query fingerprint."""
+
+    __slots__ = ('calls', 'total_ms', 'max_ms', 'rows', 'bytes', 'sample_sql')
+
+    def __init__(self, sample_sql):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.sample_sql = sample_sql
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "rows": self.rows,
+            "bytes": self.bytes,
+        }
+
+
+class DBMetrics:
+    """Collects per-fingerprint query statistics and flags N+1 patterns per test.
+
+    A single shared instance (`db_metrics`) is used by DBUtility; the conftest
+    keeps `current_test` up to date and checks each test for N+1 patterns at teardown.
+
+    Attributes:
+        queries (dict): Maps fingerprint to QueryStats.
+        test_counts (dict): Maps test node id to {fingerprint: executions}.
+        n_plus_one (list[dict]): Flagged N+1 patterns.
+        connect_calls (int): Number of connections opened.
+        connect_ms (float): Total time spent opening connections.
+        open_connections (int): Connections opened and not yet closed.
+        current_test (str): Node id of the test currently running.
+    """
+
+    def __init__(self):
+        self.queries = {}
+        self.test_counts = {}
+        self.n_plus_one = []
+        self.connect_calls = 0
+        self.connect_ms = 0.0
+        self.open_connections = 0
+        self.current_test = None
+        self._lock = threading.Lock()
+
+    def record_connect(self, elapsed_seconds):
+        with self._lock:
+            self.connect_calls += 1
+            self.connect_ms += elapsed_seconds * 1000
+            self.open_connections += 1
+
+    def record_close(self):
+        with self._lock:
+            self.open_connections -= 1
+
+    def record(self, sql, elapsed_seconds, rows, payload_size):
+        """Record a single executed statement.
+
+        Args:
+            sql (str): The executed SQL.
+            elapsed_seconds (float): Time spent executing and fetching.
+            rows (int): Number of rows returned.
+            payload_size (int): Estimated bytes transferred.
+        """
+        latency_ms = elapsed_seconds * 1000
+        fingerprint = fingerprint_sql(sql)
+        with self._lock:
+            stats = self.queries.get(fingerprint)
+            if stats is None:
+                stats = self.queries[fingerprint] = QueryStats(sql)
+            stats.calls += 1
+            stats.total_ms += latency_ms
+            stats.rows += rows
+            stats.bytes += payload_size
+            if latency_ms > stats.max_ms:
+                stats.max_ms = latency_ms
+
+            counts = self.test_counts.setdefault(self.current_test, {})
+            counts[fingerprint] = counts.get(fingerprint, 0) + 1
+
+    def check_n_plus_one(self, test_id, threshold):
+        """Flag fingerprints executed at least `threshold` times by a test.
+
+        Args:
+            test_id (str): Node id of the test.
+            threshold (int): Number of executions of the same fingerprint that counts as N+1.
+
+        Returns:
+            list[dict]: The flagged patterns for this test ('test', 'fingerprint', 'count').
+        """
+        with self._lock:
+            counts = self.test_counts.get(test_id, {})
+            flagged = [{"test": test_id, "fingerprint": fingerprint, "count": count}
+                       for fingerprint, count in counts.items() if count >= threshold]
+            self.n_plus_one.extend(flagged)
+        return flagged
+
+    def summary(self):
+        """Build the session summary with fingerprints ranked by total time."""
+        with self._lock:
+            ranked = [dict(fingerprint=fingerprint, **stats.to_dict()) for fingerprint, stats in self.queries.items()]
+            n_plus_one = list(self.n_plus_one)
+            connect = {"calls": self.connect_calls, "total_ms": round(self.connect_ms, 2)}
+
+        ranked.sort(key=lambda q: q['total_ms'], reverse=True)
+        return {
+            "total_queries": sum(q['calls'] for q in ranked),
+            "connections": connect,
+            "fingerprints": ranked,
+            "n_plus_one": sorted(n_plus_one, key=lambda n: n['count'], reverse=True),
+        }
+
+    def sample_statements(self):
+        """Return one executed SQL statement per fingerprint."""
+        with self._lock:
+            return {fingerprint: stats.sample_sql for fingerprint, stats in self.queries.items()}
+
+    def format_summary_lines(self, summary=None, top=15, width=100):
+        """Format the summary as plain text lines for the terminal report."""
+        summary = summary or self.summary()
+        lines = [f"Connections opened: {summary['connections']['calls']} "
+                 f"({summary['connections']['total_ms']:.0f} ms total)",
+                 f"{'total ms':>10}{'calls':>7}{'avg ms':>9}{'rows':>8}  fingerprint"]
+        for q in summary['fingerprints'][:top]:
+            lines.append(f"{q['total_ms']:>10.0f}{q['calls']:>7}{q['avg_ms']:>9.1f}{q['rows']:>8}  "
+                         f"{q['fingerprint'][:width]}")
+        if summary['n_plus_one']:
+            lines.append("")
+            lines.append("Possible N+1 query patterns:")
+            for n in summary['n_plus_one']:
+                lines.append(f"  {n['count']}x  {n['fingerprint'][:width]}  {n['test']}")
+        return lines
+
+    def write_json(self, file_path, summary=None):
+        """Write the summary to a JSON file, creating the directory if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w') as f:
+            json.dump(summary or self.summary(), f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self.queries.clear()
+            self.test_counts.clear()
+            self.n_plus_one.clear()
+            self.connect_calls = 0
+            self.connect_ms = 0.0
+
+
+db_metrics = DBMetrics()
@@ -2,10 +2,33 @@
 
 import pymysql
 import os
+import time
 import logging as logger
+from demostore_automation.src.utilities.dbMetricsUtility import db_metrics, estimate_rows_size
 from demostore_automation.src.utilities.credentialsUtility import CredentialsUtility
 from demostore_automation.src.configs.MainConfigs import MainConfigs
 
+# ids per 'IN (...)' query, keeps statements well below max_allowed_packet
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def id_chunks(ids, chunk_size=IN_CLAUSE_CHUNK_SIZE):
+    """Yield comma separated chunks of unique integer ids for 'WHERE ... IN (...)' queries.
+
+    Args:
+        ids (iterable[int]): Ids to look up. Duplicates are dropped, order is kept.
+        chunk_size (int, optional): Max ids per chunk.
+
+    Yields:
+        str: e.g. '101, 102, 103'.
+
+    Raises:
+        ValueError: If an id is not an integer.
+    """
+    unique_ids = list(dict.fromkeys(int(i) for i in ids))
+    for start in range(0, len(unique_ids), chunk_size):
+        yield ", ".join(str(i) for i in unique_ids[start:start + chunk_size])
+
 class DBUtility(object):
 
     def __init__(self):
@@ -20,9 +43,11 @@ class DBUtility(object):
 
     def create_connection(self):
         logger.info(f"Connecting to database: {self.host}")
+        start = time.perf_counter()
         connection = pymysql.connect(host=self.host, user=self.creds['db_user'],
                                      password=self.creds['db_password'],
                                      port=self.port)
+        db_metrics.record_connect(time.perf_counter() - start)
         return connection
 
 
@@ -33,16 +58,103 @@ class DBUtility(object):
         try:
             logger.debug(f"Executing: {sql}")
             cur = conn.cursor(pymysql.cursors.DictCursor)
+            start = time.perf_counter()
             cur.execute(sql)
             rs_dict = cur.fetchall()
+            elapsed = time.perf_counter() - start
             cur.close()
+            db_metrics.record(sql, elapsed, len(rs_dict), estimate_rows_size(rs_dict))
         except Exception as e:
             raise Exception(f"Failed running sql: {sql} \n  Error: {str(e)}")
         finally:
             conn.close()
+            db_metrics.record_close()
 
         return rs_dict
 
 
+    def execute_select_records(self, sql, record_cls):
+        # rows as compact record objects (see src/dao/records.py) built from a tuple cursor,
+        # the query must select exactly the record's columns, in order
+
+        conn = self.create_connection()
+
+        try:
+            logger.debug(f"Executing: {sql}")
+            cur = conn.cursor()
+            start = time.perf_counter()
+            cur.execute(sql)
+            rows = cur.fetchall()
+            elapsed = time.perf_counter() - start
+            column_names = [column[0] for column in cur.description or ()]
+            cur.close()
+            db_metrics.record(sql, elapsed, len(rows), estimate_rows_size(rows))
+        except Exception as e:
+            raise Exception(f"Failed running sql: {sql} \n  Error: {str(e)}")
+        finally:
+            conn.close()
+            db_metrics.record_close()
+
+        record_cls.validate_columns(column_names)
+        return [record_cls(*row) for row in rows]
+
+
+    def iter_select(self, sql, record_cls=None, batch_size=1000):
+        """Yield the rows of a large query without loading the whole result set into memory.
+
+        Uses an unbuffered server-side cursor: rows are fetched `batch_size` at a time,
+        and only when the caller asks for more, so memory stays bounded by one batch
+        and a slow consumer holds the server back instead of piling up rows.
+        Each iterator holds its own connection until it is exhausted or closed.
+
+        Args:
+            sql (str): SELECT statement.
+            record_cls (type, optional): Record class (see src/dao/records.py) to build the rows as.
+                The query must select exactly its columns, in order. Defaults to dict rows.
+            batch_size (int, optional): Rows per fetch. Defaults to 1000.
+
+        Yields:
+            dict or Record: One row.
+
+        Raises:
+            Exception: If the query fails.
+        """
+        conn = self.create_connection()
+        cursor_class = pymysql.cursors.SSCursor if record_cls else pymysql.cursors.SSDictCursor
+        rows_count, payload_size, elapsed = 0, 0, 0.0
+        exhausted = False
+        try:
+            logger.debug(f"Executing (streaming): {sql}")
+            cur = conn.cursor(cursor_class)
+            try:
+                start = time.perf_counter()
+                cur.execute(sql)
+                elapsed += time.perf_counter() - start
+                if record_cls:
+                    record_cls.validate_columns([column[0] for column in cur.description or ()])
+                while True:
+                    start = time.perf_counter()
+                    rows = cur.fetchmany(batch_size)
+                    elapsed += time.perf_counter() - start
+                    if not rows:
+                        break
+                    rows_count += len(rows)
+                    payload_size += estimate_rows_size(rows)
+                    for row in rows:
+                        yield record_cls(*row) if record_cls else row
+                exhausted = True
+            except Exception as e:
+                raise Exception(f"Failed running sql: {sql} \n  Error: {str(e)}")
+            finally:
+                # closing an unbuffered cursor reads the rest of the result first, skip that when the
+                # caller stopped early, closing the connection discards it
+                if exhausted:
+                    cur.close()
+        finally:
+            conn.close()
+            db_metrics.record_close()
+            db_metrics.record(sql, elapsed, rows_count, payload_size)
+
+
     def execute_sql(self, sql):
         pass
\ No newline at end of file
@@ -2,10 +2,24 @@
 
 This module provides helper functions used for generating dynamic test data
 such as email addresses, passwords, and random strings.
+
+The `generate_bulk_*` functions return N values at once for bulk seeding and
+load tests. They draw all random bytes in one call, map them to characters with
+`bytes.translate` and slice the result, instead of building values one
+`random.choices` call at a time.
+
+Values the store requires to be unique (emails, usernames, coupon codes, product
+names, SKUs) are always drawn from `os.urandom` (or `random.Random(seed)` when a seed
+is passed explicitly), never from the global seed in seedUtility, so replaying a run
+with its seed does not re-create the records of the original run. Passwords, names
+and addresses follow the global seed.
 """
+import os
 import random
 import string
+import threading
 import logging as logger
+from demostore_automation.src.utilities.seedUtility import get_run_id, is_seeded, unique_random
 
 def generate_random_email_and_password(domain='supersqa.com', email_prefix='testuser', length=10):
     """Generates a random email and password combination.
@@ -18,7 +32,7 @@ def generate_random_email_and_password(domain='supersqa.com', email_prefix='test
     Returns:
         dict: A dictionary with keys 'email' and 'password'.
     """
-    random_string = ''.join(random.choices(string.ascii_lowercase, k=length))
+    random_string = ''.join(unique_random().choices(string.ascii_lowercase, k=length))
     # email = email_prefix + '_' + random_string + '@' + domain
     email = f'{email_prefix}_{random_string}@{domain}'
 
@@ -32,7 +46,7 @@ def generate_random_email_and_password(domain='supersqa.com', email_prefix='test
 
 
 def generate_random_string(prefix=None, suffix=None, length=15):
-    """Generates a random lowercase string with optional prefix and suffix.
+    """Generates a random lowercase string with optional prefix and suffix, unique across runs.
 
     Args:
         prefix (str, optional): String to prepend to the random string. Defaults to None.
@@ -44,8 +58,177 @@ def generate_random_string(prefix=None, suffix=None, length=15):
         if not overwritten.
     """
     prefix = prefix or "automation" # more pythonic that if-else statement
-    random_string = prefix + '_' + ''.join(random.choices(string.ascii_lowercase, k=length))
+    random_string = prefix + '_' + ''.join(unique_random().choices(string.ascii_lowercase, k=length))
     if suffix:
         random_string += suffix
     return random_string
 
+
+
+def fast_deepcopy(obj):
+    """Deep copies JSON-like data (dicts, lists and scalars).
+
+    Much faster than `copy.deepcopy` for parsed JSON payloads because it skips the
+    memo bookkeeping and only handles the types `json.load` produces.
+
+    Args:
+        obj (dict | list | str | int | float | bool | None): Data to copy.
+
+    Returns:
+        A copy sharing no dicts or lists with `obj`.
+    """
+    if isinstance(obj, dict):
+        return {k: fast_deepcopy(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [fast_deepcopy(v) for v in obj]
+    return obj
+
+
+# 32 and 64 character alphabets divide 256, so mapping random bytes onto them has no modulo bias
+_LOWER_ALNUM = string.ascii_lowercase + '234567'
+_ALNUM = string.ascii_letters + string.digits + '-_'
+_UPPER_ALNUM = string.ascii_uppercase + '234567'
+
+_FIRST_NAMES = ('James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
+                'William', 'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica',
+                'Thomas', 'Sarah', 'Charles', 'Karen', 'Daniel', 'Nancy', 'Matthew', 'Lisa',
+                'Anthony', 'Betty', 'Mark', 'Margaret', 'Donald', 'Sandra', 'Steven', 'Ashley')
+_LAST_NAMES = ('Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+               'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas',
+               'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson', 'White',
+               'Harris', 'Sanchez', 'Clark', 'Ramirez', 'Lewis', 'Robinson', 'Walker', 'Young')
+_STREETS = ('Market St', 'Main St', 'Oak Ave', 'Pine St', 'Maple Ave', 'Cedar Ln', 'Elm St', 'Lake Dr',
+            'Hill Rd', 'Park Ave', 'Sunset Blvd', 'Mission St', 'Broadway', 'Castro St', 'Valencia St', 'Howard St')
+_CITIES = (('San Francisco', 'CA', '941'), ('Los Angeles', 'CA', '900'), ('Austin', 'TX', '787'),
+           ('Dallas', 'TX', '752'), ('Seattle', 'WA', '981'), ('Portland', 'OR', '972'),
+           ('Denver', 'CO', '802'), ('Chicago', 'IL', '606'))
+
+_bulk_counter = [0]
+_bulk_counter_lock = threading.Lock()
+
+
+def _translate_table(alphabet):
+    return bytes((alphabet * (256 // len(alphabet) + 1))[:256], 'ascii')
+
+
+_TABLES = {alphabet: _translate_table(alphabet) for alphabet in (_LOWER_ALNUM, _ALNUM, _UPPER_ALNUM)}
+
+
+def _random_bytes(count, seed=None, unique=False):
+    if seed is not None:
+        return random.Random(seed).randbytes(count)
+    if is_seeded() and not unique:
+        return random.randbytes(count)
+    return os.urandom(count)
+
+
+def _random_chunks(n, length, alphabet, seed=None, unique=False):
+    """Return n random strings of `length` characters from a 32 or 64 character alphabet.
+
+    With `unique`, the global seed is ignored, see the module docstring.
+    """
+    chars = _random_bytes(n * length, seed, unique).translate(_TABLES[alphabet]).decode('ascii')
+    return [chars[i:i + length] for i in range(0, n * length, length)]
+
+
+def _unique_suffixes(n):
+    """Return n suffixes that are unique within the run, also across xdist workers and runs.
+
+    The suffix is the 4 character run id, the worker id, 'x' and a process wide counter
+    in hex, e.g. 'q7ztgw3x1f'. The worker id never contains 'x' and hex digits never do
+    either, so two workers can not produce the same suffix, and the run id keeps the
+    suffixes of two runs apart even when they count the same. Which counter values a
+    test gets depends on the tests before it, so the suffix is not part of the seeded data.
+    """
+    worker = get_run_id() + os.environ.get('PYTEST_XDIST_WORKER', 'm')
+    with _bulk_counter_lock:
+        # reserve the whole block so concurrent callers get disjoint ranges
+        start = _bulk_counter[0]
+        _bulk_counter[0] += n
+    return [f"{worker}x{i:x}" for i in range(start, start + n)]
+
+
+def generate_bulk_unique_strings(n, prefix=None, length=10, seed=None):
+    """Generates n unique random lowercase strings.
+
+    Args:
+        n (int): Number of strings.
+        prefix (str, optional): Prefix of every string. Defaults to 'automation'.
+        length (int, optional): Length of the random part. Defaults to 10.
+        seed (int, optional): Seed for a reproducible random part.
+
+    Returns:
+        list[str]: Strings like 'automation_k2mdq7zt4a_q7ztgw1x3f'. The suffix guarantees
+        uniqueness within a run and, through the run id, across runs.
+    """
+    prefix = prefix or "automation"
+    return [f"{prefix}_{r}_{u}"
+            for r, u in zip(_random_chunks(n, length, _LOWER_ALNUM, seed, unique=True), _unique_suffixes(n))]
+
+
+def generate_bulk_emails(n, domain='supersqa.com', email_prefix='testuser', length=10, seed=None):
+    """Generates n unique email addresses.
+
+    Args:
+        n (int): Number of emails.
+        domain (str, optional): The domain name for the emails. Defaults to 'supersqa.com'.
+        email_prefix (str, optional): The prefix for the email usernames. Defaults to 'testuser'.
+        length (int, optional): Length of the random part of the username. Defaults to 10.
+        seed (int, optional): Seed for a reproducible random part.
+
+    Returns:
+        list[str]: Unique emails.
+    """
+    return [f"{email_prefix}_{r}_{u}@{domain}"
+            for r, u in zip(_random_chunks(n, length, _LOWER_ALNUM, seed, unique=True), _unique_suffixes(n))]
+
+
+def generate_bulk_passwords(n, length=20, seed=None):
+    """Generates n random passwords of letters, digits, '-' and '_'.
+
+    Returns:
+        list[str]: Passwords of `length` characters.
+    """
+    return _random_chunks(n, length, _ALNUM, seed)
+
+
+def generate_bulk_skus(n, prefix='SKU', length=8, seed=None):
+    """Generates n unique uppercase SKUs, e.g. 'SKU-Q7ZT4AKM-K2MDGW1X3F'.
+
+    Returns:
+        list[str]: Unique SKUs.
+    """
+    return [f"{prefix}-{r}-{u.upper()}"
+            for r, u in zip(_random_chunks(n, length, _UPPER_ALNUM, seed, unique=True), _unique_suffixes(n))]
+
+
+def generate_bulk_names(n, seed=None):
+    """Generates n random first and last name pairs.
+
+    Returns:
+        list[dict]: Dicts with 'first_name' and 'last_name'.
+    """
+    data = _random_bytes(2 * n, seed)
+    return [{"first_name": _FIRST_NAMES[data[i] & 31], "last_name": _LAST_NAMES[data[i + 1] & 31]}
+            for i in range(0, 2 * n, 2)]
+
+
+def generate_bulk_addresses(n, seed=None):
+    """Generates n random US addresses in the WooCommerce billing/shipping format.
+
+    Returns:
+        list[dict]: Dicts with 'address_1', 'address_2', 'city', 'state', 'postcode' and 'country'.
+    """
+    data = _random_bytes(4 * n, seed)
+    addresses = []
+    for i in range(0, 4 * n, 4):
+        city, state, zip_prefix = _CITIES[data[i] & 7]
+        addresses.append({
+            "address_1": f"{(data[i + 1] << 2 | data[i + 2] & 3) + 1} {_STREETS[data[i + 2] >> 4]}",
+            "address_2": "",
+            "city": city,
+            "state": state,
+            "postcode": f"{zip_prefix}{data[i + 3] % 100:02d}",
+            "country": "US",
+        })
+    return addresses
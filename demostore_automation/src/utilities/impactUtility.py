@@ -0,0 +1,185 @@
+"""Test impact analysis: map tests to the framework files they depend on.
+
+Recording (`--impact-record`) traces function calls during every test and keeps
+the files under 'src' that were executed, plus the 'src' modules the test module
+imports (directly or transitively, so module and session fixtures count too).
+The map stores a sha256 per dependency, per test.
+
+Selecting (`--impact-select`) keeps only tests with a changed dependency, tests
+missing from the map, and tests whose own file changed. It falls back to the
+full suite when a file no test is mapped to changes (e.g. 'src/data' payloads)
+or a new file appears under 'src'.
+"""
+import ast
+import hashlib
+import json
+import os
+import sys
+import threading
+
+PACKAGE = 'demostore_automation'
+PACKAGE_DIR = os.path.realpath(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..'))
+SRC_DIR = os.path.join(PACKAGE_DIR, 'src')
+# every test depends on these
+GLOBAL_FILES = ('conftest.py', 'pytest.ini')
+
+
+def rel_path(path):
+    return os.path.relpath(os.path.realpath(path), PACKAGE_DIR).replace(os.sep, '/')
+
+
+def file_hash(rel):
+    """Return the sha256 of a file relative to the package dir, or None if it does not exist."""
+    try:
+        with open(os.path.join(PACKAGE_DIR, rel), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def list_tracked_files():
+    """Return all files under 'src' (except bytecode) and the global files, relative to the package dir."""
+    files = [f for f in GLOBAL_FILES if os.path.exists(os.path.join(PACKAGE_DIR, f))]
+    for dir_path, dir_names, file_names in os.walk(SRC_DIR):
+        dir_names[:] = [d for d in dir_names if d != '__pycache__']
+        files.extend(rel_path(os.path.join(dir_path, f)) for f in file_names if not f.endswith('.pyc'))
+    return sorted(files)
+
+
+def _module_to_path(module):
+    """Resolve a 'demostore_automation.*' module name to a file path, or None."""
+    base = os.path.join(os.path.dirname(PACKAGE_DIR), *module.split('.'))
+    for candidate in (base + '.py', os.path.join(base, '__init__.py')):
+        if os.path.isfile(candidate):
+            return os.path.realpath(candidate)
+    return None
+
+
+def static_imports(path, _seen=None):
+    """Return the framework files a module imports, transitively.
+
+    Args:
+        path (str): Path of the Python file.
+
+    Returns:
+        set[str]: Real paths of the imported 'demostore_automation' modules, including `path`.
+    """
+    seen = set() if _seen is None else _seen
+    path = os.path.realpath(path)
+    if path in seen:
+        return seen
+    seen.add(path)
+    try:
+        with open(path, 'r') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, UnicodeError):
+        return seen
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            # 'from package import module' imports the submodule
+            modules = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for module in modules:
+            if module.split('.')[0] == PACKAGE:
+                module_path = _module_to_path(module)
+                if module_path:
+                    static_imports(module_path, seen)
+    return seen
+
+
+class ImpactRecorder:
+    """Records the 'src' files executed while a test runs, using a call-event tracer.
+
+    Only 'call' events are handled and no local tracer is returned, so lines are
+    not traced and the overhead stays low.
+    """
+
+    def __init__(self):
+        self.current = None
+        self._is_src = {__file__: False}  # the recorder itself is not a dependency
+        self._src_prefix = SRC_DIR + os.sep
+
+    def _tracer(self, frame, event, arg):
+        filename = frame.f_code.co_filename
+        is_src = self._is_src.get(filename)
+        if is_src is None:
+            is_src = self._is_src[filename] = os.path.realpath(filename).startswith(self._src_prefix)
+        if is_src and self.current is not None:
+            self.current.add(filename)
+
+    def start(self):
+        self.current = set()
+        threading.settrace(self._tracer)
+        sys.settrace(self._tracer)
+
+    def stop(self):
+        sys.settrace(None)
+        threading.settrace(None)
+        files, self.current = self.current, None
+        return {rel_path(f) for f in files}
+
+
+class ImpactMap:
+    """Per test dependency hashes stored as JSON.
+
+    Attributes:
+        tests (dict): Maps test node id to {relative path: sha256} of its dependencies.
+        files (dict): Maps every tracked file to its sha256 at recording time.
+    """
+
+    def __init__(self, tests=None, files=None):
+        self.tests = tests or {}
+        self.files = files or {}
+        self._hashes = {}
+
+    @classmethod
+    def load(cls, file_path):
+        """Load a map, or return None if there is none yet."""
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+        return cls(data.get('tests'), data.get('files'))
+
+    def save(self, file_path):
+        with open(file_path, 'w') as f:
+            json.dump({"tests": self.tests, "files": self.files}, f, indent=1, sort_keys=True)
+
+    def current_hash(self, rel):
+        if rel not in self._hashes:
+            self._hashes[rel] = file_hash(rel)
+        return self._hashes[rel]
+
+    def record_test(self, nodeid, test_file, executed_files):
+        """Store the dependencies of a test: executed files, static imports of its module and the global files."""
+        deps = set(executed_files) | {rel_path(p) for p in static_imports(test_file)}
+        deps.update(f for f in GLOBAL_FILES if self.current_hash(f))
+        self.tests[nodeid] = {rel: self.current_hash(rel) for rel in sorted(deps)}
+
+    def update_files(self):
+        self.files = {rel: self.current_hash(rel) for rel in list_tracked_files()}
+
+    def merge(self, other):
+        self.tests.update(other.tests)
+        self.files.update(other.files)
+
+    def changed_unmapped_files(self):
+        """Return tracked files that changed or appeared and that no test depends on."""
+        mapped = {rel for deps in self.tests.values() for rel in deps}
+        return sorted(rel for rel in list_tracked_files()
+                      if rel not in mapped and self.files.get(rel) != self.current_hash(rel))
+
+    def is_impacted(self, nodeid):
+        """Return True if the test is unknown or one of its dependencies changed."""
+        deps = self.tests.get(nodeid)
+        if deps is None:
+            return True
+        return any(self.current_hash(rel) != sha for rel, sha in deps.items())
+
+
+impact_recorder = ImpactRecorder()
+recorded_impact = ImpactMap()
@@ -0,0 +1,95 @@
+"""Incremental parsing of JSON arrays from a streamed API response.
+
+`iter_json_array` yields the items of a top-level JSON array one at a time while
+the body arrives in chunks, so only the current item and the unparsed rest of the
+last chunk are held in memory, whatever the page size. It uses ijson when it is
+installed and otherwise decodes item by item with `json.JSONDecoder.raw_decode`.
+"""
+import codecs
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _iter_with_raw_decode(chunks):
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    chunks = iter(chunks)
+    buffer, pos, exhausted = '', 0, False
+    # after a failed attempt wait for twice the data, so a large item is not rescanned chunk by chunk
+    min_size = 0
+
+    def read_more():
+        nonlocal buffer, pos, exhausted
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b'', final=True)
+        else:
+            buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+
+    def skip(characters):
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in characters:
+                pos += 1
+            if pos < len(buffer) or exhausted:
+                return
+            read_more()
+
+    skip(_WHITESPACE)
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise ValueError(f"Expected a JSON array, got: {buffer[pos:pos + 50]!r}")
+    pos += 1
+
+    while True:
+        skip(_WHITESPACE + ',')
+        if pos >= len(buffer):
+            raise ValueError("JSON array is not terminated")
+        if buffer[pos] == ']':
+            return
+        if len(buffer) - pos < min_size and not exhausted:
+            read_more()
+            continue
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            min_size = 2 * (len(buffer) - pos)
+            read_more()
+            continue
+        if end == len(buffer) and not exhausted:
+            # a number or literal at the end of the buffer may continue in the next chunk
+            min_size = len(buffer) - pos + 1
+            read_more()
+            continue
+        min_size = 0
+        pos = end
+        yield item
+
+
+def iter_json_array(chunks, raw=None):
+    """Yield the items of a JSON array as its bytes arrive.
+
+    Args:
+        chunks (iterable[bytes]): The body in chunks, e.g. `response.iter_content(65536)`.
+        raw (file-like, optional): The raw body stream (`response.raw`), used instead of
+            `chunks` when ijson is installed.
+
+    Yields:
+        The decoded items, one at a time.
+
+    Raises:
+        ValueError: If the body is not a JSON array.
+    """
+    if ijson and raw is not None:
+        yield from ijson.items(raw, 'item', use_float=True)
+    else:
+        yield from _iter_with_raw_decode(chunks)
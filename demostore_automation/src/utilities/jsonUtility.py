@@ -0,0 +1,48 @@
+"""JSON decoding of API responses with a pluggable decoder.
+
+orjson decodes the WooCommerce responses about twice as fast as the standard
+library and is used when it is installed; set API_JSON_DECODER=json to use the
+standard library anyway. Bodies the fast decoder rejects (e.g. a leading BOM or a
+non UTF-8 encoding) are decoded by `requests` as before.
+"""
+import json
+import logging as logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DECODERS = {"json": json.loads}
+if orjson:
+    DECODERS["orjson"] = orjson.loads
+
+_decoder = {"name": "orjson" if orjson else "json", "loads": DECODERS["orjson" if orjson else "json"]}
+
+
+def select_decoder(name):
+    """Select the decoder by name: 'orjson', 'json', or 'auto' for the fastest one installed.
+
+    Raises:
+        Exception: If the decoder is unknown or not installed.
+    """
+    if name == 'auto':
+        name = "orjson" if orjson else "json"
+    if name not in DECODERS:
+        raise Exception(f"Unknown or not installed JSON decoder '{name}'. Available: {sorted(DECODERS)}")
+    if name != _decoder['name']:
+        logger.info(f"Decoding API responses with {name}")
+    _decoder.update(name=name, loads=DECODERS[name])
+
+
+def get_decoder_name():
+    return _decoder['name']
+
+
+def decode_response(rs_api):
+    """Decode the JSON body of a `requests.Response` with the selected decoder."""
+    try:
+        return _decoder['loads'](rs_api.content)
+    except ValueError:
+        # let requests detect the encoding, it raises the usual error for bodies that are not JSON
+        return rs_api.json()
@@ -0,0 +1,136 @@
+"""Navigation Timing and Web Vitals collection for storefront pages.
+
+When enabled (`--collect-page-perf` or the COLLECT_PAGE_PERF environment variable),
+SeleniumExtended.go_to_url reads the browser's Navigation Timing and Resource Timing
+entries plus LCP and CLS right after a page loads. The metrics are kept per test in
+`page_perf_store` and appended to a JSON Lines results file at test teardown, so the
+functional suite doubles as a storefront performance monitor.
+"""
+import json
+import os
+import threading
+import logging as logger
+
+# Runs as an async script: the buffered PerformanceObservers deliver LCP and layout-shift
+# entries asynchronously, so the result is returned after a short delay.
+# CLS is the sum of all layout shifts without recent input (no session windowing).
+COLLECT_PERF_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var result = {navigation: null, resources: [], lcp: null, cls: null};
+var nav = performance.getEntriesByType('navigation')[0];
+if (nav) { result.navigation = nav.toJSON(); }
+result.resources = performance.getEntriesByType('resource').map(function (r) {
+    return {name: r.name, initiatorType: r.initiatorType, duration: r.duration,
+            transferSize: r.transferSize, encodedBodySize: r.encodedBodySize};
+});
+var supported = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+try {
+    if (supported.indexOf('largest-contentful-paint') !== -1) {
+        new PerformanceObserver(function (list) {
+            var entries = list.getEntries();
+            result.lcp = entries[entries.length - 1].startTime;
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+    }
+    if (supported.indexOf('layout-shift') !== -1) {
+        result.cls = 0;
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (e) { if (!e.hadRecentInput) { result.cls += e.value; } });
+        }).observe({type: 'layout-shift', buffered: true});
+    }
+} catch (e) {}
+setTimeout(function () { done(result); }, 100);
+"""
+
+
+def _round(value, digits=1):
+    return round(value, digits) if value is not None else None
+
+
+def collect_page_performance(driver, page_name, url=None):
+    """Read navigation, resource and Web Vitals metrics for the currently loaded page.
+
+    Args:
+        driver (WebDriver): Selenium WebDriver instance.
+        page_name (str): Logical page name used for reporting and budgets (e.g. 'home', 'checkout').
+        url (str, optional): URL that was requested. Defaults to the driver's current URL.
+
+    Returns:
+        dict: Derived metrics ('ttfb_ms', 'lcp_ms', 'cls', 'transfer_bytes', 'request_count', ...)
+        plus the raw 'navigation' entry and 'resources' list.
+    """
+    raw = driver.execute_async_script(COLLECT_PERF_SCRIPT)
+    navigation = raw.get('navigation') or {}
+    resources = raw.get('resources') or []
+
+    transfer_bytes = int(navigation.get('transferSize') or 0) + sum(int(r.get('transferSize') or 0) for r in resources)
+    return {
+        "page": page_name,
+        "url": url or driver.current_url,
+        "ttfb_ms": _round(navigation.get('responseStart')),
+        "dom_content_loaded_ms": _round(navigation.get('domContentLoadedEventEnd')),
+        "load_ms": _round(navigation.get('loadEventEnd')),
+        "lcp_ms": _round(raw.get('lcp')),
+        "cls": _round(raw.get('cls'), 4),
+        "transfer_bytes": transfer_bytes,
+        "request_count": 1 + len(resources),
+        "navigation": navigation,
+        "resources": resources,
+    }
+
+
+class PagePerfStore:
+    """Holds page performance records per test and writes them to the results store.
+
+    Attributes:
+        enabled (bool): Whether navigations should be measured.
+        collect_all (bool): Whether every test is measured, not only those with a perf_budget marker.
+        current_test (str): Node id of the test currently running.
+        records (dict): Maps test node id to a list of page performance records.
+    """
+
+    def __init__(self):
+        self.collect_all = os.environ.get('COLLECT_PAGE_PERF', '').lower() in ('1', 'true', 'yes')
+        self.enabled = self.collect_all
+        self.current_test = None
+        self.records = {}
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.records.setdefault(self.current_test, []).append(record)
+
+    def get_test_records(self, test_id, page_name=None):
+        """Return the records of a test, optionally filtered by page name."""
+        with self._lock:
+            records = list(self.records.get(test_id, []))
+        if page_name:
+            records = [r for r in records if r['page'] == page_name]
+        return records
+
+    def all_records(self):
+        """Return the records of all tests."""
+        with self._lock:
+            return [record for records in self.records.values() for record in records]
+
+    def flush_test(self, test_id, file_path):
+        """Append the records of a test as JSON lines to `file_path`.
+
+        Args:
+            test_id (str): Node id of the test.
+            file_path (str): Path of the JSON Lines results file.
+
+        Returns:
+            int: Number of records written.
+        """
+        records = self.get_test_records(test_id)
+        if not records:
+            return 0
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'a') as f:
+            for record in records:
+                f.write(json.dumps(dict(test=test_id, **record)) + '\n')
+        logger.debug(f"Wrote {len(records)} page performance record(s) for {test_id}")
+        return len(records)
+
+
+page_perf_store = PagePerfStore()
@@ -0,0 +1,115 @@
+"""Cached API payload templates and a fast order payload builder.
+
+Templates in 'src/data' are parsed once per process. Callers get deep copies
+(`get_payload_template`, `OrderPayloadBuilder.build()`) or, for bulk and load
+scenarios, structurally shared payloads (`build(shared=True)`, `build_many`)
+where only the overridden keys are new objects and the untouched parts of the
+template are shared. Shared payloads must be treated as read-only.
+"""
+import json
+import os
+from functools import lru_cache
+from demostore_automation.src.utilities.genericUtilities import fast_deepcopy
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data')
+
+
+@lru_cache(maxsize=None)
+def _load_template(file_name):
+    with open(os.path.join(DATA_DIR, file_name), 'r') as f:
+        return json.load(f)
+
+
+def get_payload_template(file_name):
+    """Return a private copy of a payload template from 'src/data'.
+
+    Args:
+        file_name (str): Template file name, e.g. 'create_order_payload.json'.
+
+    Returns:
+        dict: Deep copy of the parsed template, safe to mutate.
+
+    Raises:
+        FileNotFoundError, IOError, PermissionError, UnicodeError: File read errors on the first load.
+    """
+    return fast_deepcopy(_load_template(file_name))
+
+
+class OrderPayloadBuilder:
+    """Builds create order payloads from the 'create_order_payload.json' template.
+
+    Example:
+        payload = (OrderPayloadBuilder()
+                   .with_product(product_id, quantity=2)
+                   .with_customer(customer_id)
+                   .with_free_shipping()
+                   .build())
+    """
+
+    TEMPLATE = 'create_order_payload.json'
+
+    def __init__(self, template=None):
+        self._template = _load_template(template or self.TEMPLATE)
+        self._overrides = {}
+
+    def with_line_items(self, line_items):
+        """Replace the line items, e.g. [{"product_id": 12, "quantity": 1}]."""
+        self._overrides["line_items"] = line_items
+        return self
+
+    def with_product(self, product_id, quantity=1):
+        """Replace the line items with a single product."""
+        return self.with_line_items([{"product_id": product_id, "quantity": quantity}])
+
+    def with_customer(self, customer_id):
+        self._overrides["customer_id"] = customer_id
+        return self
+
+    def with_billing(self, **fields):
+        """Override billing fields, keeping the template values of the others."""
+        self._overrides["billing"] = {**self._template.get("billing", {}), **self._overrides.get("billing", {}), **fields}
+        return self
+
+    def with_shipping_lines(self, shipping_lines):
+        self._overrides["shipping_lines"] = shipping_lines
+        return self
+
+    def with_free_shipping(self):
+        return self.with_shipping_lines([{"method_id": "free_shipping", "method_title": "Free Shipping", "total": "0.00"}])
+
+    def with_overrides(self, overrides):
+        """Override any top level fields of the payload.
+
+        Raises:
+            TypeError: If `overrides` is not a dict.
+        """
+        if not isinstance(overrides, dict):
+            raise TypeError(f"Overrides must be of type dict. Actual: {type(overrides)}")
+        self._overrides.update(overrides)
+        return self
+
+    def build(self, shared=False):
+        """Build the payload.
+
+        Args:
+            shared (bool, optional): Share the untouched parts of the template and the override
+                objects instead of copying them. Much faster, but the result must not be mutated.
+
+        Returns:
+            dict: The order payload.
+        """
+        payload = {**self._template, **self._overrides}
+        return payload if shared else fast_deepcopy(payload)
+
+    def build_many(self, variants):
+        """Build one structurally shared payload per variant.
+
+        Args:
+            variants (iterable[dict]): Top level overrides per payload, applied on top of the
+                builder's overrides, e.g. ({"line_items": [...], "customer_id": c} for c in customer_ids).
+
+        Returns:
+            list[dict]: Read-only payloads sharing the template and builder overrides.
+        """
+        base = {**self._template, **self._overrides}
+        return [{**base, **variant} for variant in variants]
@@ -0,0 +1,161 @@
+"""Storefront performance budgets and baseline trend comparison.
+
+Budgets are declared per page in 'src/data/perf_budgets.json' (max TTFB, LCP,
+transfer bytes and request count). Tests marked with
+`@pytest.mark.perf_budget('checkout')` have the page performance records
+collected during the test checked against the budget, and against a stored
+baseline of median values from a previous run.
+"""
+import json
+import os
+import statistics
+from functools import lru_cache
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data')
+DEFAULT_BUDGETS_FILE = os.path.join(DATA_DIR, 'perf_budgets.json')
+DEFAULT_BASELINE_FILE = os.path.join(DATA_DIR, 'perf_baseline.json')
+
+# budget key -> page performance record key
+BUDGET_METRICS = {
+    'max_ttfb_ms': 'ttfb_ms',
+    'max_lcp_ms': 'lcp_ms',
+    'max_transfer_bytes': 'transfer_bytes',
+    'max_request_count': 'request_count',
+}
+TREND_METRICS = tuple(BUDGET_METRICS.values())
+
+
+class PerfBudgetWarning(UserWarning):
+    """Issued when a page exceeds its budget or regresses against the baseline in 'warn' mode."""
+
+
+@lru_cache(maxsize=8)
+def load_perf_budgets(file_path=None):
+    """Load the performance budget file.
+
+    Args:
+        file_path (str, optional): Path of the budget file. Defaults to 'src/data/perf_budgets.json'.
+
+    Returns:
+        dict: Parsed budgets with 'pages' and 'baseline_tolerance_pct'.
+    """
+    with open(file_path or DEFAULT_BUDGETS_FILE, 'r') as f:
+        return json.load(f)
+
+
+def check_budget(record, page_budget):
+    """Compare one page performance record against its budget.
+
+    Metrics the browser could not measure (e.g. LCP on browsers without support) are skipped.
+
+    Args:
+        record (dict): Page performance record from SeleniumExtended.record_page_performance.
+        page_budget (dict): Budget of the page, e.g. {"max_ttfb_ms": 800, ...}.
+
+    Returns:
+        list[str]: One message per exceeded metric.
+    """
+    violations = []
+    for budget_key, metric in BUDGET_METRICS.items():
+        limit = page_budget.get(budget_key)
+        actual = record.get(metric)
+        if limit is not None and actual is not None and actual > limit:
+            violations.append(f"'{record['page']}' {metric}={actual} exceeds budget {limit}")
+    return violations
+
+
+def evaluate_page_records(records, pages, budgets, baseline):
+    """Check page performance records of a test against budgets and the baseline.
+
+    Args:
+        records (list[dict]): Page performance records collected during the test.
+        pages (tuple[str]): Page names to check, as given to the perf_budget marker.
+        budgets (dict): Parsed budget file.
+        baseline (dict): Stored baseline values per page.
+
+    Returns:
+        tuple[list[str], list[str]]: Budget violations and baseline regressions. A page without
+            any record counts as a violation, so a collector that stopped recording is noticed.
+
+    Raises:
+        KeyError: If a page has no budget defined.
+    """
+    violations, regressions = [], []
+    tolerance_pct = budgets.get('baseline_tolerance_pct', 20)
+    for page in pages:
+        if page not in budgets['pages']:
+            raise KeyError(f"No performance budget defined for page '{page}'. "
+                           f"Defined pages: {list(budgets['pages'])}")
+        page_records = [record for record in records if record['page'] == page]
+        if not page_records:
+            violations.append(f"{page}: no page load was recorded, is page performance collection working?")
+        for record in page_records:
+            violations.extend(check_budget(record, budgets['pages'][page]))
+            if page in baseline:
+                regressions.extend(compare_to_baseline(record, baseline[page], tolerance_pct))
+    return violations, regressions
+
+
+def compare_to_baseline(record, page_baseline, tolerance_pct):
+    """Compare one page performance record against the stored baseline.
+
+    Args:
+        record (dict): Page performance record.
+        page_baseline (dict): Baseline metrics of the page, e.g. {"ttfb_ms": 410.0, ...}.
+        tolerance_pct (float): Allowed increase over the baseline in percent.
+
+    Returns:
+        list[str]: One message per metric that regressed beyond the tolerance.
+    """
+    regressions = []
+    for metric in TREND_METRICS:
+        baseline = page_baseline.get(metric)
+        actual = record.get(metric)
+        if not baseline or actual is None:
+            continue
+        change_pct = (actual - baseline) / baseline * 100
+        if change_pct > tolerance_pct:
+            regressions.append(f"'{record['page']}' {metric}={actual} is {change_pct:.0f}% above "
+                               f"baseline {baseline} (tolerance {tolerance_pct}%)")
+    return regressions
+
+
+def build_baseline(records):
+    """Build baseline values (median per page and metric) from page performance records.
+
+    Args:
+        records (list[dict]): Page performance records from any number of tests.
+
+    Returns:
+        dict: {page: {metric: median value, 'samples': count}}.
+    """
+    by_page = {}
+    for record in records:
+        by_page.setdefault(record['page'], []).append(record)
+
+    baseline = {}
+    for page, page_records in by_page.items():
+        baseline[page] = {'samples': len(page_records)}
+        for metric in TREND_METRICS:
+            values = [r[metric] for r in page_records if r.get(metric) is not None]
+            if values:
+                baseline[page][metric] = round(statistics.median(values), 2)
+    return baseline
+
+
+def load_baseline(file_path=None):
+    """Load the stored baseline, or an empty dict if none has been recorded yet."""
+    file_path = file_path or DEFAULT_BASELINE_FILE
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def write_baseline(baseline, file_path=None):
+    """Write baseline values, merging them into the pages already stored."""
+    file_path = file_path or DEFAULT_BASELINE_FILE
+    stored = load_baseline(file_path)
+    stored.update(baseline)
+    with open(file_path, 'w') as f:
+        json.dump(stored, f, indent=4, sort_keys=True)
@@ -0,0 +1,148 @@
+"""Session-start health probes for the store, REST API, database and Selenium grid.
+
+All required probes run concurrently with a short timeout, so a dead environment
+is reported within seconds with a diagnosis, instead of after browsers start and
+fixtures time out one by one. Results are cached for the session.
+"""
+import os
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import pymysql
+import requests
+from woocommerce import API
+from demostore_automation.src.configs.MainConfigs import MainConfigs
+from demostore_automation.src.utilities.credentialsUtility import CredentialsUtility
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'tests')
+FRONTEND_DIR = os.path.realpath(os.path.join(TESTS_DIR, 'frontend'))
+BACKEND_DIR = os.path.realpath(os.path.join(TESTS_DIR, 'backend'))
+
+_results_cache = {}
+
+
+def probe_base_url(timeout):
+    base_url = MainConfigs.get_base_url()
+    rs = requests.get(base_url, timeout=timeout)
+    assert rs.status_code < 500, f"Store at {base_url} returned {rs.status_code}"
+    return f"{base_url} returned {rs.status_code}"
+
+
+def probe_woo_api(timeout):
+    wc_creds = CredentialsUtility.get_woo_api_keys()
+    wcapi = API(url=MainConfigs.get_base_url(), consumer_key=wc_creds['woo_key'],
+                consumer_secret=wc_creds['woo_secret'], version="wc/v3", timeout=timeout)
+    rs = wcapi.get("products", params={"per_page": 1, "_fields": "id"})
+    if rs.status_code in (401, 403):
+        raise AssertionError(f"REST API rejected the credentials ({rs.status_code}). Check WOO_KEY and WOO_SECRET.")
+    assert rs.status_code == 200, f"REST API returned {rs.status_code}: {rs.text[:200]}"
+    return "authenticated GET products returned 200"
+
+
+def probe_db(timeout):
+    db_configs = MainConfigs.get_db_configs()
+    creds = CredentialsUtility.get_db_credentials()
+    connection = pymysql.connect(host=db_configs['db_host'], port=db_configs['port'], user=creds['db_user'],
+                                 password=creds['db_password'], connect_timeout=timeout, read_timeout=timeout)
+    try:
+        with connection.cursor() as cur:
+            cur.execute("SELECT 1")
+            cur.fetchone()
+    finally:
+        connection.close()
+    return f"connected to {db_configs['db_host']}:{db_configs['port']}"
+
+
+def probe_grid(timeout):
+    remote_url = os.environ.get("REMOTE_WEBDRIVER")
+    if not remote_url:
+        raise Exception("'REMOTE_WEBDRIVER' must be set for remote browsers.")
+    status_url = remote_url.rstrip('/').removesuffix('/wd/hub') + '/status'
+    rs = requests.get(status_url, timeout=timeout)
+    assert rs.status_code == 200, f"Grid status {status_url} returned {rs.status_code}"
+    value = rs.json().get('value', {})
+    assert value.get('ready', True), f"Grid is not ready: {value.get('message')}"
+    return f"grid ready: {value.get('message', 'ok')}"
+
+
+PROBES = {
+    "base_url": probe_base_url,
+    "woo_api": probe_woo_api,
+    "db": probe_db,
+    "grid": probe_grid,
+}
+
+
+def required_probes(paths):
+    """Return the probes needed by tests at `paths` (test files or directories).
+
+    Frontend tests need the store (and the grid for remote browsers), backend tests
+    need the REST API and the database. Paths that contain both, e.g. 'tests', need all.
+    """
+    needed = set()
+    for path in paths:
+        path = os.path.realpath(str(path).split('::')[0])
+        for test_dir, probes in ((FRONTEND_DIR, ('base_url',)), (BACKEND_DIR, ('woo_api', 'db'))):
+            if path == test_dir or path.startswith(test_dir + os.sep) or test_dir.startswith(path + os.sep):
+                needed.update(probes)
+    if 'base_url' in needed and os.environ.get('BROWSER', '').lower().startswith('remote'):
+        needed.add('grid')
+    return sorted(needed)
+
+
+def _diagnose(error):
+    if isinstance(error, requests.exceptions.RequestException):
+        # the full URL may carry OAuth query parameters, only show the host
+        host = urlsplit(error.request.url).netloc if error.request is not None else ''
+        if isinstance(error, requests.exceptions.Timeout):
+            return f"{host} timed out ({error.__class__.__name__})"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return f"connection to {host} failed, is the host up and reachable?"
+    if isinstance(error, pymysql.err.OperationalError):
+        code = error.args[0] if error.args else None
+        hint = {1045: "access denied, check DB_USER and DB_PASSWORD",
+                2003: "can not connect, check DB_HOST, DB_PORT and that MySQL is up"}.get(code, "")
+        return f"{hint} ({error})".strip()
+    return str(error)[:300]
+
+
+def _run_probe(name, timeout):
+    start = time.perf_counter()
+    try:
+        detail, ok = PROBES[name](timeout), True
+    except Exception as e:
+        detail, ok = _diagnose(e), False
+    return {"name": name, "ok": ok, "elapsed_ms": round((time.perf_counter() - start) * 1000), "detail": detail}
+
+
+def run_preflight(probe_names, timeout=5):
+    """Run the probes concurrently. Results are cached per set of probes for the session.
+
+    Args:
+        probe_names (list[str]): Names from PROBES.
+        timeout (float, optional): Timeout per probe in seconds.
+
+    Returns:
+        list[dict]: One result per probe with 'name', 'ok', 'elapsed_ms' and 'detail'.
+    """
+    key = tuple(sorted(probe_names))
+    if key not in _results_cache:
+        if not key:
+            _results_cache[key] = []
+        else:
+            with ThreadPoolExecutor(max_workers=len(key), thread_name_prefix='preflight') as executor:
+                _results_cache[key] = list(executor.map(lambda name: _run_probe(name, timeout), key))
+        for result in _results_cache[key]:
+            logger.info(f"Preflight {result['name']}: {'ok' if result['ok'] else 'FAILED'} "
+                        f"({result['elapsed_ms']} ms) {result['detail']}")
+    return _results_cache[key]
+
+
+def format_preflight_failure(results):
+    lines = ["Environment preflight failed, aborting the run:"]
+    for result in results:
+        mark = "ok    " if result['ok'] else "FAILED"
+        lines.append(f"  {mark} {result['name']:<9} ({result['elapsed_ms']} ms) {result['detail']}")
+    lines.append("Use --skip-preflight to run anyway.")
+    return "\n".join(lines)
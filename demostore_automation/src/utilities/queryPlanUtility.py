@@ -0,0 +1,149 @@
+"""EXPLAIN based checks of the DAO queries against the target database.
+
+Every DAO method in `DAO_QUERY_CALLS` is called once with sample arguments on a
+`SqlRecorder` instead of a DBUtility, which captures the SQL without running it.
+Each captured statement is then run with `EXPLAIN` on the real database and the
+plan is checked for full scans: access type 'ALL' (table scan), or 'index' (full
+index scan) estimated to read more than `max_index_rows` rows. A scan along an
+index that stops at a LIMIT, e.g. the newest 1000 users, is estimated at the
+LIMIT and passes. Tables estimated below `min_table_rows` rows are ignored, MySQL
+scans those regardless of the available indexes.
+
+Statements executed during a test run can be checked the same way by passing
+`db_metrics.sample_statements()` to `check_query_plans`.
+"""
+import inspect
+import logging as logger
+from demostore_automation.src.dao.coupons_dao import CouponsDAO
+from demostore_automation.src.dao.customers_dao import CustomersDAO
+from demostore_automation.src.dao.orders_dao import OrdersDAO
+from demostore_automation.src.dao.postmeta_dao import PostMetaDAO
+from demostore_automation.src.dao.products_dao import ProductsDAO
+from demostore_automation.src.utilities.dbUtility import DBUtility
+
+DEFAULT_MAX_INDEX_ROWS = 10000
+DEFAULT_MIN_TABLE_ROWS = 100
+
+# (DAO class, method, sample arguments). Ids do not need to exist, EXPLAIN only plans the query.
+DAO_QUERY_CALLS = (
+    (ProductsDAO, 'get_random_product_from_db', (1,)),
+    (ProductsDAO, 'get_product_by_id', (1,)),
+    (ProductsDAO, 'get_products_by_ids', ([1, 2, 3],)),
+    (ProductsDAO, 'get_product_price', (1,)),
+    (ProductsDAO, 'get_product_prices_by_ids', ([1, 2, 3],)),
+    (ProductsDAO, 'get_product_review_info', (1,)),
+    (ProductsDAO, 'iter_reviews', ([1, 2, 3],)),
+    (OrdersDAO, 'get_order_by_id', (1,)),
+    (OrdersDAO, 'get_orders_by_ids', ([1, 2, 3],)),
+    (OrdersDAO, 'get_random_existing_order_from_db', (1,)),
+    (OrdersDAO, 'get_random_order_by_status', ('processing',)),
+    (OrdersDAO, 'iter_orders_by_status', ('processing',)),
+    (OrdersDAO, 'get_order_notes', (1, 'Automation test note')),
+    (OrdersDAO, 'get_order_status_by_id', (1,)),
+    (OrdersDAO, 'get_order_statuses_by_ids', ([1, 2, 3],)),
+    (CouponsDAO, 'fetch_coupon_by_text', ('coupon',)),
+    (CouponsDAO, 'fetch_coupon_by_discount_type', ('percent',)),
+    (CouponsDAO, 'get_coupon_usage', (1,)),
+    (CustomersDAO, 'get_customer_by_email', ('customer@example.com',)),
+    (CustomersDAO, 'get_random_customer_from_db', (1,)),
+    (PostMetaDAO, 'get_meta', ([1, 2, 3], ['_stock', '_stock_status'], ['_stock'])),
+    (PostMetaDAO, 'get_product_prices', ([1, 2, 3],)),
+)
+
+
+class SqlRecorder:
+    """Stands in for a DAO's DBUtility and records the SQL instead of running it.
+
+    Attributes:
+        database (str): Database name the DAOs build their queries with.
+        table_prefix (str): Table prefix the DAOs build their queries with.
+        statements (list[str]): Recorded SQL, in call order.
+    """
+
+    def __init__(self, database, table_prefix):
+        self.database = database
+        self.table_prefix = table_prefix
+        self.statements = []
+
+    def execute_select(self, sql):
+        self.statements.append(sql)
+        return []
+
+    def execute_select_records(self, sql, record_cls):
+        self.statements.append(sql)
+        return []
+
+    def iter_select(self, sql, record_cls=None, batch_size=1000):
+        self.statements.append(sql)
+        return iter(())
+
+
+def collect_dao_queries(calls=DAO_QUERY_CALLS):
+    """Capture the SQL of every DAO method in `calls` without touching the database.
+
+    Returns:
+        dict: Maps 'DAO.method' to its SQL statement.
+    """
+    queries = {}
+    for dao_cls, method_name, args in calls:
+        dao = dao_cls()
+        recorder = SqlRecorder(dao.db_helper.database, dao.db_helper.table_prefix)
+        dao.db_helper = recorder
+        try:
+            result = getattr(dao, method_name)(*args)
+            if inspect.isgenerator(result):
+                list(result)
+        except ValueError:
+            pass  # random.sample of the empty recorded result, the SQL is captured already
+        assert recorder.statements, f"{dao_cls.__name__}.{method_name} did not run a query"
+        queries[f"{dao_cls.__name__}.{method_name}"] = " ".join(recorder.statements[-1].split())
+    return queries
+
+
+def find_full_scans(plan, max_index_rows=DEFAULT_MAX_INDEX_ROWS, min_table_rows=DEFAULT_MIN_TABLE_ROWS):
+    """Return the rows of an EXPLAIN result that scan a whole table or index.
+
+    Args:
+        plan (list[dict]): Rows of `EXPLAIN <query>` from a dict cursor.
+        max_index_rows (int, optional): Full index scans estimated above this many rows are flagged.
+        min_table_rows (int, optional): Table scans estimated below this many rows are not flagged.
+
+    Returns:
+        list[dict]: The flagged plan rows with 'table', 'type', 'key' and 'rows'.
+    """
+    flagged = []
+    for row in plan:
+        access_type, rows = row.get('type'), int(row.get('rows') or 0)
+        if (access_type == 'ALL' and rows >= min_table_rows) or (access_type == 'index' and rows > max_index_rows):
+            flagged.append({"table": row.get('table'), "type": access_type, "key": row.get('key'), "rows": rows})
+    return flagged
+
+
+def explain(sql, db_helper=None):
+    """Run `EXPLAIN` for a statement and return the plan rows."""
+    db_helper = db_helper or DBUtility()
+    return db_helper.execute_select(f"EXPLAIN {sql.strip().rstrip(';')}")
+
+
+def check_query_plans(queries, db_helper=None, max_index_rows=DEFAULT_MAX_INDEX_ROWS,
+                      min_table_rows=DEFAULT_MIN_TABLE_ROWS):
+    """Explain every query and flag full scans.
+
+    Args:
+        queries (dict): Maps a name (e.g. 'OrdersDAO.get_order_notes') to SQL.
+        db_helper (DBUtility, optional): Connection settings of the target database.
+        max_index_rows (int, optional): See `find_full_scans`.
+        min_table_rows (int, optional): See `find_full_scans`.
+
+    Returns:
+        list[dict]: One result per query with 'name', 'sql', 'plan' and 'full_scans'.
+    """
+    db_helper = db_helper or DBUtility()
+    results = []
+    for name, sql in queries.items():
+        plan = explain(sql, db_helper)
+        full_scans = find_full_scans(plan, max_index_rows, min_table_rows)
+        for scan in full_scans:
+            logger.warning(f"Full scan in {name}: {scan}")
+        results.append({"name": name, "sql": sql, "plan": plan, "full_scans": full_scans})
+    return results
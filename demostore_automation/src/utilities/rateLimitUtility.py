@@ -0,0 +1,188 @@
+"""Client-side rate limiting and concurrency governor for the WooCommerce API.
+
+Every endpoint group (the first path segment, e.g. 'orders' for 'orders/12/notes')
+has a token bucket (requests per second with a burst) and a max number of requests
+in flight, configured in 'src/data/rate_limits.json'. Buckets are shared by all
+threads of the process; under xdist the bucket state lives in a file in the temp
+dir, locked with fcntl, so the workers share one budget. Max in flight is split
+evenly across the workers.
+
+The rate adapts AIMD-style: a 429 halves the group's rate (down to 'min_rate'),
+and every 'increase_every' successful calls add 'increase_step' back, up to the
+configured rate. The aggregate throughput so settles near the highest rate the
+store sustains without throttling.
+"""
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows, fall back to per-process buckets
+    fcntl = None
+
+DEFAULT_RATE_LIMITS_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', 'rate_limits.json')
+
+
+def endpoint_group(wc_endpoint):
+    """Return the group of an endpoint, e.g. 'orders' for 'orders/12/notes'."""
+    return wc_endpoint.strip('/').split('/')[0].split('?')[0] or 'default'
+
+
+def load_rate_limits(file_path=None):
+    with open(file_path or DEFAULT_RATE_LIMITS_FILE, 'r') as f:
+        return json.load(f)
+
+
+class BucketState:
+    """Token bucket state of all groups, kept in memory or in a file shared by the xdist workers.
+
+    Attributes:
+        file_path (str): Shared state file, None to keep the state in this process only.
+    """
+
+    def __init__(self, file_path=None):
+        self.file_path = file_path if fcntl else None
+        self._state = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self):
+        """Yield the state dict for update, holding the thread lock and, if shared, the file lock."""
+        with self._lock:
+            if not self.file_path:
+                yield self._state
+                return
+            with open(self.file_path, 'a+') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    content = f.read()
+                    state = json.loads(content) if content else {}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Token bucket per endpoint group with AIMD rate adaptation and a max in flight per group.
+
+    Attributes:
+        limits (dict): Contents of 'rate_limits.json'.
+        enabled (bool): When False, `limit` does not wait.
+        workers (int): Number of processes sharing the budget, used to split max in flight.
+    """
+
+    def __init__(self, limits, state=None, enabled=True, workers=1):
+        self.limits = limits
+        self.enabled = enabled
+        self.workers = max(workers, 1)
+        self.state = state or BucketState()
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def group_limits(self, group):
+        return self.limits['groups'].get(group, self.limits['default'])
+
+    def _semaphore(self, group):
+        with self._lock:
+            if group not in self._semaphores:
+                max_in_flight = math.ceil(self.group_limits(group)['max_in_flight'] / self.workers)
+                self._semaphores[group] = threading.BoundedSemaphore(max_in_flight)
+            return self._semaphores[group]
+
+    def _bucket(self, state, group):
+        limits = self.group_limits(group)
+        if group not in state:
+            state[group] = {"tokens": limits['burst'], "rate": limits['rate'], "updated": time.time(), "successes": 0}
+        return state[group]
+
+    def try_acquire(self, group):
+        """Take a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until the next token.
+        """
+        with self.state.locked() as state:
+            bucket = self._bucket(state, group)
+            now = time.time()
+            burst = self.group_limits(group)['burst']
+            bucket['tokens'] = min(burst, bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['updated'] = now
+            if bucket['tokens'] >= 1:
+                bucket['tokens'] -= 1
+                return 0.0
+            return (1 - bucket['tokens']) / bucket['rate']
+
+    def acquire(self, group):
+        while True:
+            wait = self.try_acquire(group)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def record_status(self, group, status_code):
+        """Adapt the group's rate: multiplicative decrease on 429, additive increase after successes."""
+        if not self.enabled:
+            return
+        with self.state.locked() as state:
+            bucket = self._bucket(state, group)
+            if status_code == 429:
+                bucket['rate'] = max(self.limits['min_rate'], bucket['rate'] * self.limits['decrease_factor'])
+                bucket['tokens'] = min(bucket['tokens'], 0)
+                bucket['successes'] = 0
+            elif status_code is not None and status_code < 400:
+                bucket['successes'] += 1
+                if bucket['successes'] >= self.limits['increase_every']:
+                    bucket['successes'] = 0
+                    bucket['rate'] = min(self.group_limits(group)['rate'],
+                                         bucket['rate'] + self.limits['increase_step'])
+
+    def current_rate(self, group):
+        with self.state.locked() as state:
+            return self._bucket(state, group)['rate']
+
+    @contextmanager
+    def limit(self, wc_endpoint):
+        """Wait for a slot and a token of the endpoint's group, hold the slot while the request runs."""
+        if not self.enabled:
+            yield
+            return
+        group = endpoint_group(wc_endpoint)
+        with self._semaphore(group):
+            self.acquire(group)
+            yield
+
+
+def build_rate_limiter(configs):
+    """Build the process-wide limiter from `MainConfigs.get_api_rate_limit_configs()`.
+
+    Under xdist the bucket state file is keyed by the test run uid, so concurrent runs don't share a budget.
+    """
+    state_file = None
+    run_uid = os.environ.get('PYTEST_XDIST_TESTRUNUID')
+    if run_uid:
+        state_file = os.path.join(tempfile.gettempdir(), f"woo_rate_limits_{run_uid}.json")
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    return RateLimiter(load_rate_limits(configs['limits_file']), BucketState(state_file), configs['enabled'], workers)
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(configs):
+    """Return the limiter shared by all WooAPIUtility instances of the process, built on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = build_rate_limiter(configs)
+        return _rate_limiter
@@ -0,0 +1,206 @@
+"""Opt-in read-through cache for GET responses of immutable reference data.
+
+`WooAPIUtility.get(..., cache=True)` looks up the endpoint and params first and
+only sends the request on a miss. Entries expire after a TTL and the least
+recently used entry is evicted when the cache is full. The cache is shared by all
+WooAPIUtility instances of the process.
+
+Any POST, PUT or DELETE drops the cached entries of its endpoint group and of the
+related groups (an order changes product stock and coupon usage, a review changes
+the product rating). Writes made by other processes, e.g. other xdist workers,
+are not seen, so only cache data the tests don't modify; the TTL bounds the
+staleness otherwise.
+
+Conditional GETs (`get(..., conditional=True)`) keep the 'ETag' and
+'Last-Modified' validators of a response and send 'If-None-Match' and
+'If-Modified-Since' next time; a 304 is answered with the stored body. WordPress
+often sends no validators, so a sha1 of the body is kept too: an unchanged body
+is not parsed again.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from demostore_automation.src.utilities.genericUtilities import fast_deepcopy
+from demostore_automation.src.utilities.jsonUtility import decode_response
+from demostore_automation.src.utilities.rateLimitUtility import endpoint_group
+
+# groups whose cached responses a write to the key group can change
+RELATED_GROUPS = {
+    "orders": ("products", "coupons", "customers", "reports"),
+    "products": ("orders", "reports"),
+    "coupons": ("orders",),
+    "customers": ("orders",),
+    "refunds": ("orders", "reports"),
+}
+
+
+def cache_key(wc_endpoint, params):
+    return wc_endpoint.strip('/'), json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """TTL and LRU bounded cache of GET responses.
+
+    Attributes:
+        enabled (bool): When False, lookups always miss and nothing is stored.
+        ttl (float): Seconds an entry stays valid.
+        max_entries (int): Entries kept before the least recently used one is evicted.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to call the API.
+        invalidations (int): Entries dropped because of writes.
+    """
+
+    def __init__(self, ttl=300, max_entries=256, enabled=True):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, ttl, max_entries, enabled):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+    def get(self, wc_endpoint, params):
+        """Return a copy of the cached entry, or None on a miss.
+
+        Returns:
+            dict or None: 'rs_json', 'url' and 'headers' of the cached response.
+        """
+        if not self.enabled:
+            return None
+        key = cache_key(wc_endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry['stored_at'] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # callers may modify the response, keep the cached one intact
+        return {"rs_json": fast_deepcopy(entry['rs_json']), "url": entry['url'], "headers": dict(entry['headers'])}
+
+    def put(self, wc_endpoint, params, rs_json, url, headers):
+        if not self.enabled:
+            return
+        entry = {"rs_json": fast_deepcopy(rs_json), "url": url, "headers": dict(headers), "stored_at": time.monotonic()}
+        with self._lock:
+            self._entries[cache_key(wc_endpoint, params)] = entry
+            self._entries.move_to_end(cache_key(wc_endpoint, params))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, wc_endpoint):
+        """Drop the entries of the endpoint's group and its related groups after a write."""
+        group = endpoint_group(wc_endpoint)
+        groups = {group, *RELATED_GROUPS.get(group, ())}
+        with self._lock:
+            stale = [key for key in self._entries if endpoint_group(key[0]) in groups]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.invalidations = 0
+
+
+class ValidatorStore:
+    """Validators, body hash and parsed JSON of the last response per endpoint and params.
+
+    The stored JSON is returned as is, without copying (that would be slower than
+    parsing), so conditional reads must not modify the response.
+
+    Attributes:
+        enabled (bool): When False, no conditional headers are sent and every body is parsed.
+        max_entries (int): URLs kept before the least recently used one is dropped.
+        requests (int): Conditional GETs sent.
+        not_modified (int): 304 responses answered from the store.
+        unchanged (int): 200 responses whose body hash matched, so parsing was skipped.
+    """
+
+    def __init__(self, max_entries=256, enabled=True):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.requests = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, max_entries, enabled):
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+    def request_headers(self, wc_endpoint, params):
+        """Return the conditional headers for a GET, empty if nothing is stored for it."""
+        with self._lock:
+            self.requests += 1
+            entry = self._entries.get(cache_key(wc_endpoint, params))
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def resolve(self, wc_endpoint, params, rs_api):
+        """Return the JSON of a conditional GET response, from the store on a 304 or an unchanged body.
+
+        Returns:
+            The parsed JSON, or None on a 304 for a URL that is no longer stored (send the GET again).
+        """
+        key = cache_key(wc_endpoint, params)
+        if rs_api.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+                self._entries.move_to_end(key)
+                self.not_modified += 1
+            return entry['rs_json']
+
+        if rs_api.status_code != 200:
+            return decode_response(rs_api)
+        body_hash = hashlib.sha1(rs_api.content).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry['hash'] == body_hash:
+            with self._lock:
+                self.unchanged += 1
+            rs_json = entry['rs_json']
+        else:
+            rs_json = decode_response(rs_api)
+        with self._lock:
+            self._entries[key] = {"etag": rs_api.headers.get('ETag'), "last_modified": rs_api.headers.get('Last-Modified'),
+                                  "hash": body_hash, "rs_json": rs_json}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return rs_json
+
+    def stats(self):
+        return {"requests": self.requests, "not_modified": self.not_modified, "unchanged": self.unchanged}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.requests = self.not_modified = self.unchanged = 0
+
+
+response_cache = ResponseCache()
+validator_store = ValidatorStore()
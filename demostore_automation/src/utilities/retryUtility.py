@@ -0,0 +1,205 @@
+"""Retry policies, backoff and a circuit breaker for WooCommerce API calls.
+
+Transient failures (connection resets, timeouts, 429 and 5xx responses) are
+retried with jittered exponential backoff, honoring the 'Retry-After' header.
+Only idempotent methods are retried by default. A process-wide circuit breaker
+counts consecutive store failures; once open, calls fail immediately with
+CircuitOpenError until the reset timeout allows a trial call.
+
+Retries and breaker transitions are recorded in `resilience_events` and end up
+in the JUnit report and the terminal summary.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_METHODS = ('GET', 'PUT', 'DELETE')
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the store circuit is open."""
+
+
+def parse_retry_after(value):
+    """Convert a 'Retry-After' header (seconds or HTTP date) to seconds, or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a request.
+
+    Attributes:
+        max_attempts (int): Total attempts including the first one. 1 disables retries.
+        backoff_base (float): Backoff of the first retry in seconds, doubled for every further retry.
+        backoff_max (float): Upper bound for a single wait in seconds, also for 'Retry-After'.
+        retry_statuses (tuple[int]): Status codes that are retried.
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_max=8, retry_statuses=DEFAULT_RETRY_STATUSES, seed=None):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        # own generator, so jitter does not consume the seeded test data sequence
+        self._rng = random.Random(seed)
+
+    def should_retry(self, attempt, status_code=None, error=None):
+        """Return True if `attempt` (1-based) failed with a retryable status or error and attempts are left."""
+        if attempt >= self.max_attempts:
+            return False
+        return error is not None or status_code in self.retry_statuses
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait after `attempt` failed: full jitter exponential backoff, or 'Retry-After' if longer."""
+        backoff = self._rng.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            backoff = max(backoff, min(retry_after, self.backoff_max))
+        return backoff
+
+
+def build_retry_policies(configs):
+    """Build one RetryPolicy per HTTP method from `MainConfigs.get_api_retry_configs()`.
+
+    Methods not listed in configs['methods'] get a single attempt.
+
+    Returns:
+        dict: Maps 'GET', 'POST', 'PUT' and 'DELETE' to a RetryPolicy.
+    """
+    policies = {}
+    for method in ('GET', 'POST', 'PUT', 'DELETE'):
+        max_attempts = configs['max_attempts'].get(method, configs['default_max_attempts'])
+        if method not in configs['methods']:
+            max_attempts = 1
+        policies[method] = RetryPolicy(max_attempts, configs['backoff_base'], configs['backoff_max'],
+                                       configs['retry_statuses'])
+    return policies
+
+
+class CircuitBreaker:
+    """Consecutive failure circuit breaker shared by all API helpers of the process.
+
+    States: 'closed' (normal), 'open' (fail fast) and 'half_open' (one trial call
+    allowed after `reset_timeout`; success closes, failure re-opens).
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit. 0 disables the breaker.
+        reset_timeout (float): Seconds the circuit stays open before a trial call.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def configure(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    def before_call(self, method, endpoint):
+        """Raise CircuitOpenError if calls must fail fast.
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or a half-open trial call is already in flight.
+        """
+        if not self.failure_threshold:
+            return
+        with self._lock:
+            if self.state == 'closed':
+                return
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self._trial_in_flight = False
+                resilience_events.record('circuit_half_open', method, endpoint, "trial call after reset timeout")
+            if self.state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            remaining = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0)
+        resilience_events.record('circuit_rejected', method, endpoint, f"open, retry in {remaining:.0f}s")
+        raise CircuitOpenError(f"Store circuit is open after {self.failures} consecutive failures. "
+                               f"Failing fast {method} {endpoint}, next trial in {remaining:.0f}s.")
+
+    def record_success(self):
+        with self._lock:
+            if self.state != 'closed':
+                resilience_events.record('circuit_closed', None, None, "trial call succeeded")
+            self.state = 'closed'
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, method, endpoint, detail):
+        if not self.failure_threshold:
+            return
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or (self.state == 'closed' and self.failures >= self.failure_threshold):
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+                resilience_events.record('circuit_open', method, endpoint,
+                                         f"{self.failures} consecutive failures, last: {detail}")
+
+    def reset(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+
+class ResilienceEvents:
+    """Retry and circuit breaker events of the session, counted per test.
+
+    Attributes:
+        events (list[dict]): Recorded events ('test', 'kind', 'method', 'endpoint', 'detail').
+        current_test (str): Node id of the test currently running.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.current_test = None
+        self._lock = threading.Lock()
+
+    def record(self, kind, method, endpoint, detail):
+        with self._lock:
+            self.events.append({"test": self.current_test, "kind": kind, "method": method,
+                                "endpoint": endpoint, "detail": detail})
+
+    def get_test_counts(self, test_id):
+        """Return {kind: count} of the events recorded while `test_id` ran."""
+        counts = {}
+        with self._lock:
+            for event in self.events:
+                if event['test'] == test_id:
+                    counts[event['kind']] = counts.get(event['kind'], 0) + 1
+        return counts
+
+    def summary(self):
+        counts = {}
+        with self._lock:
+            for event in self.events:
+                counts[event['kind']] = counts.get(event['kind'], 0) + 1
+        return counts
+
+    def reset(self):
+        with self._lock:
+            self.events.clear()
+
+
+resilience_events = ResilienceEvents()
+store_circuit_breaker = CircuitBreaker()
@@ -0,0 +1,84 @@
+"""Global seed controller for reproducible test data.
+
+The seed comes from `--seed`, the TEST_SEED environment variable or is generated
+once per run, and is printed in the report header and recorded in the JUnit report.
+Before every test the `random` module is re-seeded from the global seed and the
+test node id, so a test gets the same products, customers, names and addresses no
+matter which other tests or xdist worker ran before it. Re-running with the recorded
+seed replays the same data selection.
+
+Identifiers the store requires to be unique (emails, usernames, coupon codes, product
+names, SKUs) are not seeded: they come from `unique_random` and carry the `get_run_id`
+of the run, so a replay does not collide with the records the original run created.
+"""
+import hashlib
+import os
+import random
+
+_state = {"seed": None, "run_id": None}
+
+# 32 characters, so mapping random bytes onto them has no modulo bias
+_RUN_ID_ALPHABET = 'abcdefghijklmnopqrstuvwxyz234567'
+
+_unique_random = random.SystemRandom()
+
+
+def configure_seed(seed=None):
+    """Set the global seed and seed the `random` module with it.
+
+    Args:
+        seed (int, optional): Seed to use. Defaults to TEST_SEED, or a newly generated seed.
+
+    Returns:
+        int: The global seed.
+    """
+    if seed is None:
+        env_seed = os.environ.get('TEST_SEED')
+        seed = int(env_seed) if env_seed else int.from_bytes(os.urandom(4), 'big')
+    _state["seed"] = int(seed)
+    random.seed(_state["seed"])
+    return _state["seed"]
+
+
+def get_global_seed():
+    """Return the global seed, or None if `configure_seed` was not called."""
+    return _state["seed"]
+
+
+def is_seeded():
+    return _state["seed"] is not None
+
+
+def derive_seed(*parts):
+    """Derive a stable seed from the global seed and `parts`, e.g. a test node id.
+
+    Uses sha256 instead of `hash()`, which is randomized per process.
+    """
+    key = ":".join(str(p) for p in (_state["seed"],) + parts)
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], 'big')
+
+
+def seed_for_test(nodeid):
+    """Re-seed the `random` module for a test.
+
+    Returns:
+        int: The derived per test seed.
+    """
+    test_seed = derive_seed(nodeid)
+    random.seed(test_seed)
+    return test_seed
+
+
+def unique_random():
+    """Return the generator for values that must be unique across runs.
+
+    A `random.SystemRandom`, which draws from `os.urandom` and is not affected by the seed.
+    """
+    return _unique_random
+
+
+def get_run_id():
+    """Return a random 4 character id of this process, generated on first use and never seeded."""
+    if _state["run_id"] is None:
+        _state["run_id"] = ''.join(_RUN_ID_ALPHABET[b & 31] for b in os.urandom(4))
+    return _state["run_id"]
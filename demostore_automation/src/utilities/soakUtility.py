@@ -0,0 +1,204 @@
+"""Client-side resource and latency drift tracking for long soak runs.
+
+A ResourceSampler thread periodically records process RSS, open sockets, open
+DB connections (from DBUtility), live WebDriver sessions and the mean API
+latency since the previous sample. At the end of the run a least-squares slope
+per hour is computed for every series and compared against the thresholds in
+'src/data/soak_thresholds.json', so slow leaks and server degradation that no
+single test would notice fail the soak run.
+"""
+import json
+import os
+import threading
+import time
+import logging as logger
+from demostore_automation.src.utilities.apiMetricsUtility import api_metrics
+from demostore_automation.src.utilities.dbMetricsUtility import db_metrics
+
+DEFAULT_THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'data', 'soak_thresholds.json')
+
+SERIES = ('rss_mb', 'open_sockets', 'db_connections', 'webdriver_sessions', 'api_latency_ms', 'iteration_ms')
+
+
+class SessionCounter:
+    """Thread-safe counter of live resources, e.g. WebDriver sessions opened by the fixtures."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def increment(self):
+        with self._lock:
+            self._value += 1
+
+    def decrement(self):
+        with self._lock:
+            self._value -= 1
+
+    @property
+    def value(self):
+        return self._value
+
+
+webdriver_sessions = SessionCounter()
+
+
+def get_rss_mb():
+    """Return the resident set size of the current process in MB, or None if unavailable.
+
+    Reads /proc/self/statm on Linux. Elsewhere falls back to the peak RSS reported by
+    `resource`, which can only grow but still exposes leaks.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 2)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        import sys
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, KB on Linux
+        return round(max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024, 2)
+    except ImportError:
+        return None
+
+
+def count_open_sockets():
+    """Return the number of open sockets of the current process, or None if unavailable (non-Linux)."""
+    fd_dir = '/proc/self/fd'
+    if not os.path.isdir(fd_dir):
+        return None
+    count = 0
+    for fd in os.listdir(fd_dir):
+        try:
+            if os.readlink(os.path.join(fd_dir, fd)).startswith('socket:'):
+                count += 1
+        except OSError:
+            continue
+    return count
+
+
+def slope_per_hour(points):
+    """Least-squares slope of (seconds, value) points, expressed per hour.
+
+    Args:
+        points (list[tuple[float, float]]): Time in seconds and the measured value.
+
+    Returns:
+        float or None: Change per hour, or None with fewer than 3 points.
+    """
+    points = [(x, y) for x, y in points if y is not None]
+    n = len(points)
+    if n < 3:
+        return None
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return round(covariance / variance * 3600, 4)
+
+
+def load_soak_thresholds(file_path=None):
+    """Load the max allowed slope per hour for each series."""
+    with open(file_path or DEFAULT_THRESHOLDS_FILE, 'r') as f:
+        return json.load(f)
+
+
+class ResourceSampler:
+    """Samples client resources and latency on a background thread.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        samples (list[dict]): Collected samples, one per interval.
+    """
+
+    def __init__(self, interval=30):
+        self.interval = interval
+        self.samples = []
+        self._iterations = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_time = None
+        self._last_api = (0, 0.0)
+
+    def _api_totals(self):
+        summary = api_metrics.summary()
+        return summary['total_calls'], sum(e['total_ms'] for e in summary['endpoints'])
+
+    def record_iteration(self, elapsed_seconds):
+        """Record the duration of one soak iteration."""
+        with self._lock:
+            self._iterations.append(elapsed_seconds * 1000)
+
+    def take_sample(self):
+        calls, total_ms = self._api_totals()
+        prev_calls, prev_ms = self._last_api
+        self._last_api = (calls, total_ms)
+        with self._lock:
+            iterations, self._iterations = self._iterations, []
+
+        sample = {
+            "t_s": round(time.monotonic() - self._start_time, 1),
+            "rss_mb": get_rss_mb(),
+            "open_sockets": count_open_sockets(),
+            "db_connections": db_metrics.open_connections,
+            "webdriver_sessions": webdriver_sessions.value,
+            "api_latency_ms": round((total_ms - prev_ms) / (calls - prev_calls), 2) if calls > prev_calls else None,
+            "iteration_ms": round(sum(iterations) / len(iterations), 2) if iterations else None,
+            "iterations": len(iterations),
+        }
+        self.samples.append(sample)
+        logger.info(f"Soak sample: {sample}")
+        return sample
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.take_sample()
+
+    def start(self):
+        self._start_time = time.monotonic()
+        self._last_api = self._api_totals()
+        self.take_sample()
+        self._thread = threading.Thread(target=self._run, name='soak-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.take_sample()
+
+    def evaluate(self, thresholds, warmup_pct=10):
+        """Compute slopes per series and compare them against the thresholds.
+
+        Args:
+            thresholds (dict): Max allowed slope per hour per series, e.g. {"rss_mb": 50}.
+            warmup_pct (float, optional): Percentage of the run ignored at the start (caches, pools warming up).
+
+        Returns:
+            tuple[dict, list[str]]: Slope per series and one message per exceeded threshold.
+        """
+        if not self.samples:
+            return {}, []
+        cutoff = self.samples[-1]['t_s'] * warmup_pct / 100
+        steady = [s for s in self.samples if s['t_s'] >= cutoff]
+
+        slopes, violations = {}, []
+        for series in SERIES:
+            slope = slope_per_hour([(s['t_s'], s[series]) for s in steady])
+            slopes[series] = slope
+            limit = thresholds.get(series)
+            if slope is not None and limit is not None and slope > limit:
+                violations.append(f"{series} grows by {slope}/hour, threshold is {limit}/hour")
+        return slopes, violations
+
+    def write_report(self, file_path, slopes, violations):
+        """Write the time series, slopes and violations to a JSON file."""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w') as f:
+            json.dump({"samples": self.samples, "slopes_per_hour": slopes, "violations": violations}, f, indent=2)
@@ -0,0 +1,94 @@
+"""WebDriver factory shared by the `init_driver` fixture and the browser stress runner."""
+import os
+import logging as logger
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChOptions
+from selenium.webdriver.firefox.options import Options as FFOptions
+from selenium.webdriver.firefox.service import Service as FFService
+
+SUPPORTED_BROWSERS = ['chrome',
+                      'ch',
+                      'headlesschrome',
+                      'remote_chrome',
+                      'firefox',
+                      'ff',
+                      'headlessfirefox',
+                      'remote_firefox']
+
+
+def create_driver(browser=None):
+    """Start a new WebDriver session.
+
+    Args:
+        browser (str, optional): One of SUPPORTED_BROWSERS. Defaults to the 'BROWSER' environment variable.
+            The remote browsers connect to the grid in the 'REMOTE_WEBDRIVER' environment variable.
+
+    Returns:
+        selenium.webdriver.remote.webdriver.WebDriver: The started driver.
+
+    Raises:
+        Exception: If no browser is given, the browser is not supported or 'REMOTE_WEBDRIVER' is missing.
+    """
+    browser = browser or os.environ.get('BROWSER', None)
+    if not browser:
+        raise Exception("The environment variable 'BROWSER' must be set.")
+
+    browser = browser.lower()
+
+    if browser not in SUPPORTED_BROWSERS:
+        raise Exception(f"Provided browser '{browser}' is not one of the supported."
+                        f"Supported are: {SUPPORTED_BROWSERS}")
+
+    if browser in ('chrome', 'ch'):
+        driver = webdriver.Chrome()
+    elif browser in ('firefox', 'ff'):
+        driver = webdriver.Firefox()
+    elif browser in ('headlesschrome'):
+        logger.info("Opening Chrome headless")
+        chrome_options = ChOptions()
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        driver = webdriver.Chrome(options=chrome_options)
+
+    elif browser == 'remote_chrome':
+        logger.info("Starting remote Chrome")
+        chrome_remote_url = os.environ.get("REMOTE_WEBDRIVER")
+        if not chrome_remote_url:
+            raise Exception(f"If 'browser=remote_chrome' then 'REMOTE_WEBDRIVER' variable must be set.")
+
+        chrome_options = ChOptions()
+        chrome_options.add_argument('--ignore-ssl-errors=yes')
+        chrome_options.add_argument('--ignore-certificate-errors')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        driver = webdriver.Remote(command_executor=chrome_remote_url, options=chrome_options)
+
+    elif browser == 'remote_firefox':
+        remote_url = os.environ.get("REMOTE_WEBDRIVER")
+        if not remote_url:
+            raise Exception("REMOTE_WEBDRIVER must be set for remote_firefox")
+
+        ff_options = FFOptions()
+        ff_options.accept_insecure_certs = True
+        driver = webdriver.Remote(
+        command_executor=remote_url,
+        options=ff_options
+        )
+    elif browser == 'headlessfirefox':
+        ff_options = FFOptions()
+        ff_options.add_argument("--disable-gpu")
+        ff_options.add_argument("--no-sandbox")
+        ff_options.add_argument("--headless")
+        service = FFService(executable_path="/usr/local/bin/geckodriver")
+        driver = webdriver.Firefox(service=service, options=ff_options)
+
+    logger.debug("############### BROWSER INFORMATION #####################")
+    for k, v in driver.capabilities.items():
+        logger.debug(f"{k}: {v}")
+    logger.debug("#########################################################")
+
+    return driver
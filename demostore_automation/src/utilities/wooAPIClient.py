@@ -0,0 +1,58 @@
+"""WooCommerce REST client that accepts extra request headers.
+
+`woocommerce.API` builds the request headers itself and passes any other keyword
+arguments on to `requests.request`, so there is no way to add a header such as
+'If-None-Match'. WooAPIClient overrides the (name-mangled) request method of the
+library to merge extra headers; without them it behaves exactly like `API`.
+"""
+from json import dumps as jsonencode
+from urllib.parse import urlencode
+from requests import request
+from requests.auth import HTTPBasicAuth
+from woocommerce import API
+
+
+class WooAPIClient(API):
+    """`woocommerce.API` with an optional 'headers' argument on every request method."""
+
+    def _API__request(self, method, endpoint, data, params=None, headers=None, **kwargs):
+        if not headers:
+            return super()._API__request(method, endpoint, data, params=params, **kwargs)
+
+        # same as woocommerce 3.0.0 API.__request, plus the extra headers
+        if params is None:
+            params = {}
+        url = self._API__get_url(endpoint)
+        auth = None
+        request_headers = {
+            "user-agent": f"{self.user_agent}",
+            "accept": "application/json"
+        }
+        request_headers.update(headers)
+
+        if self.is_ssl is True and self.query_string_auth is False:
+            auth = HTTPBasicAuth(self.consumer_key, self.consumer_secret)
+        elif self.is_ssl is True and self.query_string_auth is True:
+            params.update({
+                "consumer_key": self.consumer_key,
+                "consumer_secret": self.consumer_secret
+            })
+        else:
+            url = f"{url}?{urlencode(params)}"
+            url = self._API__get_oauth_url(url, method, **kwargs)
+
+        if data is not None:
+            data = jsonencode(data, ensure_ascii=False).encode('utf-8')
+            request_headers["content-type"] = "application/json;charset=utf-8"
+
+        return request(
+            method=method,
+            url=url,
+            verify=self.verify_ssl,
+            auth=auth,
+            params=params,
+            data=data,
+            timeout=self.timeout,
+            headers=request_headers,
+            **kwargs
+        )
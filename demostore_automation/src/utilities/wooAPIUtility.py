@@ -4,16 +4,36 @@ response validation, and logging.
 """
 from demostore_automation.src.configs.MainConfigs import MainConfigs
 from demostore_automation.src.utilities.credentialsUtility import CredentialsUtility
-from woocommerce import API
+from demostore_automation.src.utilities.apiMetricsUtility import api_metrics
+from demostore_automation.src.utilities.jsonStreamUtility import iter_json_array
+from demostore_automation.src.utilities.jsonUtility import decode_response, select_decoder
+from demostore_automation.src.utilities.rateLimitUtility import endpoint_group, get_rate_limiter
+from demostore_automation.src.utilities.responseCacheUtility import response_cache, validator_store
+from demostore_automation.src.utilities.retryUtility import (build_retry_policies, resilience_events,
+                                                            store_circuit_breaker)
+from demostore_automation.src.utilities.wooAPIClient import WooAPIClient
 import logging as logger
+import requests
+import time
+
+_UNPARSED = object()
+
+
+def with_fields(params, fields):
+    """Return a copy of the query params with the '_fields' projection added, or the params unchanged without fields."""
+    if not fields:
+        return params
+    return {**(params or {}), "_fields": fields if isinstance(fields, str) else ",".join(fields)}
+
 
 class WooAPIUtility:
     """Wrapper around WooCommerce REST API using the 'woocommerce' Python package.
     Initializes API client with credentials and base URL from configuration utilities.
 
     Attributes:
-        wcapi (API): Instance of WooCommerce API client.
+        wcapi (WooAPIClient): Instance of WooCommerce API client.
         base_url (str): Base URL for the WooCommerce API.
+        rs_json: JSON body of the last response, decoded on first access.
     """
 
     def __init__(self):
@@ -22,13 +42,112 @@ class WooAPIUtility:
 
         self.base_url = MainConfigs.get_base_url()
 
-        self.wcapi = API(
+        self.wcapi = WooAPIClient(
             url=self.base_url,
             consumer_key=wc_creds['woo_key'],
             consumer_secret=wc_creds['woo_secret'],
             version="wc/v3"
         )
 
+        retry_configs = MainConfigs.get_api_retry_configs()
+        self.retry_policies = build_retry_policies(retry_configs)
+        store_circuit_breaker.configure(retry_configs['circuit_failure_threshold'],
+                                        retry_configs['circuit_reset_timeout'])
+        self.rate_limiter = get_rate_limiter(MainConfigs.get_api_rate_limit_configs())
+        select_decoder(MainConfigs.get_api_json_decoder())
+        self._rs_api = None
+        self._rs_json = None
+        cache_configs = MainConfigs.get_api_cache_configs()
+        response_cache.configure(cache_configs['ttl'], cache_configs['max_entries'], cache_configs['enabled'])
+        validator_store.configure(cache_configs['max_entries'], cache_configs['enabled'])
+
+    @property
+    def rs_json(self):
+        if self._rs_json is _UNPARSED:
+            self._rs_json = decode_response(self._rs_api)
+        return self._rs_json
+
+    @rs_json.setter
+    def rs_json(self, value):
+        self._rs_json = value
+
+    def _set_response(self, rs_api, wc_endpoint, expected_status_code):
+        # the body is only decoded when rs_json is read
+        self._rs_api = rs_api
+        self._rs_json = _UNPARSED
+        self.status_code = rs_api.status_code
+        self.expected_status_code = expected_status_code
+        self.endpoint = wc_endpoint
+        self.url = rs_api.url
+
+    def _send(self, method, wc_endpoint, expected_status_code=None, **kwargs):
+        """Send a request through the WooCommerce client, retrying transient failures, and record its latency.
+
+        Requests first wait for the rate limit and max in flight of their endpoint group
+        (when enabled); the wait is not part of the recorded latency. Connection errors,
+        timeouts and the policy's retry statuses (429, 5xx) are retried for the methods
+        enabled in `MainConfigs.get_api_retry_configs()`, unless the status is the expected
+        one. Connection errors and 5xx responses count as store failures for the circuit breaker.
+
+        Args:
+            method (str): HTTP method, one of 'GET', 'POST', 'PUT', 'DELETE'.
+            wc_endpoint (str): The WooCommerce API endpoint.
+            expected_status_code (int, optional): Status the caller expects, never retried.
+            **kwargs: Passed through to the WooCommerce client method. With stream=True the
+                latency is the time to the response headers, and the max in flight slot is
+                released once the headers arrive: the body is read by the caller outside the
+                governor (the page still takes a rate limit token). Holding the slot until the
+                caller closes the response would deadlock a caller that calls the same endpoint
+                group while iterating, e.g. with max in flight 1 per xdist worker.
+
+        Returns:
+            requests.Response: The raw API response.
+
+        Raises:
+            CircuitOpenError: If the store circuit is open.
+            requests.exceptions.RequestException: If the last attempt failed without a response.
+        """
+        policy = self.retry_policies[method]
+        attempt = 0
+        while True:
+            attempt += 1
+            store_circuit_breaker.before_call(method, wc_endpoint)
+            try:
+                with self.rate_limiter.limit(wc_endpoint):
+                    start = time.perf_counter()
+                    rs_api = getattr(self.wcapi, method.lower())(wc_endpoint, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                api_metrics.record(method, wc_endpoint, e.__class__.__name__, time.perf_counter() - start, 0)
+                store_circuit_breaker.record_failure(method, wc_endpoint, e.__class__.__name__)
+                if not policy.should_retry(attempt, error=e):
+                    raise
+                self._wait_before_retry(policy, method, wc_endpoint, attempt, e.__class__.__name__)
+                continue
+
+            # reading 'content' of a streamed response would load the whole body
+            payload_size = int(rs_api.headers.get('Content-Length', 0)) if kwargs.get('stream') else len(rs_api.content)
+            api_metrics.record(method, wc_endpoint, rs_api.status_code, time.perf_counter() - start, payload_size)
+            self.rate_limiter.record_status(endpoint_group(wc_endpoint), rs_api.status_code)
+            if rs_api.status_code >= 500:
+                store_circuit_breaker.record_failure(method, wc_endpoint, rs_api.status_code)
+            else:
+                store_circuit_breaker.record_success()
+
+            if rs_api.status_code == expected_status_code or not policy.should_retry(attempt, rs_api.status_code):
+                return rs_api
+            rs_api.close()  # an unread streamed body keeps its pooled connection busy otherwise
+            self._wait_before_retry(policy, method, wc_endpoint, attempt, rs_api.status_code,
+                                    rs_api.headers.get('Retry-After'))
+
+    @staticmethod
+    def _wait_before_retry(policy, method, wc_endpoint, attempt, reason, retry_after=None):
+        delay = policy.delay(attempt, retry_after)
+        resilience_events.record('retry', method, wc_endpoint, f"attempt {attempt} failed with {reason}, "
+                                                               f"retrying in {delay:.2f}s")
+        logger.warning(f"{method} {wc_endpoint} attempt {attempt}/{policy.max_attempts} failed with {reason}. "
+                       f"Retrying in {delay:.2f}s")
+        time.sleep(delay)
+
     def assert_status_code(self):
         """Asserts that the actual response status code matches the expected status code.
 
@@ -37,7 +156,14 @@ class WooAPIUtility:
         """
         assert self.status_code == self.expected_status_code, f"Bad Status code." \
           f"Expected {self.expected_status_code}, Actual status code: {self.status_code}," \
-          f"URL: {self.url}, Response Json: {self.rs_json}"
+          f"URL: {self.url}, Response Json: {self._body_for_message()}"
+
+    def _body_for_message(self):
+        try:
+            return self.rs_json
+        except ValueError:
+            # e.g. an HTML error page of the web server
+            return self._rs_api.text[:500]
 
     def post(self, wc_endpoint, params=None, expected_status_code=200):
         """Send a POST request to a WooCommerce API endpoint.
@@ -54,20 +180,18 @@ class WooAPIUtility:
             AssertionError: If the response status code does not match expected_status_code.
         """
 
-        rs_api = self.wcapi.post(wc_endpoint, data=params)
+        rs_api = self._send('POST', wc_endpoint, data=params, expected_status_code=expected_status_code)
+        response_cache.invalidate(wc_endpoint)
 
-        self.status_code = rs_api.status_code
-        self.expected_status_code = expected_status_code
-        self.rs_json = rs_api.json()
-        self.endpoint = wc_endpoint
-        self.url = rs_api.url
+        self._set_response(rs_api, wc_endpoint, expected_status_code)
         self.assert_status_code()
 
-        logger.debug(f"POST API response: {self.rs_json}")
+        logger.debug("POST API response: %s", self.rs_json)
 
         return self.rs_json
 
-    def get(self, woo_endpoint, params=None, return_headers=False, expected_status_code=200):
+    def get(self, woo_endpoint, params=None, return_headers=False, expected_status_code=200, cache=False,
+            conditional=False, fields=None):
         """Send a GET request to a WooCommerce API endpoint.
 
         Args:
@@ -75,6 +199,13 @@ class WooAPIUtility:
             params (dict, optional): Query parameters to send with the GET request.
             return_headers (bool, optional): Whether to return response headers alongside JSON. Defaults to False.
             expected_status_code (int, optional): Expected HTTP status code, defaults to 200.
+            cache (bool, optional): Answer from the response cache if possible and cache a 200 response.
+                Only for data no test modifies, e.g. seeded products and coupons. Defaults to False.
+            conditional (bool, optional): Send the validators of the previous response of this URL and
+                reuse its JSON on a 304 or an identical body. For repeated reads, e.g. polling; the returned
+                JSON is shared with later conditional reads and must not be modified. Defaults to False.
+            fields (list[str] or str, optional): Only return these fields (WooCommerce '_fields' projection),
+                e.g. ['id', 'name']. Defaults to all fields.
 
         Returns:
             dict or dict: JSON response from the API, or dict containing 'response_json' and 'headers' if return_headers is True.
@@ -83,20 +214,121 @@ class WooAPIUtility:
             AssertionError: If the response status code does not match expected_status_code.
         """
 
-        rs_api = self.wcapi.get(woo_endpoint, params=params)
-        self.status_code = rs_api.status_code
-        self.expected_status_code = expected_status_code
-        self.rs_json = rs_api.json()
-        self.endpoint = woo_endpoint
-        self.url = rs_api.url
+        params = with_fields(params, fields)
+        cache = cache and expected_status_code == 200
+        cached = response_cache.get(woo_endpoint, params) if cache else None
+        if cached:
+            self.status_code = 200
+            self.expected_status_code = expected_status_code
+            self.rs_json = cached['rs_json']
+            self.endpoint = woo_endpoint
+            self.url = cached['url']
+            logger.debug("GET %s answered from the response cache", woo_endpoint)
+            return {'response_json': self.rs_json, 'headers': cached['headers']} if return_headers else self.rs_json
+
+        conditional = conditional and expected_status_code == 200 and validator_store.enabled
+        if conditional:
+            rs_api, self.rs_json = self._conditional_get(woo_endpoint, params)
+            self._rs_api = rs_api
+            # a 304 stands for the 200 response it revalidated
+            self.status_code = 200 if rs_api.status_code == 304 else rs_api.status_code
+            self.expected_status_code = expected_status_code
+            self.endpoint = woo_endpoint
+            self.url = rs_api.url
+        else:
+            rs_api = self._send('GET', woo_endpoint, params=params, expected_status_code=expected_status_code)
+            self._set_response(rs_api, woo_endpoint, expected_status_code)
         self.assert_status_code()
+        if cache:
+            response_cache.put(woo_endpoint, params, self.rs_json, self.url, rs_api.headers)
 
-        logger.debug(f"GET API response: {self.rs_json}")
+        logger.debug("GET API response: %s", self.rs_json)
         if return_headers:
             return {'response_json': self.rs_json, 'headers': rs_api.headers}
         else:
             return self.rs_json
 
+    def iter_pages(self, woo_endpoint, params=None, fields=None, per_page=100, cache=False):
+        """Yield the pages of a list endpoint, one GET per page.
+
+        Stops at the page count from the 'X-WP-TotalPages' header, or at the first short page.
+
+        Args:
+            woo_endpoint (str): List endpoint, e.g. 'products'.
+            params (dict, optional): Query parameters, e.g. filters.
+            fields (list[str] or str, optional): Only request these fields of every item, e.g. ['id', 'name'].
+            per_page (int, optional): Items per page, at most 100. Defaults to 100.
+            cache (bool, optional): Use the response cache for every page. Defaults to False.
+
+        Yields:
+            list[dict]: The items of one page.
+        """
+        page = 1
+        while True:
+            page_params = {**(params or {}), "page": page, "per_page": per_page}
+            rs = self.get(woo_endpoint, params=page_params, return_headers=True, cache=cache, fields=fields)
+            items = rs['response_json']
+            if items:
+                yield items
+            total_pages = rs['headers'].get('X-WP-TotalPages')
+            if not items or (int(total_pages) <= page if total_pages else len(items) < per_page):
+                return
+            page += 1
+
+    def iter_get(self, woo_endpoint, params=None, fields=None, per_page=100, chunk_size=65536):
+        """Yield the items of a list endpoint one at a time, parsing every page while it streams in.
+
+        Unlike `iter_pages`, no page is held in memory as a whole, so memory stays flat for
+        large pages, e.g. orders with many line items. Pages are requested until the page
+        count from 'X-WP-TotalPages', or until a short page.
+
+        With API_RATE_LIMIT enabled every page waits for a token and a max in flight slot,
+        but the slot is released when the headers arrive, so the streamed body does not
+        count against max in flight (see `_send`).
+
+        Args:
+            woo_endpoint (str): List endpoint, e.g. 'orders'.
+            params (dict, optional): Query parameters, e.g. filters.
+            fields (list[str] or str, optional): Only request these fields of every item.
+            per_page (int, optional): Items per page, at most 100. Defaults to 100.
+            chunk_size (int, optional): Bytes read from the connection at a time. Defaults to 64 KB.
+
+        Yields:
+            dict: One item of the list.
+
+        Raises:
+            AssertionError: If a page response status code is not 200.
+        """
+        page = 1
+        while True:
+            page_params = with_fields({**(params or {}), "page": page, "per_page": per_page}, fields)
+            rs_api = self._send('GET', woo_endpoint, params=page_params, expected_status_code=200, stream=True)
+            try:
+                self._set_response(rs_api, woo_endpoint, 200)
+                self.assert_status_code()
+                rs_api.raw.decode_content = True  # ijson reads the raw stream, let urllib3 un-gzip it
+                count = 0
+                for item in iter_json_array(rs_api.iter_content(chunk_size), raw=rs_api.raw):
+                    count += 1
+                    yield item
+            finally:
+                rs_api.close()
+            total_pages = rs_api.headers.get('X-WP-TotalPages')
+            if not count or (int(total_pages) <= page if total_pages else count < per_page):
+                return
+            page += 1
+
+    def _conditional_get(self, woo_endpoint, params):
+        headers = validator_store.request_headers(woo_endpoint, params)
+        rs_api = self._send('GET', woo_endpoint, params=params, expected_status_code=200,
+                            **({'headers': headers} if headers else {}))
+        rs_json = validator_store.resolve(woo_endpoint, params, rs_api)
+        if rs_json is None and rs_api.status_code == 304:
+            # the stored body was evicted meanwhile, fetch it again
+            rs_api = self._send('GET', woo_endpoint, params=params, expected_status_code=200)
+            rs_json = validator_store.resolve(woo_endpoint, params, rs_api)
+        return rs_api, rs_json
+
     def put(self, wc_endpoint, params=None, expected_status_code=200):
         """Send a PUT request to a WooCommerce API endpoint.
 
@@ -112,42 +344,41 @@ class WooAPIUtility:
             AssertionError: If the response status code does not match expected_status_code.
         """
 
-        rs_api = self.wcapi.put(wc_endpoint, data=params)
-        self.status_code = rs_api.status_code
-        self.expected_status_code = expected_status_code
-        self.rs_json = rs_api.json()
-        self.endpoint = wc_endpoint
-        self.url = rs_api.url
+        rs_api = self._send('PUT', wc_endpoint, data=params, expected_status_code=expected_status_code)
+        response_cache.invalidate(wc_endpoint)
+        self._set_response(rs_api, wc_endpoint, expected_status_code)
         self.assert_status_code()
 
-        logger.debug(f"PUT API response: {self.rs_json}")
+        logger.debug("PUT API response: %s", self.rs_json)
 
         return self.rs_json
 
-    def delete(self, wc_endpoint, params=None, expected_status_code=200):
+    def delete(self, wc_endpoint, params=None, expected_status_code=200, parse_response=True):
         """Send a DELETE request to a WooCommerce API endpoint.
 
         Args:
             wc_endpoint (str): The WooCommerce API endpoint to delete.
             params (dict, optional): Parameters to send with the DELETE request.
             expected_status_code (int, optional): Expected HTTP status code, defaults to 200.
+            parse_response (bool, optional): Decode and return the deleted resource. Pass False when the
+                response is not used, e.g. in teardowns; `rs_json` still decodes it on access. Defaults to True.
 
         Returns:
-            dict: JSON response from the API.
+            dict: JSON response from the API, None if parse_response is False.
 
         Raises:
             AssertionError: If the response status code does not match expected_status_code.
         """
 
-        rs_api = self.wcapi.delete(wc_endpoint, params=params)
-        self.status_code = rs_api.status_code
-        self.expected_status_code = expected_status_code
-        self.rs_json = rs_api.json()
-        self.endpoint = wc_endpoint
-        self.url = rs_api.url
+        rs_api = self._send('DELETE', wc_endpoint, params=params, expected_status_code=expected_status_code)
+        response_cache.invalidate(wc_endpoint)
+        self._set_response(rs_api, wc_endpoint, expected_status_code)
         self.assert_status_code()
 
-        logger.debug(f"DELETE API response: {self.rs_json}")
+        if not parse_response:
+            logger.debug("DELETE API response status: %s", self.status_code)
+            return None
+        logger.debug("DELETE API response: %s", self.rs_json)
 
         return self.rs_json
 
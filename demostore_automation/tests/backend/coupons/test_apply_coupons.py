@@ -52,11 +52,11 @@ def apply_coupon_setup():
     yield info
 
     for ord_id in info["order_ids"]: # teardown
-        info["orders_api_helper"].call_delete_order(ord_id)
+        info["orders_api_helper"].call_delete_order(ord_id, parse_response=False)
         logger.info(f"Successfully deleted order id: {ord_id}")
 
     for coupon_id in info["coupon_ids"]:
-        info["coupons_api_helper"].call_delete_coupon(coupon_id)
+        info["coupons_api_helper"].call_delete_coupon(coupon_id, parse_response=False)
         logger.info(f"Successfully deleted coupon id: {coupon_id}")
 
 @pytest.mark.smoke
@@ -124,13 +124,13 @@ def test_apply_coupon_to_new_order(apply_coupon_setup, discount_type):
         discount_type, get_order, coupon_ids=apply_coupon_setup["coupon_ids"])
 
     # Get coupon details with GET call
-    coupon_details = apply_coupon_setup['coupons_api_helper'].call_retrieve_coupon(coupon_id)
+    coupon_details = apply_coupon_setup['coupons_api_helper'].call_retrieve_coupon(coupon_id, use_cache=True)
     coupon_type = coupon_details['discount_type']
     discount = coupon_details['amount']
     coupon_expiration = coupon_details['date_expires']
     logger.info(f"Found coupon with discount amount: {discount} discount_type: {coupon_type}. Coupon expiration date: {coupon_expiration}")
     assert coupon_details['status'] == 'publish', f"Error. Coupon status: {coupon_details['status']}."
-    assert apply_coupon_setup['generic_coupons_helper'].is_coupon_valid(coupon_id), f"Coupon is expired. Coupon expiration: {coupon_expiration}"
+    assert apply_coupon_setup['generic_coupons_helper'].is_coupon_valid(coupon_id, use_cache=True), f"Coupon is expired. Coupon expiration: {coupon_expiration}"
 
 
     # make api PUT call for order and add coupon_lines
@@ -0,0 +1,48 @@
+"""Concurrency tests for coupon usage limits.
+
+Applies a usage-limited coupon to more orders than the limit allows, many
+requests at the same time, and verifies that:
+- The coupon is never redeemed more often than its usage limit.
+- The API usage count, 'used_by' list and DB postmeta agree with the redeemed orders.
+
+Every case creates a coupon and up to 20 orders and bursts concurrent updates at the
+store, so the module only runs on request:
+    pytest tests/backend/coupons/test_coupon_usage_limit_race.py --coupon-contention
+"""
+import pytest
+import logging as logger
+from demostore_automation.src.load_testing.coupon_contention import CouponContention
+
+pytestmark = [pytest.mark.applycoupon, pytest.mark.coupon_contention]
+
+
+@pytest.mark.parametrize(
+    "orders, concurrency, usage_limit, usage_limit_per_user",
+    [
+        pytest.param(10, 10, 3, None, id="10_orders_all_at_once_limit_3"),
+        pytest.param(20, 5, 10, None, id="20_orders_5_at_once_limit_10"),
+        pytest.param(12, 12, 6, 1, id="12_orders_limit_1_per_user"),
+    ]
+)
+def test_coupon_usage_limit_under_contention(orders, concurrency, usage_limit, usage_limit_per_user):
+    """Fire concurrent coupon applications and check the usage invariants.
+
+    Args:
+        orders (int): Orders the coupon is applied to.
+        concurrency (int): Applications sent at the same time.
+        usage_limit (int): Usage limit of the coupon.
+        usage_limit_per_user (int): Per customer usage limit, None for no limit.
+    """
+    contention = CouponContention(orders=orders, concurrency=concurrency, usage_limit=usage_limit,
+                                  usage_limit_per_user=usage_limit_per_user, customers=6)
+    try:
+        result = contention.run()
+    finally:
+        contention.cleanup()
+
+    burst, verification = result['burst'], result['verification']
+    logger.info(f"Coupon contention result: {burst['accepted']}/{burst['applications']} accepted, "
+                f"status codes {burst['status_codes']}, over-redemption {verification['over_redemption']}")
+    assert not burst['not_sent'], f"{burst['not_sent']} applications were not sent, their batch barrier broke"
+    assert burst['accepted'] > 0, f"No coupon application was accepted. Samples: {burst['rejection_samples']}"
+    assert not verification['violations'], "Coupon usage invariants broken:\n  " + "\n  ".join(verification['violations'])
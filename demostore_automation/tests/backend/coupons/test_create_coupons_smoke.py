@@ -41,7 +41,7 @@ def setup_teardown():
     deleted = []
     for coupon_id in coupon_ids:
         try:
-            coupon_api_helper.call_delete_coupon(coupon_id)
+            coupon_api_helper.call_delete_coupon(coupon_id, parse_response=False)
             deleted.append(coupon_id)
 
         except Exception as e:
@@ -0,0 +1,35 @@
+"""Query plan regression tests for the DAO queries.
+
+Runs `EXPLAIN` for every DAO query in `DAO_QUERY_CALLS` against the target database
+and fails when a query scans a whole table, or a whole index beyond the limit,
+e.g. after a rewrite drops the indexed filter of a query.
+"""
+import pytest
+import logging as logger
+from demostore_automation.src.utilities.queryPlanUtility import (DAO_QUERY_CALLS, check_query_plans,
+                                                                   collect_dao_queries)
+
+pytestmark = [pytest.mark.beregression, pytest.mark.dao, pytest.mark.query_plans]
+
+
+@pytest.fixture(scope="module")
+def dao_queries():
+    return collect_dao_queries()
+
+
+@pytest.mark.parametrize("dao_cls, method_name, args", DAO_QUERY_CALLS,
+                         ids=[f"{dao_cls.__name__}.{method_name}" for dao_cls, method_name, args in DAO_QUERY_CALLS])
+def test_dao_query_has_no_full_scan(dao_queries, dao_cls, method_name, args):
+    """Verify that the DAO query seeks by an index instead of scanning a table.
+
+    Args:
+        dao_queries (dict): SQL of every DAO method, captured without running it.
+        dao_cls (type): DAO class.
+        method_name (str): DAO method.
+        args (tuple): Sample arguments the SQL was captured with.
+    """
+    name = f"{dao_cls.__name__}.{method_name}"
+    result = check_query_plans({name: dao_queries[name]})[0]
+    logger.info(f"Plan of {name}: {result['plan']}")
+    assert not result['full_scans'], (f"{name} scans a whole table or index: {result['full_scans']}. "
+                                      f"SQL: {result['sql']}")
@@ -83,10 +83,11 @@ def test_change_order_status(my_orders_smoke_setup, order_status):
         assert update_response['id'] == order_id, (f"Error. Wrong order_id after update api call. Expected: {order_id}"
                                                    f"Actual: {update_response['id']}")
 
-        # verify newly updated order via GET api call and DB query
-        get_response = my_orders_smoke_setup["generic_orders_helper"].verify_new_order_exists(order_id)
-        logger.info(f"GET response: {get_response}")
-
-        # verify correct status in API and DB, and for certain statuses (completed, cancelled, refunded),
-        # check that specific fields like 'needs_payment', 'date_completed', and 'refunds' are correct
-        my_orders_smoke_setup['generic_orders_helper'].verify_order_status(get_response, order_status)
\ No newline at end of file
+    # verify newly updated orders via list orders api call and DB query
+    order_ids = [create_order_response['id'] for create_order_response in create_order_responses]
+    get_responses = my_orders_smoke_setup["generic_orders_helper"].verify_new_orders_exist(order_ids)
+    logger.info(f"GET responses: {get_responses}")
+
+    # verify correct status in API and DB, and for certain statuses (completed, cancelled, refunded),
+    # check that specific fields like 'needs_payment', 'date_completed', and 'refunds' are correct
+    my_orders_smoke_setup['generic_orders_helper'].verify_order_statuses(list(get_responses.values()), order_status)
\ No newline at end of file
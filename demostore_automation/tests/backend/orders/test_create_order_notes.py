@@ -38,7 +38,7 @@ def order_notes_setup():
 
     # deleting order automatically deletes the order note(s)
     for order_id in info["order_ids"]:
-        orders_api_helpers.call_delete_order(order_id)
+        orders_api_helpers.call_delete_order(order_id, parse_response=False)
         logger.info(f"Deleted order id: {order_id} and all order notes")
     logger.info(f"Successfully deleted {len(info['order_ids'])} orders")
 
@@ -90,8 +90,9 @@ def test_create_order(my_orders_smoke_setup, user_type, order_qty, product_qty):
 
         logger.info(f"Successfully created order as {user_type} user")
 
-        # verify new order via GET api call and DB query
-        my_orders_smoke_setup["generic_orders_helper"].verify_new_order_exists(order_id)
+    # verify all new orders at once via list orders api call and DB query
+    created_order_ids = [create_order_response['id'] for create_order_response in create_order_responses]
+    my_orders_smoke_setup["generic_orders_helper"].verify_new_orders_exist(created_order_ids)
 
     logger.info(f"Created {len(create_order_responses)} orders via api")
 
@@ -51,7 +51,7 @@ def setup_teardown():
     deleted = []
     for product_id in product_ids:
         try:
-            products_api_helper.call_delete_product(product_id)
+            products_api_helper.call_delete_product(product_id, parse_response=False)
             deleted.append(product_id)
 
         except Exception as e:
@@ -13,8 +13,9 @@ pytestmark = [pytest.mark.beregression, pytest.mark.besmoke, pytest.mark.product
 @pytest.mark.pioneertcid15
 def test_get_all_products_returns_not_empty():
     woo_api_helper = WooAPIUtility()
-    rs_api = woo_api_helper.get("products", expected_status_code=200)
+    rs_api = woo_api_helper.get("products", expected_status_code=200, fields=["id", "name"])
     assert rs_api, "Get all products endpoint returned nothing."
+    assert set(rs_api[0]) == {"id", "name"}, f"Response was not limited to the requested fields: {list(rs_api[0])}"
 
 
 @pytest.mark.ebe27
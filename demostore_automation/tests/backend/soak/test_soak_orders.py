@@ -0,0 +1,78 @@
+"""Soak tests repeating order and order note scenarios for a long period.
+
+Covers:
+- Order create/update/delete cycles.
+- Order note create/retrieve/delete cycles.
+
+Only run with --soak-duration (minutes), e.g.:
+    pytest tests/backend/soak --soak-duration 120 --soak-interval 60
+
+The session 'soak_sampler' fixture samples RSS, open sockets, DB connections, WebDriver
+sessions and API latency while the scenarios loop, writes 'soak_report.json' and fails
+when any slope exceeds 'src/data/soak_thresholds.json'.
+"""
+import time
+import pytest
+import logging as logger
+from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
+from demostore_automation.src.generic_helpers.generic_orders_helper import GenericOrdersHelper
+
+pytestmark = [pytest.mark.soak, pytest.mark.orders]
+
+
+@pytest.fixture(scope="module")
+def soak_orders_setup(soak_sampler):
+    """Set up helpers and track orders left behind by a failed iteration."""
+    info = {
+        "orders_api_helper": OrdersAPIHelper(),
+        "generic_orders_helper": GenericOrdersHelper(),
+        "sampler": soak_sampler["sampler"],
+        "deadline": soak_sampler["deadline"],
+        "order_ids": []
+    }
+    yield info
+
+    for order_id in info["order_ids"]:
+        info["orders_api_helper"].call_delete_order(order_id, parse_response=False)
+        logger.info(f"Deleted leftover soak order id: {order_id}")
+
+
+def order_lifecycle(info):
+    """Create an order, move it to 'completed' and delete it."""
+    order = info["generic_orders_helper"].create_order()[0]
+    info["order_ids"].append(order['id'])
+    updated = info["orders_api_helper"].call_update_order(order['id'], payload={"status": "completed"})
+    assert updated['status'] == 'completed', f"Order status not updated. Actual: {updated['status']}"
+    info["orders_api_helper"].call_delete_order(order['id'], parse_response=False)
+    info["order_ids"].remove(order['id'])
+
+
+def order_note_lifecycle(info):
+    """Create an order with a note, verify it in API and DB, delete the note and the order."""
+    order = info["generic_orders_helper"].create_order()[0]
+    info["order_ids"].append(order['id'])
+    note_text = "Soak test note"
+    note = info["generic_orders_helper"].create_order_note(order['id'], payload={"note": note_text})[0]
+    info["generic_orders_helper"].verify_note_exists(order['id'], note['id'], note_text)
+    info["orders_api_helper"].call_delete_order_note(order['id'], note['id'], params={"force": True})
+    info["orders_api_helper"].call_delete_order(order['id'], parse_response=False)
+    info["order_ids"].remove(order['id'])
+
+
+def test_soak_order_scenarios(soak_orders_setup):
+    """Alternate the order and order note scenarios until the soak deadline.
+
+    Args:
+        soak_orders_setup (dict): Fixture providing helpers, the sampler and the deadline.
+    """
+    sampler = soak_orders_setup["sampler"]
+    scenarios = (order_lifecycle, order_note_lifecycle)
+
+    iterations = 0
+    while time.monotonic() < soak_orders_setup["deadline"]:
+        scenario = scenarios[iterations % len(scenarios)]
+        start = time.perf_counter()
+        scenario(soak_orders_setup)
+        sampler.record_iteration(time.perf_counter() - start)
+        iterations += 1
+    logger.info(f"Soak run completed {iterations} iterations")
@@ -0,0 +1,229 @@
+"""Shared fakes for the framework tests, which run without a store.
+
+The fakes are served as factory fixtures (the fixture returns the class), since test
+modules can not import from a conftest reliably.
+"""
+import io
+import json
+import pytest
+from demostore_automation.src.utilities import dbUtility, wooAPIUtility
+from demostore_automation.src.utilities.responseCacheUtility import response_cache, validator_store
+from demostore_automation.src.utilities.retryUtility import resilience_events, store_circuit_breaker
+from demostore_automation.src.utilities.wooAPIUtility import WooAPIUtility
+
+
+class FakeResponse:
+    """Stand-in for `requests.Response`, streamable through `raw` and `iter_content`."""
+
+    def __init__(self, status_code=200, body=None, headers=None, content=None,
+                 url='http://store/wp-json/wc/v3/x'):
+        self.status_code = status_code
+        self.body = {} if body is None and content is None else body
+        self.content = content if content is not None else json.dumps(self.body).encode()
+        self.text = self.content.decode('utf-8', 'replace')
+        self.headers = dict(headers or {})
+        self.url = url
+        self.raw = io.BytesIO(self.content)
+        self.closed = False
+        self.decoded = 0
+
+    def json(self):
+        self.decoded += 1
+        return json.loads(self.content.decode('utf-8-sig'))
+
+    def iter_content(self, chunk_size):
+        return (self.content[i:i + chunk_size] for i in range(0, len(self.content), chunk_size))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeWCAPI:
+    """Stand-in for the WooCommerce client.
+
+    Answers every request with `handler(method, endpoint, **kwargs)` when given, otherwise
+    with the queued `outcomes` in order. Exceptions among the outcomes are raised.
+
+    Attributes:
+        requests (list[tuple]): Sent requests as (method, endpoint, kwargs).
+        responses (list[FakeResponse]): Returned responses, in order.
+    """
+
+    def __init__(self, outcomes=None, handler=None):
+        self.outcomes = list(outcomes or [])
+        self.handler = handler
+        self.requests = []
+        self.responses = []
+
+    def _request(self, method, endpoint, **kwargs):
+        self.requests.append((method, endpoint, kwargs))
+        outcome = self.handler(method, endpoint, **kwargs) if self.handler else self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        self.responses.append(outcome)
+        return outcome
+
+    def get(self, endpoint, **kwargs):
+        return self._request('GET', endpoint, **kwargs)
+
+    def post(self, endpoint, data=None, **kwargs):
+        return self._request('POST', endpoint, **kwargs)
+
+    def put(self, endpoint, data=None, **kwargs):
+        return self._request('PUT', endpoint, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self._request('DELETE', endpoint, **kwargs)
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+
+def paged_handler(items, send_total_pages=True):
+    """Serve `items` as a WooCommerce list endpoint: 'page', 'per_page', '_fields' and 'X-WP-TotalPages'."""
+    def handler(method, endpoint, params=None, **kwargs):
+        start = (params['page'] - 1) * params['per_page']
+        page = items[start:start + params['per_page']]
+        if params.get('_fields'):
+            fields = params['_fields'].split(',')
+            page = [{k: v for k, v in item.items() if k in fields} if isinstance(item, dict) else item
+                    for item in page]
+        headers = {}
+        if send_total_pages:
+            headers['X-WP-TotalPages'] = str(max(-(-len(items) // params['per_page']), 1))
+        return FakeResponse(200, page, headers, url=f'http://store/wp-json/wc/v3/{endpoint}')
+    return handler
+
+
+class FakeCursor:
+    """Stand-in for a pymysql cursor over fixed rows.
+
+    Serves the rows as dicts for the dict cursor classes, as tuples otherwise.
+
+    Attributes:
+        executed (list[str]): Executed SQL, in order.
+        fetches (int): Number of `fetchmany` calls.
+        connection (FakeConnection): Connection the cursor was opened on.
+    """
+
+    def __init__(self, columns, rows):
+        self.description = [(column, None, None, None, None, None, None) for column in columns]
+        self.rows = list(rows)
+        self.cursor_class = None
+        self.connection = None
+        self.executed = []
+        self.fetches = 0
+        self.closed = False
+
+    def _shape(self, rows):
+        if self.cursor_class in (dbUtility.pymysql.cursors.DictCursor, dbUtility.pymysql.cursors.SSDictCursor):
+            columns = [column[0] for column in self.description]
+            return [dict(zip(columns, row)) for row in rows]
+        return tuple(rows)
+
+    def execute(self, sql):
+        self.executed.append(sql)
+
+    def fetchall(self):
+        return self._shape(self.rows)
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        self.fetches += 1
+        return self._shape(batch)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Stand-in for a pymysql connection that opens the one `cursor`.
+
+    Attributes:
+        cursor_classes (list): Cursor class of every `cursor()` call, None for the default.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        cursor.connection = self
+        self.cursor_classes = []
+        self.closed = False
+
+    def cursor(self, cursor_class=None):
+        self.cursor_classes.append(cursor_class)
+        self._cursor.cursor_class = cursor_class
+        return self._cursor
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_response():
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_wcapi():
+    return FakeWCAPI
+
+
+@pytest.fixture
+def paged_wcapi():
+    """Return a factory of FakeWCAPI serving a list of items page by page."""
+    return lambda items, send_total_pages=True: FakeWCAPI(handler=paged_handler(items, send_total_pages))
+
+
+@pytest.fixture
+def woo_api_env():
+    """Extra environment variables for `woo_env`, override in a test module to change the API configs."""
+    return {}
+
+
+@pytest.fixture
+def woo_env(monkeypatch, woo_api_env):
+    """Offline API environment: credentials, no retry sleeps and fresh shared breaker, events and caches."""
+    for name, value in {'WOO_KEY': 'ck_test', 'WOO_SECRET': 'cs_test', 'BASE_URL': 'http://store',
+                        **woo_api_env}.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(wooAPIUtility.time, 'sleep', lambda seconds: None)
+    shared_state = (store_circuit_breaker, resilience_events)
+    for state in shared_state:
+        state.reset()
+    response_cache.clear()
+    validator_store.clear()
+    yield
+    for state in shared_state:
+        state.reset()
+    response_cache.clear()
+    validator_store.clear()
+
+
+@pytest.fixture
+def woo_api(woo_env):
+    return WooAPIUtility()
+
+
+@pytest.fixture
+def db_settings():
+    """Database environment variables for `db_env`, override in a test module to change them."""
+    return {'DB_HOST': 'localhost', 'DB_PORT': '3306', 'DB_DATABASE': 'demostore', 'DB_TABLE_PREFIX': 'wp_',
+            'DB_USER': 'user', 'DB_PASSWORD': 'password'}
+
+
+@pytest.fixture
+def db_env(monkeypatch, db_settings):
+    for name, value in db_settings.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture
+def fake_db(monkeypatch, db_env):
+    """Return `install(columns, rows)`, which makes every DB connection serve `rows` and returns the cursor."""
+    def install(columns, rows):
+        cursor = FakeCursor(columns, rows)
+        connection = FakeConnection(cursor)
+        monkeypatch.setattr(dbUtility.pymysql, 'connect', lambda **kwargs: connection)
+        return cursor
+    return install
@@ -0,0 +1,75 @@
+"""Tests for the API latency instrumentation used by WooAPIUtility.
+
+These tests do not need a running store; they exercise endpoint normalization,
+histogram percentiles and the slow-call tracking of ApiMetrics directly.
+"""
+import json
+import pytest
+from demostore_automation.src.utilities.apiMetricsUtility import ApiMetrics, LatencyHistogram, normalize_endpoint
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        pytest.param("orders", "orders", id="collection"),
+        pytest.param("orders/123", "orders/{id}", id="single_id"),
+        pytest.param("orders/123/notes/45", "orders/{id}/notes/{id}", id="nested_ids"),
+        pytest.param("orders/123/refunds/", "orders/{id}/refunds", id="trailing_slash"),
+        pytest.param("products/reviews", "products/reviews", id="no_ids"),
+    ]
+)
+def test_normalize_endpoint(endpoint, expected):
+    assert normalize_endpoint(endpoint) == expected, (f"Wrong endpoint template for '{endpoint}'."
+                                                      f"Expected: {expected}, Actual: {normalize_endpoint(endpoint)}")
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for latency in [20] * 90 + [180] * 9 + [2500]:
+        histogram.add(latency, 200, 100)
+
+    assert histogram.total_calls == 100
+    assert histogram.percentile(50) == 25, f"Expected p50 in the 25ms bucket. Actual: {histogram.percentile(50)}"
+    assert histogram.percentile(95) == 200, f"Expected p95 in the 200ms bucket. Actual: {histogram.percentile(95)}"
+    assert histogram.percentile(99) == 200, f"Expected p99 in the 200ms bucket. Actual: {histogram.percentile(99)}"
+    assert histogram.percentile(100) == 2500, f"Expected p100 capped at max. Actual: {histogram.percentile(100)}"
+
+
+def test_api_metrics_summary_and_slow_calls(tmp_path):
+    metrics = ApiMetrics(max_slow_calls=2)
+    metrics.current_test = "tests/test_a.py::test_one"
+    metrics.record("GET", "orders/1", 200, 0.010, 500)
+    metrics.record("GET", "orders/2", 200, 0.300, 500)
+    metrics.current_test = "tests/test_a.py::test_two"
+    metrics.record("POST", "orders/2/notes", 201, 0.900, 200)
+    metrics.record("GET", "orders/3", 404, 0.050, 50)
+
+    summary = metrics.summary()
+    assert summary['total_calls'] == 4
+    endpoints = {(e['method'], e['endpoint']): e for e in summary['endpoints']}
+    assert endpoints[('GET', 'orders/{id}')]['calls'] == 3
+    assert endpoints[('GET', 'orders/{id}')]['status_codes'] == {'200': 2, '404': 1}
+    assert summary['endpoints'][0]['endpoint'] == 'orders/{id}/notes', "Endpoints must be sorted by total time."
+
+    slowest = summary['slowest_calls']
+    assert [c['latency_ms'] for c in slowest] == [900.0, 300.0], f"Wrong slowest calls: {slowest}"
+    assert slowest[0]['test'] == "tests/test_a.py::test_two"
+    assert metrics.get_test_totals("tests/test_a.py::test_one") == (2, 310.0)
+
+    json_file = tmp_path / "api_metrics.json"
+    metrics.write_json(str(json_file), summary)
+    assert json.loads(json_file.read_text())['total_calls'] == 4
+
+
+def test_slow_calls_with_equal_latency_are_kept():
+    metrics = ApiMetrics(max_slow_calls=2)
+    metrics.record("GET", "orders/1", 200, 0.100)  # outside a test, test id None
+    metrics.current_test = "tests/test_a.py::test_one"
+    metrics.record("GET", "orders/1", 200, 0.100)
+    metrics.record("GET", "orders/1", None, 0.100)
+    metrics.record("GET", "orders/1", 200, 0.200)
+
+    slowest = metrics.summary()['slowest_calls']
+    assert [c['latency_ms'] for c in slowest] == [200.0, 100.0], f"Wrong slowest calls: {slowest}"
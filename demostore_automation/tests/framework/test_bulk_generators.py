@@ -0,0 +1,38 @@
+"""Tests for the bulk test-data generators in genericUtilities (no store needed)."""
+import pytest
+from demostore_automation.src.utilities.genericUtilities import (generate_bulk_addresses, generate_bulk_emails,
+                                                                  generate_bulk_names, generate_bulk_passwords,
+                                                                  generate_bulk_skus, generate_bulk_unique_strings)
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_bulk_values_are_unique_even_with_short_random_part():
+    emails = generate_bulk_emails(50000, length=2)  # 1024 random combinations only
+    assert len(set(emails)) == 50000
+    assert all(e.startswith('testuser_') and e.endswith('@supersqa.com') for e in emails[:100])
+    skus = generate_bulk_skus(20000, length=1)
+    assert len(set(skus)) == 20000
+
+
+def test_unique_across_xdist_workers(monkeypatch):
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw1')
+    first = generate_bulk_unique_strings(1000, length=1, seed=3)
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw12')
+    second = generate_bulk_unique_strings(1000, length=1, seed=3)
+    assert not set(first) & set(second)
+
+
+def test_seeded_generation_is_reproducible():
+    assert generate_bulk_passwords(5, seed=42) == generate_bulk_passwords(5, seed=42)
+    assert generate_bulk_names(5, seed=42) == generate_bulk_names(5, seed=42)
+    assert generate_bulk_addresses(5, seed=42) == generate_bulk_addresses(5, seed=42)
+    random_parts = [e.split('_')[1] for e in generate_bulk_emails(5, seed=42)]
+    assert random_parts == [e.split('_')[1] for e in generate_bulk_emails(5, seed=42)]
+
+
+def test_value_formats():
+    assert all(len(p) == 20 for p in generate_bulk_passwords(100))
+    address = generate_bulk_addresses(1)[0]
+    assert address['country'] == 'US' and len(address['postcode']) == 5
+    assert set(generate_bulk_names(1)[0]) == {'first_name', 'last_name'}
@@ -0,0 +1,28 @@
+"""Tests for the throughput ceiling detection of the checkout stress runner (no browser needed)."""
+import pytest
+from demostore_automation.src.load_testing.checkout_stress import find_throughput_ceiling
+
+pytestmark = [pytest.mark.framework]
+
+
+def _run(sessions, per_min, error_rate=0.0):
+    return {"sessions": sessions, "checkouts_per_min": per_min, "error_rate": error_rate}
+
+
+def test_ceiling_where_throughput_flattens():
+    runs = [_run(1, 6), _run(2, 11), _run(4, 20), _run(8, 21)]
+    ceiling = find_throughput_ceiling(runs)
+    assert ceiling['sessions'] == 4, f"Wrong ceiling: {ceiling}"
+    assert "gain below" in ceiling['reason']
+
+
+def test_ceiling_where_errors_start():
+    runs = [_run(1, 6), _run(2, 12), _run(4, 23, error_rate=0.2)]
+    ceiling = find_throughput_ceiling(runs)
+    assert ceiling['sessions'] == 2
+    assert "error rate" in ceiling['reason']
+
+
+def test_ceiling_not_reached_or_no_healthy_level():
+    assert find_throughput_ceiling([_run(1, 6), _run(2, 12)])['reason'].startswith("not reached")
+    assert find_throughput_ceiling([_run(1, 0, error_rate=1.0)]) is None
@@ -0,0 +1,42 @@
+"""Tests for the coupon usage invariants of the contention harness (no store needed)."""
+import pytest
+from demostore_automation.src.load_testing.coupon_contention import CouponContention, check_usage_invariants
+
+pytestmark = [pytest.mark.framework]
+
+
+def _orders(*customers):
+    return [{"id": 100 + i, "customer": c} for i, c in enumerate(customers)]
+
+
+def test_consistent_usage_has_no_violations():
+    api_coupon = {"usage_count": 3, "used_by": ["1", "2", "a@b.com"]}
+    db_usage = {"usage_count": 3, "used_by": ["a@b.com", "1", "2"]}
+    assert check_usage_invariants(3, 3, api_coupon, db_usage, _orders(1, 2, "a@b.com"), usage_limit_per_user=1) == []
+
+
+def test_over_redemption_and_lost_update_are_reported():
+    # 5 orders got the coupon with a limit of 3, but two concurrent increments were lost
+    api_coupon = {"usage_count": 3, "used_by": ["1", "2", "3"]}
+    db_usage = {"usage_count": 3, "used_by": ["1", "2", "3"]}
+    violations = check_usage_invariants(3, 5, api_coupon, db_usage, _orders(1, 2, 3, 1, 2), usage_limit_per_user=1)
+
+    assert any(v.startswith("Over-redemption: coupon is on 5 orders") for v in violations), violations
+    assert any("does not match 5 redeemed orders" in v for v in violations), violations
+    assert sum(v.startswith("Over-redemption: customer") for v in violations) == 2, violations
+
+
+def test_worker_failing_before_the_barrier_does_not_hang_its_batch(monkeypatch):
+    contention = CouponContention(orders=3, concurrency=3, barrier_timeout=5)
+    contention.order_ids = [1, 2, 3]
+    calls = []
+
+    def helper():
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("could not create the API helper")
+        return None  # the other workers never use it, their barrier is broken
+    monkeypatch.setattr(contention, '_helper', helper)
+
+    with pytest.raises(RuntimeError, match="could not create the API helper"):
+        contention.fire()
@@ -0,0 +1,52 @@
+"""Tests for the query fingerprinting and N+1 detection used by DBUtility.
+
+These tests do not need a database; they exercise DBMetrics directly.
+"""
+import pytest
+from demostore_automation.src.utilities.dbMetricsUtility import DBMetrics, fingerprint_sql, estimate_rows_size
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        pytest.param("SELECT * FROM demostore.wp_posts WHERE post_type = 'product' AND ID = 34;",
+                     "SELECT * FROM demostore.wp_posts WHERE post_type = ? AND ID = ?", id="literals"),
+        pytest.param("""SELECT * FROM demostore.wp_postmeta
+                     WHERE post_id = 12 AND meta_key IN ('_regular_price', '_sale_price', '_price');""",
+                     "SELECT * FROM demostore.wp_postmeta WHERE post_id = ? AND meta_key IN (?+)", id="in_list"),
+        pytest.param("SELECT * FROM demostore.wp_comments WHERE comment_content = 'it''s a note';",
+                     "SELECT * FROM demostore.wp_comments WHERE comment_content = ?", id="escaped_quote"),
+    ]
+)
+def test_fingerprint_sql(sql, expected):
+    assert fingerprint_sql(sql) == expected, f"Wrong fingerprint. Expected: {expected}, Actual: {fingerprint_sql(sql)}"
+
+
+def test_estimate_rows_size():
+    rows = [{"ID": 1, "post_title": "Album"}, {"ID": 2, "post_title": "Hoodie"}]
+    assert estimate_rows_size(rows) == 8 + 5 + 8 + 6
+
+
+def test_n_plus_one_detection_and_ranking():
+    metrics = DBMetrics()
+    metrics.current_test = "tests/test_a.py::test_loop"
+    for product_id in range(6):
+        metrics.record(f"SELECT * FROM wp_posts WHERE ID = {product_id};", 0.002, 1, 100)
+    metrics.record("SELECT * FROM wp_users order by id desc LIMIT 1000;", 0.050, 1000, 90000)
+
+    metrics.current_test = "tests/test_a.py::test_single"
+    metrics.record("SELECT * FROM wp_posts WHERE ID = 99;", 0.002, 1, 100)
+
+    assert metrics.check_n_plus_one("tests/test_a.py::test_single", threshold=5) == []
+    flagged = metrics.check_n_plus_one("tests/test_a.py::test_loop", threshold=5)
+    assert flagged == [{"test": "tests/test_a.py::test_loop",
+                        "fingerprint": "SELECT * FROM wp_posts WHERE ID = ?", "count": 6}], f"Wrong N+1 flags: {flagged}"
+
+    summary = metrics.summary()
+    assert summary['total_queries'] == 8
+    assert summary['fingerprints'][0]['fingerprint'].startswith("SELECT * FROM wp_users"), \
+        "Fingerprints must be ranked by total time."
+    assert summary['fingerprints'][1]['calls'] == 7
+    assert summary['n_plus_one'][0]['count'] == 6
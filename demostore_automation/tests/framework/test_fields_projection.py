@@ -0,0 +1,30 @@
+"""Tests for '_fields' projection and the paginator of WooAPIUtility (no store needed)."""
+import pytest
+from demostore_automation.src.api_helpers.ProductsAPIHelper import ProductsAPIHelper
+from demostore_automation.src.utilities.wooAPIUtility import with_fields
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.fixture
+def products_helper(woo_env):
+    return ProductsAPIHelper()
+
+
+def test_with_fields_does_not_modify_params():
+    params = {"status": "publish"}
+    assert with_fields(params, ["id", "name"]) == {"status": "publish", "_fields": "id,name"}
+    assert params == {"status": "publish"}
+    assert with_fields(params, None) is params
+
+
+@pytest.mark.parametrize("send_total_pages", [True, False])
+def test_paginator_requests_only_needed_fields_and_pages(products_helper, paged_wcapi, send_total_pages):
+    catalog = [{"id": i, "name": f"product {i}", "description": "long"} for i in range(10)]
+    wcapi = products_helper.woo_api_utility.wcapi = paged_wcapi(catalog, send_total_pages=send_total_pages)
+    products = products_helper.call_get_all_products(per_page=5, fields=["id", "name"])
+    assert [p['id'] for p in products] == list(range(10))
+    assert all(set(p) == {"id", "name"} for p in products)
+    assert all(kwargs['params']['_fields'] == 'id,name' for _, _, kwargs in wcapi.requests)
+    # without the total pages header a full last page needs one more (empty) request
+    assert wcapi.calls == (2 if send_total_pages else 3)
@@ -0,0 +1,41 @@
+"""Tests for the test impact map and selection (no store needed)."""
+import pytest
+from demostore_automation.src.utilities.impactUtility import ImpactMap, ImpactRecorder, static_imports, rel_path
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_static_imports_are_transitive():
+    deps = {rel_path(p) for p in static_imports(__file__.replace('test_impact.py', 'test_coupon_contention.py'))}
+    assert 'src/load_testing/coupon_contention.py' in deps
+    # imported by coupon_contention -> generic_coupons_helper -> CouponAPIHelper -> wooAPIUtility
+    assert 'src/utilities/wooAPIUtility.py' in deps
+    assert 'src/pages/HomePage.py' not in deps
+
+
+def test_recorder_collects_executed_src_files():
+    from demostore_automation.src.load_testing.checkout_stress import find_throughput_ceiling
+    recorder = ImpactRecorder()
+    recorder.start()
+    find_throughput_ceiling([])
+    executed = recorder.stop()
+    assert executed == {'src/load_testing/checkout_stress.py'}, f"Unexpected: {executed}"
+
+
+def test_only_tests_with_changed_dependencies_are_impacted():
+    impact_map = ImpactMap()
+    impact_map.record_test("tests/framework/test_a.py::test_a", __file__, {'src/utilities/seedUtility.py'})
+    impact_map.update_files()
+    assert not impact_map.is_impacted("tests/framework/test_a.py::test_a")
+    assert impact_map.is_impacted("tests/framework/test_new.py::test_new")
+
+    impact_map.tests["tests/framework/test_a.py::test_a"]['src/utilities/seedUtility.py'] = 'outdated'
+    assert impact_map.is_impacted("tests/framework/test_a.py::test_a")
+
+
+def test_changed_unmapped_file_is_reported():
+    impact_map = ImpactMap()
+    impact_map.update_files()
+    assert impact_map.changed_unmapped_files() == []
+    impact_map.files['src/data/create_order_payload.json'] = 'outdated'
+    assert impact_map.changed_unmapped_files() == ['src/data/create_order_payload.json']
@@ -0,0 +1,41 @@
+"""Tests for the pluggable JSON decoder and lazy response parsing of WooAPIUtility (no store needed)."""
+import pytest
+from demostore_automation.src.utilities import jsonUtility
+from demostore_automation.src.utilities.jsonUtility import decode_response, get_decoder_name, select_decoder
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_decoder_selection():
+    assert get_decoder_name() == ('orjson' if jsonUtility.orjson else 'json')
+    select_decoder('json')
+    assert get_decoder_name() == 'json'
+    with pytest.raises(Exception, match="Unknown or not installed"):
+        select_decoder('simplejson')
+    select_decoder('auto')
+
+
+def test_decode_falls_back_to_requests_for_bom(fake_response):
+    rs = fake_response(200, content=b'\xef\xbb\xbf{"id": 7}')
+    assert decode_response(rs) == {"id": 7}
+    assert rs.decoded == 1
+    assert decode_response(fake_response(200, content=b'{"id": 7}')) == {"id": 7}
+
+
+def test_delete_without_parsing(woo_api, fake_wcapi, fake_response, monkeypatch):
+    decoded = []
+    monkeypatch.setitem(jsonUtility._decoder, 'loads', lambda content: decoded.append(content) or {"id": 7})
+    woo_api.wcapi = fake_wcapi([fake_response(200, content=b'{"id": 7}')])
+    assert woo_api.delete('orders/7', parse_response=False) is None
+    assert decoded == [], "Response was decoded although it was not used"
+    assert woo_api.rs_json == {"id": 7}
+    assert len(decoded) == 1
+    assert woo_api.rs_json == {"id": 7}
+    assert len(decoded) == 1, "Response was decoded twice"
+
+
+def test_status_error_shows_non_json_body(woo_api, fake_wcapi, fake_response):
+    woo_api.wcapi = fake_wcapi([fake_response(502, content=b'<html>Bad Gateway</html>')])
+    woo_api.retry_policies['DELETE'].max_attempts = 1
+    with pytest.raises(AssertionError, match="Bad Gateway"):
+        woo_api.delete('orders/7', parse_response=False)
@@ -0,0 +1,69 @@
+"""Tests for streaming JSON array parsing and WooAPIUtility.iter_get (no store needed)."""
+import json
+import pytest
+from demostore_automation.src.utilities import jsonStreamUtility
+from demostore_automation.src.utilities.jsonStreamUtility import iter_json_array
+from demostore_automation.src.api_helpers.OrdersAPIHelper import OrdersAPIHelper
+
+pytestmark = [pytest.mark.framework]
+
+ORDERS = [{"id": i, "total": "12.50", "billing": {"first_name": "Zoë"}, "line_items": [{"sku": "x"}] * 3}
+          for i in range(25)] + [7, 1.5, "text", None, True]
+
+
+def split(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 50, 100000])
+def test_items_are_parsed_across_chunk_boundaries(monkeypatch, chunk_size):
+    monkeypatch.setattr(jsonStreamUtility, 'ijson', None)
+    body = json.dumps(ORDERS, ensure_ascii=False, indent=1).encode()
+    assert list(iter_json_array(split(body, chunk_size))) == ORDERS
+
+
+def test_items_are_yielded_before_the_body_is_complete(monkeypatch):
+    monkeypatch.setattr(jsonStreamUtility, 'ijson', None)
+    read = []
+
+    def chunks():
+        for chunk in split(json.dumps(ORDERS).encode(), 64):
+            read.append(len(chunk))
+            yield chunk
+
+    first = next(iter_json_array(chunks()))
+    assert first == ORDERS[0]
+    assert sum(read) < len(json.dumps(ORDERS)) / 4, "The whole body was read before the first item"
+
+
+def test_invalid_bodies_raise(monkeypatch):
+    monkeypatch.setattr(jsonStreamUtility, 'ijson', None)
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        list(iter_json_array([b'{"code": "rest_forbidden"}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1}, {"id": ']))
+
+
+def test_iter_all_orders_streams_every_page(woo_env, paged_wcapi):
+    helper = OrdersAPIHelper()
+    orders = ORDERS[:25]
+    wcapi = helper.woo_api_utility.wcapi = paged_wcapi(orders)
+
+    projected = [{"id": order["id"], "total": order["total"]} for order in orders]
+    assert list(helper.iter_all_orders(params={"status": "processing"}, fields=["id", "total"], per_page=10)) == projected
+    assert [kwargs['params']['page'] for _, _, kwargs in wcapi.requests] == [1, 2, 3]
+    assert all(kwargs['stream'] and kwargs['params']['_fields'] == 'id,total'
+               and kwargs['params']['status'] == 'processing' for _, _, kwargs in wcapi.requests)
+    assert all(rs.closed for rs in wcapi.responses)
+
+
+def test_retried_streamed_response_is_closed(woo_env, paged_wcapi, fake_response):
+    helper = OrdersAPIHelper()
+    wcapi = helper.woo_api_utility.wcapi = paged_wcapi(ORDERS[:5])
+    unavailable = fake_response(503, [])
+    serve_page = wcapi.handler
+    wcapi.handler = lambda method, endpoint, **kwargs: (unavailable if not unavailable.closed
+                                                        else serve_page(method, endpoint, **kwargs))
+
+    assert list(helper.iter_all_orders(per_page=10)) == ORDERS[:5]
+    assert unavailable.closed, "The 503 response was retried without releasing its connection"
@@ -0,0 +1,43 @@
+"""Tests for the open-loop load engine using stub scenarios (no store needed)."""
+import time
+import pytest
+from demostore_automation.src.load_testing.load_engine import LoadEngine, LoadProfile, LoadScenario
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_profile_rate_ramps_up_holds_and_ramps_down():
+    profile = LoadProfile(target_rps=10, ramp_up=10, hold=20, ramp_down=10)
+    assert profile.duration == 40
+    assert profile.rate_at(5) == 5
+    assert profile.rate_at(15) == 10
+    assert profile.rate_at(35) == 5
+    assert profile.rate_at(40) == 0
+
+
+def test_fixed_pacing_arrival_count_matches_profile():
+    profile = LoadProfile(target_rps=10, ramp_up=10, hold=10, ramp_down=10, poisson=False)
+    arrivals = list(profile.arrival_times())
+    # 50 during ramp-up + 100 during hold + 50 during ramp-down
+    assert len(arrivals) == 200, f"Expected 200 arrivals. Actual: {len(arrivals)}"
+    assert arrivals == sorted(arrivals)
+
+
+def test_engine_runs_weighted_scenarios_and_counts_errors():
+    def ok():
+        time.sleep(0.001)
+
+    def fail():
+        raise AssertionError("Bad Status code. Expected 200, Actual status code: 503")
+
+    scenarios = [LoadScenario("ok", 3, ok), LoadScenario("fail", 1, fail)]
+    profile = LoadProfile(target_rps=200, ramp_up=0, hold=0.5, ramp_down=0, poisson=False)
+    summary = LoadEngine(scenarios, profile, concurrency=4, report_interval=0.2, seed=1).run()
+
+    assert summary['completed'] == summary['scheduled'] == 100, f"Wrong arrival count: {summary}"
+    ok_stats, fail_stats = summary['scenarios']['ok'], summary['scenarios']['fail']
+    assert ok_stats['calls'] + fail_stats['calls'] == 100
+    assert ok_stats['errors'] == 0
+    assert fail_stats['error_rate'] == 1.0
+    assert 'AssertionError' in fail_stats['error_samples'][0]
+    assert summary['timeline'], "Expected live progress snapshots."
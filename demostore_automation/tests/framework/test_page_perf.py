@@ -0,0 +1,58 @@
+"""Tests for the navigation timing collection used by SeleniumExtended.
+
+A stub driver returns canned Performance API data, so no browser is needed.
+"""
+import json
+import pytest
+from demostore_automation.src.selenium_extended.SeleniumExtended import SeleniumExtended
+from demostore_automation.src.utilities.pagePerfUtility import collect_page_performance, page_perf_store
+
+pytestmark = [pytest.mark.framework]
+
+
+class StubDriver:
+    current_url = "http://store.test/cart"
+
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_async_script(self, script):
+        return {
+            "navigation": {"responseStart": 180.4, "domContentLoadedEventEnd": 900.0,
+                           "loadEventEnd": 1200.0, "transferSize": 30000},
+            "resources": [{"name": "app.js", "transferSize": 5000}, {"name": "logo.png", "transferSize": 0}],
+            "lcp": 1050.0,
+            "cls": 0.01234,
+        }
+
+
+def test_collect_page_performance_derives_metrics():
+    record = collect_page_performance(StubDriver(), "cart")
+    assert record['page'] == "cart"
+    assert record['url'] == StubDriver.current_url
+    assert record['ttfb_ms'] == 180.4
+    assert record['lcp_ms'] == 1050.0
+    assert record['cls'] == 0.0123
+    assert record['transfer_bytes'] == 35000
+    assert record['request_count'] == 3
+
+
+def test_go_to_url_records_per_test(monkeypatch, tmp_path):
+    monkeypatch.setattr(page_perf_store, "enabled", True)
+    monkeypatch.setattr(page_perf_store, "current_test", "tests/test_x.py::test_perf")
+    monkeypatch.setattr(page_perf_store, "records", {})
+    driver = StubDriver()
+
+    SeleniumExtended(driver).go_to_url("http://store.test/cart", page_name="cart")
+
+    assert driver.visited == ["http://store.test/cart"]
+    records = page_perf_store.get_test_records("tests/test_x.py::test_perf", page_name="cart")
+    assert len(records) == 1, f"Expected 1 page performance record. Actual: {len(records)}"
+
+    results_file = tmp_path / "page_perf.jsonl"
+    assert page_perf_store.flush_test("tests/test_x.py::test_perf", str(results_file)) == 1
+    line = json.loads(results_file.read_text().splitlines()[0])
+    assert line['test'] == "tests/test_x.py::test_perf" and line['page'] == "cart"
@@ -0,0 +1,46 @@
+"""Tests for the cached payload templates and OrderPayloadBuilder (no store needed)."""
+import copy
+import pytest
+from demostore_automation.src.utilities.genericUtilities import fast_deepcopy
+from demostore_automation.src.utilities.payloadUtility import OrderPayloadBuilder, get_payload_template
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_fast_deepcopy_matches_deepcopy():
+    template = get_payload_template('create_order_payload.json')
+    copied = fast_deepcopy(template)
+    assert copied == copy.deepcopy(template)
+    copied['billing']['city'] = 'Austin'
+    copied['line_items'].append({"product_id": 1})
+    assert template['billing']['city'] == 'San Francisco'
+    assert len(template['line_items']) == 1
+
+
+def test_built_payloads_do_not_leak_into_the_template():
+    payload = OrderPayloadBuilder().with_product(12, quantity=3).with_customer(7).with_billing(city='Austin').build()
+    payload['line_items'][0]['quantity'] = 99
+    payload['billing']['email'] = 'changed@example.com'
+
+    fresh = OrderPayloadBuilder().build()
+    assert fresh['line_items'] == [{"product_id": 93, "quantity": 2}]
+    assert fresh['billing']['email'] == 'john.doe@example.com'
+    assert 'customer_id' not in fresh
+
+
+def test_builder_overrides():
+    payload = OrderPayloadBuilder().with_billing(city='Austin').with_billing(state='TX').with_free_shipping().build()
+    assert payload['billing']['city'] == 'Austin' and payload['billing']['state'] == 'TX'
+    assert payload['billing']['first_name'] == 'John'
+    assert payload['shipping_lines'][0]['method_id'] == 'free_shipping'
+    with pytest.raises(TypeError):
+        OrderPayloadBuilder().with_overrides([("customer_id", 1)])
+
+
+def test_build_many_shares_the_template():
+    payloads = OrderPayloadBuilder().with_customer(5).build_many(
+        {"line_items": [{"product_id": pid, "quantity": 1}]} for pid in range(1000))
+    assert len(payloads) == 1000
+    assert payloads[10]['line_items'][0]['product_id'] == 10
+    assert payloads[10]['customer_id'] == 5
+    assert payloads[0]['billing'] is payloads[999]['billing']
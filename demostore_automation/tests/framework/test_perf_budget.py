@@ -0,0 +1,67 @@
+"""Tests for the storefront performance budget and baseline checks."""
+import pytest
+from demostore_automation.src.utilities.perfBudgetUtility import (check_budget, compare_to_baseline, build_baseline,
+                                                                  evaluate_page_records, load_perf_budgets,
+                                                                  write_baseline, load_baseline)
+
+pytestmark = [pytest.mark.framework]
+
+BUDGETS = {
+    "baseline_tolerance_pct": 20,
+    "pages": {"checkout": {"max_ttfb_ms": 500, "max_lcp_ms": 2000, "max_transfer_bytes": 10000, "max_request_count": 10}}
+}
+
+
+def make_record(page="checkout", ttfb=400.0, lcp=1500.0, transfer_bytes=8000, request_count=8):
+    return {"page": page, "ttfb_ms": ttfb, "lcp_ms": lcp, "transfer_bytes": transfer_bytes,
+            "request_count": request_count}
+
+
+def test_default_budget_file_covers_key_pages():
+    budgets = load_perf_budgets()
+    for page in ('home', 'cart', 'checkout'):
+        assert page in budgets['pages'], f"Missing performance budget for page '{page}'"
+
+
+def test_check_budget_reports_each_exceeded_metric():
+    assert check_budget(make_record(), BUDGETS['pages']['checkout']) == []
+
+    violations = check_budget(make_record(ttfb=900.0, request_count=12), BUDGETS['pages']['checkout'])
+    assert len(violations) == 2, f"Expected TTFB and request count violations. Actual: {violations}"
+
+
+def test_check_budget_skips_unmeasured_metrics():
+    assert check_budget(make_record(lcp=None), BUDGETS['pages']['checkout']) == []
+
+
+def test_compare_to_baseline_uses_tolerance():
+    baseline = {"ttfb_ms": 300.0, "lcp_ms": 1500.0}
+    assert compare_to_baseline(make_record(ttfb=350.0), baseline, 20) == []
+    regressions = compare_to_baseline(make_record(ttfb=400.0), baseline, 20)
+    assert len(regressions) == 1 and 'ttfb_ms' in regressions[0], f"Expected a TTFB regression. Actual: {regressions}"
+
+
+def test_evaluate_page_records_only_checks_marked_pages():
+    records = [make_record(), make_record(page="home", ttfb=5000.0)]
+    violations, regressions = evaluate_page_records(records, ("checkout",), BUDGETS, {})
+    assert violations == [] and regressions == []
+
+    with pytest.raises(KeyError):
+        evaluate_page_records(records, ("unknown_page",), BUDGETS, {})
+
+
+def test_marked_page_without_records_is_a_violation():
+    violations, regressions = evaluate_page_records([make_record(page="home")], ("checkout",), BUDGETS, {})
+    assert len(violations) == 1 and "checkout: no page load was recorded" in violations[0], violations
+
+
+def test_baseline_round_trip(tmp_path):
+    baseline_file = str(tmp_path / "perf_baseline.json")
+    baseline = build_baseline([make_record(ttfb=300.0), make_record(ttfb=500.0), make_record(ttfb=400.0)])
+    assert baseline['checkout']['ttfb_ms'] == 400.0
+    assert baseline['checkout']['samples'] == 3
+
+    write_baseline(baseline, baseline_file)
+    write_baseline(build_baseline([make_record(page="home")]), baseline_file)
+    stored = load_baseline(baseline_file)
+    assert set(stored) == {'checkout', 'home'}, "Updating the baseline must keep pages that were not measured."
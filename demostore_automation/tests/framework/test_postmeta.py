@@ -0,0 +1,32 @@
+"""Tests for the pivoted post meta reader (no database needed)."""
+from decimal import Decimal
+import pytest
+from demostore_automation.src.dao.postmeta_dao import PostMetaDAO, to_number
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_to_number():
+    assert to_number('19.99') == Decimal('19.99')
+    assert to_number(' 20 ') == to_number('20.00') == 20
+    assert to_number('') is None and to_number(None) is None
+    with pytest.raises(ValueError, match="not numeric"):
+        to_number('free')
+
+
+def test_prices_are_pivoted_per_product_in_one_query(fake_db):
+    cursor = fake_db(("post_id", "_regular_price", "_sale_price", "_price"),
+                     [(34, "20", "18.5", "18.5"), (35, "9", "", "9")])
+    prices = PostMetaDAO().get_product_prices([34, 35, 36])
+    assert prices == {34: {"_regular_price": Decimal('20'), "_sale_price": Decimal('18.5'), "_price": Decimal('18.5')},
+                      35: {"_regular_price": Decimal('9'), "_sale_price": None, "_price": Decimal('9')}}
+    assert len(cursor.executed) == 1
+    sql = cursor.executed[0]
+    assert "MAX(CASE WHEN meta_key = '_sale_price' THEN meta_value END) AS `_sale_price`" in sql
+    assert "post_id IN (34, 35, 36)" in sql and "GROUP BY post_id" in sql
+
+
+def test_meta_keys_are_validated(fake_db):
+    fake_db(("post_id", "_price"), [])
+    with pytest.raises(ValueError, match="Invalid meta key"):
+        PostMetaDAO().get_meta([34], ["_price' OR '1'='1"])
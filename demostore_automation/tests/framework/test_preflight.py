@@ -0,0 +1,43 @@
+"""Tests for probe selection and the concurrent preflight run (no store needed)."""
+import time
+import pytest
+from demostore_automation.src.utilities import preflightUtility
+from demostore_automation.src.utilities.preflightUtility import (BACKEND_DIR, FRONTEND_DIR, TESTS_DIR,
+                                                                 format_preflight_failure, required_probes,
+                                                                 run_preflight)
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_required_probes_depend_on_test_paths(monkeypatch):
+    monkeypatch.setenv('BROWSER', 'headlesschrome')
+    assert required_probes([f"{BACKEND_DIR}/orders/test_create_order_smoke.py::test_x"]) == ['db', 'woo_api']
+    assert required_probes([f"{FRONTEND_DIR}/cart"]) == ['base_url']
+    assert required_probes([f"{TESTS_DIR}/framework/test_seed.py"]) == []
+    assert required_probes([TESTS_DIR]) == ['base_url', 'db', 'woo_api']
+    monkeypatch.setenv('BROWSER', 'remote_chrome')
+    assert required_probes([FRONTEND_DIR]) == ['base_url', 'grid']
+
+
+def test_probes_run_concurrently_and_are_cached(monkeypatch):
+    calls = []
+
+    def slow_ok(timeout):
+        calls.append(1)
+        time.sleep(0.2)
+        return "ok"
+
+    def failing(timeout):
+        raise Exception("Environment variable 'DB_PORT' must be set.")
+
+    monkeypatch.setattr(preflightUtility, 'PROBES', {"a": slow_ok, "b": slow_ok, "c": failing})
+    monkeypatch.setattr(preflightUtility, '_results_cache', {})
+
+    start = time.perf_counter()
+    results = run_preflight(["a", "b", "c"])
+    assert time.perf_counter() - start < 0.35, "Probes did not run concurrently"
+    assert [r['ok'] for r in results] == [True, True, False]
+    assert "DB_PORT" in format_preflight_failure(results)
+
+    run_preflight(["c", "b", "a"])
+    assert len(calls) == 2, "Preflight results were not cached"
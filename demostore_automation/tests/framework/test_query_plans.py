@@ -0,0 +1,42 @@
+"""Tests for the DAO query plan checker (no database needed)."""
+import inspect
+import pytest
+from demostore_automation.src.utilities.queryPlanUtility import DAO_QUERY_CALLS, collect_dao_queries, find_full_scans
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.fixture
+def db_settings(db_settings):
+    return {**db_settings, 'DB_DATABASE': 'shopdb', 'DB_TABLE_PREFIX': 'wpx_'}
+
+
+def test_find_full_scans():
+    plan = [{"table": "p", "type": "ref", "key": "type_status_date", "rows": 40},
+            {"table": "pm", "type": "ALL", "key": None, "rows": 52000},
+            {"table": "u", "type": "index", "key": "PRIMARY", "rows": 1000},
+            {"table": "c", "type": "index", "key": "PRIMARY", "rows": 90000},
+            {"table": "s", "type": "ALL", "key": None, "rows": 12}]
+    assert find_full_scans(plan) == [{"table": "pm", "type": "ALL", "key": None, "rows": 52000},
+                                     {"table": "c", "type": "index", "key": "PRIMARY", "rows": 90000}]
+    assert find_full_scans([{"table": None, "type": None, "key": None, "rows": None}]) == []
+
+
+def test_every_dao_query_method_is_checked():
+    checked = {(dao_cls, method_name) for dao_cls, method_name, args in DAO_QUERY_CALLS}
+    for dao_cls in {dao_cls for dao_cls, method_name, args in DAO_QUERY_CALLS}:
+        for method_name, _ in inspect.getmembers(dao_cls, inspect.isfunction):
+            if not method_name.startswith('_'):
+                assert (dao_cls, method_name) in checked, f"{dao_cls.__name__}.{method_name} is missing in DAO_QUERY_CALLS"
+
+
+def test_dao_queries_are_captured_without_a_database(db_env):
+    queries = collect_dao_queries()
+    assert len(queries) == len(DAO_QUERY_CALLS)
+    for name, sql in queries.items():
+        assert "demostore." not in sql and "wp_" not in sql.replace("wpx_", ""), f"{name} ignores the configured db: {sql}"
+
+    notes_sql = queries['OrdersDAO.get_order_notes']
+    assert "comment_post_ID = 1 AND comment_type = 'order_note'" in notes_sql
+    assert "FROM shopdb.wpx_posts p STRAIGHT_JOIN shopdb.wpx_postmeta pm" in queries['CouponsDAO.fetch_coupon_by_discount_type']
+    assert "ORDER BY ID DESC LIMIT 1000" in queries['CustomersDAO.get_random_customer_from_db']
@@ -0,0 +1,78 @@
+"""Tests for the token bucket, AIMD adaptation and cross-process sharing of the rate limiter (no store needed)."""
+import threading
+import time
+import pytest
+from demostore_automation.src.utilities.rateLimitUtility import (BucketState, RateLimiter, endpoint_group,
+                                                                 load_rate_limits)
+
+pytestmark = [pytest.mark.framework]
+
+LIMITS = {
+    "default": {"rate": 50, "burst": 5, "max_in_flight": 2},
+    "groups": {"orders": {"rate": 20, "burst": 1, "max_in_flight": 4}},
+    "min_rate": 1,
+    "decrease_factor": 0.5,
+    "increase_step": 2,
+    "increase_every": 3,
+}
+
+
+def test_endpoint_group():
+    assert endpoint_group('orders/12/notes') == 'orders'
+    assert endpoint_group('/products?per_page=1') == 'products'
+    assert set(load_rate_limits()['default']) == {'rate', 'burst', 'max_in_flight'}
+
+
+def test_token_bucket_limits_rate_after_burst():
+    limiter = RateLimiter(LIMITS)
+    start = time.perf_counter()
+    for _ in range(10):
+        with limiter.limit('products'):
+            pass
+    # 5 burst tokens, then 5 more at 50/s
+    assert 0.08 <= time.perf_counter() - start < 0.3
+
+
+def test_max_in_flight_is_enforced():
+    limiter = RateLimiter(dict(LIMITS, default={"rate": 1000, "burst": 1000, "max_in_flight": 2}))
+    in_flight, peak, lock = [0], [0], threading.Lock()
+
+    def call():
+        with limiter.limit('products'):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+
+
+def test_rate_backs_off_on_429_and_recovers():
+    limiter = RateLimiter(LIMITS)
+    limiter.record_status('orders', 429)
+    limiter.record_status('orders', 429)
+    assert limiter.current_rate('orders') == 5
+    for _ in range(3):
+        limiter.record_status('orders', 200)
+    assert limiter.current_rate('orders') == 7
+    for _ in range(30):
+        limiter.record_status('orders', 200)
+    assert limiter.current_rate('orders') == 20, "Rate grew beyond the configured limit"
+
+
+def test_file_state_is_shared_between_limiters(tmp_path):
+    state_file = str(tmp_path / 'rate_limits_state.json')
+    worker_1 = RateLimiter(LIMITS, BucketState(state_file), workers=2)
+    worker_2 = RateLimiter(LIMITS, BucketState(state_file), workers=2)
+
+    assert worker_1.try_acquire('orders') == 0
+    assert worker_2.try_acquire('orders') > 0, "Second worker got a token from its own bucket"
+    worker_2.record_status('orders', 429)
+    assert worker_1.current_rate('orders') == 10
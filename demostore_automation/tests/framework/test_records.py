@@ -0,0 +1,97 @@
+"""Tests for the slotted DAO record types and DBUtility.execute_select_records (no database needed)."""
+import sys
+import pytest
+from demostore_automation.src.dao.orders_dao import OrdersDAO
+from demostore_automation.src.dao.products_dao import ProductsDAO
+from demostore_automation.src.dao.records import (Customer, Order, OrderStats, PriceMeta, Product, ProductPriceMeta,
+                                                  Review)
+from demostore_automation.src.utilities import dbUtility
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_record_access_and_dict_compatibility():
+    product = Product(34, 'V-Neck T-Shirt', 'v-neck-t-shirt', 'publish')
+    assert product.ID == product['ID'] == 34
+    assert product.get('post_name') == 'v-neck-t-shirt' and product.get('post_content', 'n/a') == 'n/a'
+    assert product == {"ID": 34, "post_title": 'V-Neck T-Shirt', "post_name": 'v-neck-t-shirt', "post_status": 'publish'}
+    assert "post_title='V-Neck T-Shirt'" in repr(product)
+    with pytest.raises(KeyError):
+        product['post_tilte']
+    with pytest.raises(AttributeError):
+        product.post_content = 'not a column'
+    assert not hasattr(product, '__dict__')
+    assert sys.getsizeof(product) < sys.getsizeof(product.as_dict())
+
+
+def test_wrong_number_of_values_fails_at_construction():
+    with pytest.raises(TypeError, match="expects 2 values"):
+        PriceMeta('_price')
+
+
+def test_dao_query_selects_the_record_columns(fake_db):
+    cursor = fake_db(Product.__slots__, [(34, 'V-Neck T-Shirt', 'v-neck-t-shirt', 'publish')])
+    products = ProductsDAO().get_product_by_id(34)
+    assert products == [Product(34, 'V-Neck T-Shirt', 'v-neck-t-shirt', 'publish')]
+    assert f"SELECT {Product.columns()} FROM demostore.wp_posts" in cursor.executed[0]
+    assert cursor.connection.cursor_classes == [None], "Records must be built from the default tuple cursor"
+
+
+def test_column_mismatch_is_reported(fake_db):
+    fake_db(('ID', 'user_login', 'user_emial', 'user_pass', 'display_name', 'user_registered'), [])
+    with pytest.raises(Exception, match="do not match Customer columns"):
+        dbUtility.DBUtility().execute_select_records("SELECT ... FROM wp_users;", Customer)
+
+
+def test_id_chunks_dedupes_and_splits():
+    assert list(dbUtility.id_chunks([3, 1, 3, '2', 4, 5], chunk_size=2)) == ["3, 1", "2, 4", "5"]
+    assert list(dbUtility.id_chunks([])) == []
+    with pytest.raises(ValueError):
+        list(dbUtility.id_chunks(["1 OR 1=1"]))
+
+
+def test_batch_lookup_is_one_in_query_mapped_by_id(fake_db):
+    cursor = fake_db(Order.__slots__, [(101, 'wc-processing', '2024-01-01'), (103, 'wc-pending', '2024-01-02')])
+    orders = OrdersDAO().get_orders_by_ids([101, 102, 103, 101])
+    assert orders == {101: Order(101, 'wc-processing', '2024-01-01'), 103: Order(103, 'wc-pending', '2024-01-02')}
+    assert len(cursor.executed) == 1
+    assert "ID IN (101, 102, 103)" in cursor.executed[0]
+
+
+def test_batch_prices_group_rows_per_product(fake_db):
+    fake_db(ProductPriceMeta.__slots__, [(34, '_price', '20'), (34, '_regular_price', '20'), (35, '_price', '9')])
+    prices = ProductsDAO().get_product_prices_by_ids([34, 35, 36])
+    assert [row.meta_key for row in prices[34]] == ['_price', '_regular_price']
+    assert prices[35] == [ProductPriceMeta(35, '_price', '9')]
+    assert prices[36] == []
+
+
+def test_iter_select_fetches_batches_on_demand(fake_db):
+    rows = [(order_id, 'wc-completed', 1, 10.0, '2024-01-01') for order_id in range(1, 8)]
+    cursor = fake_db(OrderStats.__slots__, rows)
+    orders = OrdersDAO().iter_orders_by_status('completed', batch_size=3)
+
+    assert next(orders) == OrderStats(1, 'wc-completed', 1, 10.0, '2024-01-01')
+    assert cursor.fetches == 1, "Only the first batch may be fetched before the caller asks for more"
+    assert [order.order_id for order in orders] == [2, 3, 4, 5, 6, 7]
+    assert cursor.fetches == 4 and cursor.closed and cursor.connection.closed
+    assert cursor.connection.cursor_classes == [dbUtility.pymysql.cursors.SSCursor]
+    assert "WHERE status = 'wc-completed'" in cursor.executed[0]
+
+
+def test_iter_select_stopped_early_closes_connection_without_draining(fake_db):
+    rows = [(order_id, 'wc-completed', 1, 10.0, '2024-01-01') for order_id in range(1, 8)]
+    cursor = fake_db(OrderStats.__slots__, rows)
+    orders = OrdersDAO().iter_orders_by_status('completed', batch_size=3)
+    next(orders)
+    orders.close()
+    assert cursor.connection.closed and not cursor.closed
+    assert cursor.fetches == 1
+
+
+def test_iter_reviews_of_no_products_runs_no_query(fake_db):
+    cursor = fake_db(Review.__slots__, [(1, 34, '1', 0, 'a@b.com', 'Great')])
+    assert list(ProductsDAO().iter_reviews([])) == []
+    assert cursor.executed == []
+    assert [review.comment_post_ID for review in ProductsDAO().iter_reviews([34])] == [34]
+    assert "comment_post_ID IN (34)" in cursor.executed[0]
@@ -0,0 +1,120 @@
+"""Tests for the opt-in GET response cache and conditional GETs of WooAPIUtility (no store needed)."""
+import pytest
+from demostore_automation.src.utilities import responseCacheUtility
+from demostore_automation.src.utilities.responseCacheUtility import ResponseCache, response_cache, validator_store
+from demostore_automation.src.utilities import wooAPIClient
+from demostore_automation.src.utilities.wooAPIClient import WooAPIClient
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.fixture
+def woo_api(woo_api, fake_wcapi, fake_response):
+    def serve_product(method, endpoint, **kwargs):
+        body = {"id": 34, "name": "V-Neck T-Shirt", "endpoint": endpoint} if method == 'GET' else {}
+        return fake_response(200, body, {'X-WP-Total': '1'})
+    woo_api.wcapi = fake_wcapi(handler=serve_product)
+    return woo_api
+
+
+def sent(wcapi, method=None):
+    """Return the (method, endpoint) of the requests sent, only those of `method` if given."""
+    return [(m, endpoint) for m, endpoint, _ in wcapi.requests if method in (None, m)]
+
+
+def test_cached_get_is_sent_once_and_returns_copies(woo_api):
+    first = woo_api.get('products/34', cache=True)
+    first['name'] = 'modified by the test'
+    second = woo_api.get('products/34', cache=True)
+    assert second['name'] == 'V-Neck T-Shirt', "Cached response was modified through a returned copy"
+    assert woo_api.get('products/34', return_headers=True, cache=True)['headers']['X-WP-Total'] == '1'
+    assert sent(woo_api.wcapi) == [('GET', 'products/34')]
+    assert response_cache.stats()['hits'] == 2
+
+    woo_api.get('products/34')
+    assert woo_api.wcapi.calls == 2, "GET without cache=True was answered from the cache"
+
+
+def test_params_are_part_of_the_key(woo_api):
+    woo_api.get('products', params={"page": 1, "per_page": 100}, cache=True)
+    woo_api.get('products', params={"per_page": 100, "page": 1}, cache=True)
+    woo_api.get('products', params={"page": 2, "per_page": 100}, cache=True)
+    assert woo_api.wcapi.calls == 2
+
+
+def test_writes_invalidate_group_and_related_groups(woo_api):
+    woo_api.get('products/34', cache=True)
+    woo_api.get('coupons/7', cache=True)
+    woo_api.get('customers/2', cache=True)
+
+    woo_api.put('coupons/7', params={"amount": "5"})
+    woo_api.get('coupons/7', cache=True)
+    woo_api.post('orders', params={})
+    woo_api.get('products/34', cache=True)
+    woo_api.get('customers/2', cache=True)
+
+    gets = [endpoint for _, endpoint in sent(woo_api.wcapi, 'GET')]
+    assert gets == ['products/34', 'coupons/7', 'customers/2', 'coupons/7', 'products/34', 'customers/2']
+
+
+def test_ttl_and_lru_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(responseCacheUtility.time, 'monotonic', lambda: now[0])
+    cache = ResponseCache(ttl=10, max_entries=2)
+    cache.put('products/1', None, {"id": 1}, 'url', {})
+    cache.put('products/2', None, {"id": 2}, 'url', {})
+    assert cache.get('products/1', None)
+    cache.put('products/3', None, {"id": 3}, 'url', {})
+    assert cache.get('products/2', None) is None, "Least recently used entry was not evicted"
+    now[0] += 11
+    assert cache.get('products/1', None) is None, "Expired entry was returned"
+    assert cache.stats()['hit_rate'] == round(1 / 3, 3)
+
+
+class ConditionalOrder:
+    """Serves one order body with an ETag, or without validators if `etag` is None."""
+
+    def __init__(self, fake_response, etag):
+        self.fake_response = fake_response
+        self.etag = etag
+        self.body = {"id": 7, "status": "pending"}
+
+    def __call__(self, method, endpoint, headers=None, **kwargs):
+        if self.etag and (headers or {}).get('If-None-Match') == self.etag:
+            return self.fake_response(304, content=b'')
+        return self.fake_response(200, dict(self.body), {'ETag': self.etag} if self.etag else {})
+
+
+def test_conditional_get_serves_stored_body_on_304(woo_api, fake_wcapi, fake_response):
+    order = ConditionalOrder(fake_response, etag='"abc"')
+    woo_api.wcapi = fake_wcapi(handler=order)
+    first = woo_api.get('orders/7', conditional=True)
+    second = woo_api.get('orders/7', conditional=True)
+    assert [kwargs.get('headers') or {} for _, _, kwargs in woo_api.wcapi.requests] == [{}, {'If-None-Match': '"abc"'}]
+    assert second is first and woo_api.status_code == 200
+    assert validator_store.stats() == {"requests": 2, "not_modified": 1, "unchanged": 0}
+
+    order.etag = '"def"'
+    order.body["status"] = "completed"
+    assert woo_api.get('orders/7', conditional=True)['status'] == 'completed'
+
+
+def test_unchanged_body_without_validators_is_not_parsed_again(woo_api, fake_wcapi, fake_response):
+    order = ConditionalOrder(fake_response, etag=None)
+    woo_api.wcapi = fake_wcapi(handler=order)
+    first = woo_api.get('orders/7', conditional=True)
+    assert woo_api.get('orders/7', conditional=True) is first
+    assert validator_store.stats()['unchanged'] == 1
+
+    order.body["status"] = "completed"
+    assert woo_api.get('orders/7', conditional=True)['status'] == 'completed'
+
+
+def test_client_merges_extra_headers(monkeypatch):
+    sent = {}
+    monkeypatch.setattr(wooAPIClient, 'request', lambda **kwargs: sent.update(kwargs))
+    client = WooAPIClient(url='https://store', consumer_key='ck_test', consumer_secret='cs_test', version='wc/v3')
+    client.get('orders/7', params={"_fields": "id"}, headers={'If-None-Match': '"abc"'})
+    assert sent['url'] == 'https://store/wp-json/wc/v3/orders/7'
+    assert sent['headers']['If-None-Match'] == '"abc"' and sent['headers']['accept'] == 'application/json'
+    assert sent['params'] == {"_fields": "id"}
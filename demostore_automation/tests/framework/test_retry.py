@@ -0,0 +1,70 @@
+"""Tests for the retry policies and circuit breaker of WooAPIUtility (no store needed)."""
+import pytest
+import requests
+from demostore_automation.src.utilities.retryUtility import (CircuitBreaker, CircuitOpenError, RetryPolicy,
+                                                             parse_retry_after, resilience_events,
+                                                             store_circuit_breaker)
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.fixture
+def woo_api_env():
+    return {'API_CIRCUIT_FAILURE_THRESHOLD': '3'}
+
+
+def test_get_retries_transient_failures(woo_api, fake_wcapi, fake_response):
+    woo_api.wcapi = fake_wcapi([requests.exceptions.ConnectionError(), fake_response(503), fake_response(200)])
+    woo_api.get('products', expected_status_code=200)
+    assert woo_api.wcapi.calls == 3
+    assert resilience_events.summary() == {'retry': 2}
+
+
+def test_post_is_not_retried_by_default(woo_api, fake_wcapi, fake_response):
+    woo_api.wcapi = fake_wcapi([fake_response(503), fake_response(201)])
+    with pytest.raises(AssertionError):
+        woo_api.post('orders', params={}, expected_status_code=201)
+    assert woo_api.wcapi.calls == 1
+
+
+def test_expected_error_status_is_not_retried(woo_api, fake_wcapi, fake_response):
+    woo_api.wcapi = fake_wcapi([fake_response(500)])
+    woo_api.get('products/0', expected_status_code=500)
+    assert woo_api.wcapi.calls == 1
+
+
+def test_circuit_opens_and_fails_fast(woo_api, fake_wcapi, fake_response):
+    woo_api.wcapi = fake_wcapi([fake_response(502)] * 3)
+    with pytest.raises(AssertionError):
+        woo_api.get('products', expected_status_code=200)
+    assert store_circuit_breaker.state == 'open'
+
+    with pytest.raises(CircuitOpenError):
+        woo_api.get('products', expected_status_code=200)
+    assert woo_api.wcapi.calls == 3, "Request was sent while the circuit was open"
+    assert resilience_events.summary()['circuit_open'] == 1
+
+
+def test_circuit_half_open_trial_closes_it():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure('GET', 'products', 503)
+    assert breaker.state == 'open'
+    breaker.before_call('GET', 'products')
+    assert breaker.state == 'half_open'
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call('GET', 'products')  # only one trial call at a time
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    resilience_events.reset()
+
+
+def test_backoff_is_jittered_bounded_and_honors_retry_after():
+    policy = RetryPolicy(max_attempts=5, backoff_base=0.5, backoff_max=4, seed=1)
+    delays = [policy.delay(attempt) for attempt in range(1, 5) for _ in range(50)]
+    assert all(0 <= d <= 4 for d in delays)
+    assert len(set(delays)) > 1, "Backoff is not jittered"
+    assert policy.delay(1, retry_after='3') >= 3
+    assert policy.delay(1, retry_after='120') == 4
+    assert parse_retry_after('not a date') is None
+    assert not policy.should_retry(5, 503)
+    assert not policy.should_retry(1, 404)
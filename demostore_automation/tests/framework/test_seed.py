@@ -0,0 +1,51 @@
+"""Tests for the global seed controller (no store needed)."""
+import random
+import pytest
+from demostore_automation.src.utilities import seedUtility
+from demostore_automation.src.utilities.genericUtilities import (generate_bulk_emails, generate_bulk_names,
+                                                                  generate_bulk_passwords,
+                                                                  generate_random_email_and_password,
+                                                                  generate_random_string)
+
+pytestmark = [pytest.mark.framework]
+
+
+@pytest.fixture
+def restore_seed():
+    seed = seedUtility.get_global_seed()
+    yield
+    seedUtility.configure_seed(seed)
+
+
+def test_env_seed_is_used(monkeypatch, restore_seed):
+    monkeypatch.setenv('TEST_SEED', '1234')
+    assert seedUtility.configure_seed() == 1234
+    assert seedUtility.configure_seed(99) == 99
+
+
+def test_per_test_seed_replays_the_same_data(restore_seed):
+    seedUtility.configure_seed(7)
+    test_seed = seedUtility.seed_for_test("tests/backend/test_a.py::test_x")
+    first = (generate_bulk_names(3), generate_bulk_passwords(3), random.sample(range(100), 5))
+
+    seedUtility.seed_for_test("tests/backend/test_b.py::test_y")  # another test in between
+    assert seedUtility.seed_for_test("tests/backend/test_a.py::test_x") == test_seed
+    assert (generate_bulk_names(3), generate_bulk_passwords(3), random.sample(range(100), 5)) == first
+
+
+def test_unique_values_are_not_replayed_by_the_seed(restore_seed):
+    seedUtility.configure_seed(7)
+    seedUtility.seed_for_test("tests/backend/test_a.py::test_x")
+    first = (generate_random_email_and_password()['email'], generate_random_string(), generate_bulk_emails(3))
+
+    seedUtility.seed_for_test("tests/backend/test_a.py::test_x")
+    second = (generate_random_email_and_password()['email'], generate_random_string(), generate_bulk_emails(3))
+    assert all(a != b for a, b in zip(first, second)), "A seeded replay would register the same emails again"
+    assert all(seedUtility.get_run_id() in email for email in first[2])
+
+
+def test_different_global_seeds_give_different_test_seeds(restore_seed):
+    seedUtility.configure_seed(1)
+    seed_1 = seedUtility.derive_seed("test_x")
+    seedUtility.configure_seed(2)
+    assert seedUtility.derive_seed("test_x") != seed_1
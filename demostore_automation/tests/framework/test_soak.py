@@ -0,0 +1,40 @@
+"""Tests for the soak resource sampler and slope evaluation (no store needed)."""
+import pytest
+from demostore_automation.src.utilities.soakUtility import (ResourceSampler, SessionCounter, count_open_sockets,
+                                                            get_rss_mb, slope_per_hour)
+
+pytestmark = [pytest.mark.framework]
+
+
+def test_slope_per_hour_of_linear_growth():
+    points = [(t, 100 + t / 60) for t in range(0, 600, 30)]  # +1 per minute
+    assert slope_per_hour(points) == pytest.approx(60)
+    assert slope_per_hour(points[:2]) is None
+    assert slope_per_hour([(0, None), (30, None), (60, None)]) is None
+
+
+def test_process_resources_are_sampled():
+    assert get_rss_mb() > 0
+    sockets = count_open_sockets()
+    assert sockets is None or sockets >= 0
+
+
+def test_evaluate_flags_growth_after_warmup():
+    sampler = ResourceSampler()
+    # big jump during warm-up only, then flat memory; sessions leak steadily
+    sampler.samples = [{"t_s": t, "rss_mb": 50 if t == 0 else 200, "open_sockets": 3, "db_connections": 0,
+                        "webdriver_sessions": t // 600, "api_latency_ms": 120, "iteration_ms": None}
+                       for t in range(0, 3601, 60)]
+    slopes, violations = sampler.evaluate({"rss_mb": 10, "webdriver_sessions": 1})
+
+    assert slopes['rss_mb'] == 0
+    assert slopes['iteration_ms'] is None
+    assert len(violations) == 1 and violations[0].startswith('webdriver_sessions'), f"Unexpected: {violations}"
+
+
+def test_session_counter():
+    counter = SessionCounter()
+    counter.increment()
+    counter.increment()
+    counter.decrement()
+    assert counter.value == 1
@@ -16,6 +16,7 @@ class TestFreeShippingBanner:
 
 
     @pytest.mark.tcid69
+    @pytest.mark.perf_budget('home', mode='warn')
     @pytest.mark.pioneertcid7
     def test_verify_free_shipping_banner_displayed_in_home_page(self):
         # go to home page
@@ -27,6 +28,7 @@ class TestFreeShippingBanner:
         NotificationBar(self.driver).verify_notification_bar_is_displayed()
 
     @pytest.mark.tcid70
+    @pytest.mark.perf_budget('cart', mode='warn')
     @pytest.mark.pioneertcid8
     def test_verify_free_shipping_banner_displayed_in_cart_page(self):
         # go to home page
@@ -36,6 +38,7 @@ class TestFreeShippingBanner:
         NotificationBar(self.driver).verify_notification_bar_is_displayed()
 
     @pytest.mark.tcid71
+    @pytest.mark.perf_budget('checkout', mode='warn')
     @pytest.mark.pioneertcid9
     def test_verify_free_shipping_banner_displayed_in_checkout_page(self):
         home_page = HomePage(self.driver)
@@ -134,7 +134,7 @@ class TestEndToEndCheckout:
 
         # teardown
         try:
-            OrdersAPIHelper().call_delete_order(order_id=order_number)
+            OrdersAPIHelper().call_delete_order(order_id=order_number, parse_response=False)
         except Exception as e:
             logger.error(f"ERROR. Could not delete order with id: {order_number}. Error message: {e}")
 
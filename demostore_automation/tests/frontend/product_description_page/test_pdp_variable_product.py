@@ -22,7 +22,8 @@ class TestProductDescriptionPageVariableProduct:
 
         # api get call for product info
         product_api_helper = ProductsAPIHelper()
-        product_info = product_api_helper.call_get_product_by_id(request.cls.product_id)
+        product_info = product_api_helper.call_get_product_by_id(request.cls.product_id, use_cache=True,
+                                                              fields=["id", "images"])
         images = product_info['images']
         request.cls.api_image_urls = [image.get('src') for image in images]
 